@@ -0,0 +1,66 @@
+"""
+Benchmarks of the hot paths of pyb2b, on synthetic replies.
+
+Usage::
+
+    pytest benchmarks
+    pytest benchmarks -k "not 50000" --benchmark-compare
+
+"""
+
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from pyb2b.main import B2B
+from pyb2b.mock import synthetic
+from pyb2b.mock.certificate import self_signed_pkcs12
+from pyb2b.parser import parse_reply
+
+SIZES = [10, 1_000, 10_000, 50_000]
+
+
+@functools.cache
+def flight_list_reply(n: int) -> bytes:
+    return synthetic.flight_list_reply(n, root="FlightListByAirspaceReply")
+
+
+@functools.cache
+def flight_plan_list_reply(n: int) -> bytes:
+    return synthetic.flight_plan_list_reply(n)
+
+
+@functools.cache
+def regulation_list_reply(n: int) -> bytes:
+    return synthetic.regulation_list_reply(n)
+
+
+def parsed(reply: bytes, records: tuple[str, ...]) -> Any:
+    ((_, content),) = parse_reply(reply, records).items()
+    return content
+
+
+@pytest.fixture(scope="session")
+def b2b(tmp_path_factory: pytest.TempPathFactory) -> B2B:
+    path: Path = tmp_path_factory.mktemp("benchmarks") / "benchmark.p12"
+    path.write_bytes(self_signed_pkcs12(b"benchmark"))
+    return B2B("PREOPS", "27.0.0", path, "benchmark")
+
+
+@pytest.fixture
+def serve(b2b: B2B) -> Callable[[bytes], B2B]:
+    """Serves the same reply to all requests, without any network."""
+
+    def serve(content: bytes) -> B2B:
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=content)
+        )
+        b2b._client = httpx.Client(transport=transport)
+        return b2b
+
+    return serve
@@ -0,0 +1,172 @@
+"""
+Count TLS handshakes per request against a local mock TLS server.
+
+The former implementation of ``B2B.post`` called ``httpx.post`` for each
+request, i.e. one TCP connection and one mutual TLS handshake per request.
+The pooled client keeps connections alive between requests.
+
+Usage::
+
+    python benchmarks/handshakes.py -n 200
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import ssl
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from socket import socket
+from typing import Any
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.serialization import pkcs12
+
+from pyb2b.mock import self_signed_pkcs12
+
+REPLY = b"""<?xml version="1.0" encoding="UTF-8"?>
+<fl:FlightRetrievalReply xmlns:fl="eurocontrol/cfmu/b2b/FlightServices">
+<requestReceptionTime>2024-01-01 00:00:00</requestReceptionTime>
+<requestId>B2B_CUR:0</requestId>
+<sendTime>2024-01-01 00:00:00</sendTime>
+<status>OK</status>
+<data><flight><flightId><id>AA00000000</id></flightId></flight></data>
+</fl:FlightRetrievalReply>"""
+
+
+def load(p12: bytes, password: bytes) -> tuple[bytes, bytes]:
+    """The PEM-encoded key and certificate of a PKCS#12 certificate."""
+    key, cert, _ = pkcs12.load_key_and_certificates(p12, password)
+    assert key is not None and cert is not None
+    key_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.TraditionalOpenSSL,
+        serialization.NoEncryption(),
+    )
+    return key_pem, cert.public_bytes(serialization.Encoding.PEM)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/xml")
+        self.send_header("Content-Length", str(len(REPLY)))
+        self.end_headers()
+        self.wfile.write(REPLY)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class TLSServer(ThreadingHTTPServer):
+    daemon_threads = True
+    handshakes = 0
+
+    def __init__(self, context: ssl.SSLContext) -> None:
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.context = context
+        self.lock = threading.Lock()
+
+    def get_request(self) -> tuple[socket, Any]:
+        sock, addr = super().get_request()
+        tls_sock = self.context.wrap_socket(sock, server_side=True)
+        with self.lock:
+            self.handshakes += 1
+        return tls_sock, addr
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", dest="n", type=int, default=100)
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp())
+    server_key, server_cert = load(
+        self_signed_pkcs12(b"benchmark", "localhost"), b"benchmark"
+    )
+    client_p12 = self_signed_pkcs12(b"benchmark", "client")
+    _, client_cert = load(client_p12, b"benchmark")
+
+    (tmp / "server.pem").write_bytes(server_key + server_cert)
+    (tmp / "client.pem").write_bytes(client_cert)
+    (tmp / "client.p12").write_bytes(client_p12)
+
+    # mutual TLS: the server requires the client certificate
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(tmp / "server.pem")
+    server_context.verify_mode = ssl.CERT_REQUIRED
+    server_context.load_verify_locations(tmp / "client.pem")
+
+    server = TLSServer(server_context)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"https://127.0.0.1:{server.server_address[1]}/"
+
+    import httpx
+    import xmltodict
+
+    from pyb2b.main import B2B
+
+    # identical requests would otherwise be coalesced into one
+    b2b = B2B("PREOPS", "", tmp / "client.p12", "benchmark", coalesce=False)
+    b2b.mode = {"base_url": url, "post_url": url, "file_url": url}
+
+    request = {
+        "fl:FlightRetrievalRequest": {
+            "@xmlns:fl": "eurocontrol/cfmu/b2b/FlightServices",
+            "sendTime": "2024-01-01 00:00:00",
+        }
+    }
+
+    def report(label: str, start: float, handshakes: int) -> None:
+        duration = time.perf_counter() - start
+        print(
+            f"{label:<28} {handshakes / args.n:6.2f} handshakes/request "
+            f"{1000 * duration / args.n:8.3f} ms/request"
+        )
+
+    def per_call_post() -> None:
+        # the former implementation of B2B.post
+        res = httpx.post(
+            url=b2b.mode["post_url"],
+            content=xmltodict.unparse(request).encode(),  # type: ignore
+            headers={"Content-Type": "application/xml"},
+            verify=b2b.context,
+        )
+        res.raise_for_status()
+        xmltodict.parse(res.content)
+
+    server.handshakes, start = 0, time.perf_counter()
+    for _ in range(args.n):
+        per_call_post()
+    report("httpx.post (per call)", start, server.handshakes)
+
+    server.handshakes, start = 0, time.perf_counter()
+    with b2b:
+        for _ in range(args.n):
+            b2b.post(request)
+    report("B2B.post (pooled)", start, server.handshakes)
+
+    async def pooled_async() -> None:
+        async with b2b:
+            await asyncio.gather(
+                *(b2b.async_post(None, request) for _ in range(args.n))
+            )
+
+    server.handshakes, start = 0, time.perf_counter()
+    asyncio.run(pooled_async())
+    report("B2B.async_post (pooled)", start, server.handshakes)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Compare parse time and peak memory of the single-pass reply parser with the
+former xmltodict + ElementTree path, on synthetic flight list replies.
+
+Usage::
+
+    python benchmarks/parsing.py -n 100 1000 20000
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator
+from xml.etree import ElementTree
+
+import xmltodict
+
+from pyb2b.mock.synthetic import flight_list_reply
+from pyb2b.parser import parse_reply
+
+
+def chunked(content: bytes, size: int = 65536) -> Iterator[bytes]:
+    for i in range(0, len(content), size):
+        yield content[i : i + size]
+
+
+def former(content: bytes) -> Any:
+    # the former implementation: full content in memory, parsed twice
+    body = b"".join(chunked(content))
+    tree = ElementTree.fromstring(body)
+    assert tree.find("status") is not None
+    return xmltodict.parse(body)
+
+
+def single_pass(content: bytes) -> Any:
+    return parse_reply(chunked(content), ("data", "flights"))
+
+
+def measure(fun: Callable[[bytes], Any], content: bytes) -> tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    fun(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    gc.collect()
+    start = time.perf_counter()
+    fun(content)
+    duration = time.perf_counter() - start
+
+    return duration, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", dest="n", type=int, nargs="+", default=[1000])
+    args = parser.parse_args()
+
+    for n in args.n:
+        content = flight_list_reply(n)
+        assert former(content) == single_pass(content) or n == 1
+        print(f"{n} flights ({len(content) / 2**20:.1f} MB)")
+        for label, fun in [("xmltodict", former), ("single pass", single_pass)]:
+            duration, peak = measure(fun, content)
+            print(f"  {label:<12} {duration:8.3f} s {peak:8.1f} MB peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyb2b.auth.pkcs12 import load_ssl_context
+from pyb2b.mock import self_signed_pkcs12
+
+PKCS12 = self_signed_pkcs12(b"secret")
+
+
+@pytest.mark.parametrize("in_memory", [True, False], ids=["memfd", "tmpfile"])
+def test_load_ssl_context(benchmark: BenchmarkFixture, in_memory: bool) -> None:
+    benchmark(load_ssl_context, PKCS12, b"secret", in_memory)
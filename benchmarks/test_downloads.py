@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyb2b.main import B2B
+from pyb2b.mock import MockGateway, self_signed_pkcs12
+
+# About 1 MB per file, served at 4 MB/s per connection
+FEATURES = 20_000
+BANDWIDTH = 4e6
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 6])
+def test_aixm_download(
+    benchmark: BenchmarkFixture, tmp_path: Path, concurrency: int
+) -> None:
+    pkcs12_filename = tmp_path / "benchmark.p12"
+    pkcs12_filename.write_bytes(self_signed_pkcs12(b"benchmark"))
+    outputs: list[Path] = []
+
+    async def download(b2b: B2B, output_dir: Path) -> None:
+        async with b2b:
+            await b2b.async_aixm_request(
+                None, "2401", output_dir, concurrency=concurrency
+            )
+
+    with MockGateway(
+        aixm_features=FEATURES, bandwidth=BANDWIDTH, latency=0.05
+    ) as gateway:
+        b2b = B2B(gateway.mode, "27.0.0", pkcs12_filename, "benchmark")
+
+        def setup() -> tuple[tuple[B2B, Path], dict[str, object]]:
+            # a new directory for each round: nothing downloaded yet
+            output_dir = tmp_path / f"round{len(outputs)}"
+            outputs.append(output_dir)
+            return (b2b, output_dir), {}
+
+        benchmark.pedantic(
+            lambda *args: asyncio.run(download(*args)),
+            setup=setup,
+            rounds=3,
+            warmup_rounds=1,  # the mock gateway generates the files
+        )
+        # each round (one only with --benchmark-disable) downloads all files
+        assert gateway.requests["File"] == len(outputs) * len(gateway.files)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+from conftest import (
+    SIZES,
+    flight_list_reply,
+    flight_plan_list_reply,
+    parsed,
+    regulation_list_reply,
+)
+from pytest_benchmark.fixture import BenchmarkFixture
+from rich.console import Console
+
+import pandas as pd
+from pyb2b.frames import to_timestamp
+from pyb2b.mock import synthetic
+from pyb2b.services.flight.management import (
+    FlightListByAirspace,
+    FlightPlanList,
+    FlightRetrieval,
+)
+from pyb2b.services.flow.measures.regulationlist import RegulationList
+
+# data is cached per instance: build a new instance for each round
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_flightplanlist_data(benchmark: BenchmarkFixture, n: int) -> None:
+    json = parsed(flight_plan_list_reply(n), ("data", "summaries"))
+    data = benchmark(lambda: FlightPlanList(json).data)
+    assert data.shape[0] == n
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_flightlist_data(benchmark: BenchmarkFixture, n: int) -> None:
+    json = parsed(flight_list_reply(n), ("data", "flights"))
+    data = benchmark(lambda: FlightListByAirspace(json).data)
+    assert data.shape[0] == n
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_regulationlist_data(benchmark: BenchmarkFixture, n: int) -> None:
+    records = ("data", "regulations", "item")
+    json = parsed(regulation_list_reply(n), records)
+    data = benchmark(lambda: RegulationList(json).data)
+    assert data.shape[0] == n
+
+
+def test_time_indicators(benchmark: BenchmarkFixture) -> None:
+    flight = next(synthetic.flights(1))
+    json = parsed(synthetic.flight_retrieval_reply(flight), ())
+    benchmark(FlightRetrieval(json).time_indicators)
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_rich_console(benchmark: BenchmarkFixture, n: int) -> None:
+    flights = FlightPlanList(
+        parsed(flight_plan_list_reply(n), ("data", "summaries"))
+    )
+    console = Console(file=io.StringIO(), width=120)
+    benchmark(console.print, flights)
+
+
+@pytest.mark.parametrize("parse", ["to_timestamp", "pd.Timestamp"])
+def test_format_time(benchmark: BenchmarkFixture, parse: str) -> None:
+    # formatting of flight lists in the TUI: a few formats per flight
+    json = parsed(flight_list_reply(1_000), ("data", "flights"))
+    times = [
+        entry["flight"]["flightId"]["keys"]["estimatedOffBlockTime"]
+        for entry in json["data"]["flights"]
+    ]
+
+    def format_times() -> list[str]:
+        if parse == "to_timestamp":
+            return [
+                f"{to_timestamp(t):%d %b %y} {to_timestamp(t):%H:%MZ}"
+                for t in times
+            ]
+        return [
+            f"{pd.Timestamp(t, tz='utc'):%d %b %y} "
+            f"{pd.Timestamp(t, tz='utc'):%H:%MZ}"
+            for t in times
+        ]
+
+    assert len(benchmark(format_times)) == len(times)
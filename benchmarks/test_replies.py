@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+from conftest import SIZES, flight_list_reply
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyb2b.main import B2B
+from pyb2b.mock import synthetic
+from pyb2b.parser import parse_reply
+
+records = ("data", "flights")
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_parse_reply(benchmark: BenchmarkFixture, n: int) -> None:
+    content = flight_list_reply(n)
+    chunks = [content[i : i + 65536] for i in range(0, len(content), 65536)]
+    benchmark(parse_reply, chunks, records)
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_post(
+    benchmark: BenchmarkFixture, serve: Callable[[bytes], B2B], n: int
+) -> None:
+    b2b = serve(flight_list_reply(n))
+    reply = benchmark(b2b.post, {"request": "benchmark"}, records)
+    flights = reply["fl:FlightListByAirspaceReply"]["data"]["flights"]
+    assert len(flights) == n
+
+
+def test_raise_xml_errors_ok(benchmark: BenchmarkFixture, b2b: B2B) -> None:
+    reply = parse_reply(flight_list_reply(10), records)
+    benchmark(b2b.raise_xml_errors, {"request": "benchmark"}, reply)
+
+
+def test_raise_xml_errors_invalid_input(
+    benchmark: BenchmarkFixture, b2b: B2B
+) -> None:
+    root = "fl:FlightListByAirspaceReply"
+    content = synthetic.header(root, "INVALID_INPUT")
+    content += "<inputValidationErrors><type>INVALID_VALUE</type>"
+    content += "<parameters><key>airspace</key><value>XXX</value>"
+    content += f"</parameters></inputValidationErrors></{root}>"
+    reply = parse_reply(content.encode())
+
+    def raise_xml_errors() -> None:
+        with pytest.raises(AttributeError):
+            b2b.raise_xml_errors({"request": "benchmark"}, reply)
+
+    benchmark(raise_xml_errors)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import Any
+
+import xmltodict
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import pandas as pd
+from pyb2b.main import B2B
+from pyb2b.services.flight.management.flightlistbyairspace import (
+    default_fields,
+)
+
+START = pd.Timestamp("2024-06-01 00:00", tz="utc")
+STOP = pd.Timestamp("2024-06-02 00:00", tz="utc")
+
+
+def request(b2b: B2B) -> Any:
+    return b2b._flightlistbyairspace_request(
+        "LFBBBDX", START, STOP, False, True, default_fields
+    )
+
+
+def test_flightlistbyairspace_request(
+    benchmark: BenchmarkFixture, b2b: B2B
+) -> None:
+    benchmark(request, b2b)
+
+
+def test_unparse(benchmark: BenchmarkFixture, b2b: B2B) -> None:
+    data = request(b2b)
+    result = benchmark(xmltodict.unparse, data)
+    assert result.startswith("<?xml")
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import tracemalloc
+from typing import Any, Callable
+
+import pytest
+from conftest import flight_list_reply, parsed
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyb2b.parser import parse_reply
+from pyb2b.services.flight.management import FlightListByAerodrome
+from pyb2b.services.flight.management.flightlistbyaerodrome import (
+    default_fields,
+)
+
+N = 10_000
+
+
+def flights() -> FlightListByAerodrome:
+    json = parsed(flight_list_reply(N), ("data", "flights"))
+    return FlightListByAerodrome(json, default_fields)
+
+
+def allocated(build: Callable[[], Any]) -> int:
+    """Memory (in bytes) held by the result of build."""
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def test_decode(benchmark: BenchmarkFixture) -> None:
+    reply = flights()
+    records = benchmark(reply.decode)
+    assert len(records) == N
+
+
+@pytest.mark.parametrize("mode", ["dict", "struct"])
+def test_memory(benchmark: BenchmarkFixture, mode: str) -> None:
+    raw = flight_list_reply(N)
+
+    def build() -> Any:
+        json = parse_reply(raw, ("data", "flights"))
+        if mode == "dict":
+            return json
+        return FlightListByAerodrome(
+            next(iter(json.values())),  # type: ignore
+            default_fields,
+        ).decode()
+
+    benchmark.extra_info["bytes"] = allocated(build)
+    benchmark.pedantic(build, rounds=1)
+
+
+@pytest.mark.parametrize("mode", ["dict", "struct"])
+def test_access(benchmark: BenchmarkFixture, mode: str) -> None:
+    reply = flights()
+    if mode == "dict":
+        records: list[Any] = [
+            entry["flight"] for entry in reply.json["data"]["flights"]
+        ]
+
+        def access() -> list[str]:
+            return [r["flightId"]["keys"]["aircraftId"] for r in records]
+    else:
+        records = reply.decode()
+
+        def access() -> list[str]:
+            return [r.flightId.keys.aircraftId for r in records]
+
+    assert len(benchmark(access)) == N
@@ -318,3 +318,24 @@ for package, elts in groupby(
     file_.write_text(content)
 
 # %%
+import sys
+
+# scripts/decoders.py, as this script runs from the root of the repository
+sys.path.insert(0, "scripts")
+from decoders import ClassSpec, emit, qualify
+
+classes = [
+    ClassSpec(
+        elt["package"],
+        elt["name"],
+        None
+        if elt["general"].startswith("TypedDict")
+        else qualify(elt["general"], elt["package"]),
+        elt["attributes"],
+    )
+    for elt in items
+    if "attributes" in elt
+]
+(output / "decoders.py").write_text(emit(classes))
+
+# %%
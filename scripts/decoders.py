@@ -0,0 +1,253 @@
+# %%
+"""
+Generates decoders for the TypedDicts in src/pyb2b/types/generated.
+
+XML replies parsed into dictionaries cannot tell a single element from a
+list of one element: attributes with a multiplicity greater than one are
+either a dictionary or a list of dictionaries. The decoders emitted here
+normalize such attributes to lists (in place, down to all nested types),
+and list the time attributes of each type so that they are parsed in one
+vectorized pass when building DataFrames.
+
+The decoders neither build typed records nor parse timestamps: DataFrames
+are built column by column from the normalized dictionaries, where one
+vectorized conversion per time column is much faster than parsing each
+record, and typed records (pyb2b.types.structs) are only built on demand,
+for the requested fields. Eager conversions would do that work twice.
+
+This module is called by datamodel.py (from the NM UML model). Running it
+directly regenerates the decoders from the generated TypedDicts:
+
+    python scripts/decoders.py
+
+"""
+
+import ast
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+output = Path(".") / "src" / "pyb2b" / "types" / "generated"
+
+# Primitive types of the common package holding timestamps
+TIME_TYPES = {
+    "common.DateTimeMinute": "DATETIME_MINUTE",
+    "common.DateTimeSecond": "DATETIME_SECOND",
+}
+
+HEADER = '''# Generated by scripts/decoders.py, do not edit
+from typing import Any, Callable
+
+from ...frames import DATETIME_MINUTE, DATETIME_SECOND
+
+
+def _many(
+    value: dict[str, Any],
+    key: str,
+    decode: None | Callable[[Any], Any] = None,
+) -> None:
+    """Normalizes repeated elements to a list.
+
+    NM wraps some collections in <item> elements: the list is then found
+    under the "item" key.
+    """
+    if (v := value.get(key, None)) is None:
+        return
+    if isinstance(v, dict) and v.keys() == {"item"}:
+        value, key, v = v, "item", v["item"]
+        if v is None:
+            return
+    if not isinstance(v, list):
+        value[key] = v = [v]
+    if decode is not None:
+        for item in v:
+            decode(item)
+'''
+
+LINE_LENGTH = 80  # as configured for ruff in pyproject.toml
+
+MANY = re.compile(r"Union\[([\w.]+), list\[\1\]\]")
+
+
+@dataclass
+class ClassSpec:
+    package: str
+    name: str
+    general: None | str  # qualified, e.g. common.Reply
+    attributes: dict[str, str]  # attribute name -> type annotation
+
+    @property
+    def qualified(self) -> str:
+        return f"{self.package}.{self.name}"
+
+
+def qualify(name: str, package: str) -> str:
+    return name if "." in name else f"{package}.{name}"
+
+
+def function(qualified: str) -> str:
+    return "decode_" + qualified.replace(".", "_")
+
+
+def parse_type(annotation: str, package: str) -> tuple[str, bool]:
+    """Returns the qualified type name and whether it is repeated."""
+    if match := MANY.fullmatch(annotation):
+        return qualify(match.group(1), package), True
+    return qualify(annotation, package), False
+
+
+def literal(value: str) -> str:
+    """A string literal, quoted as by ruff format."""
+    return json.dumps(value)
+
+
+def call(function: str, *arguments: str, indent: str = "    ") -> list[str]:
+    """A function call, split over several lines as by ruff format."""
+    line = f"{indent}{function}({', '.join(arguments)})"
+    if len(line) <= LINE_LENGTH:
+        return [line]
+    inner = f"{indent}    {', '.join(arguments)}"
+    if len(inner) <= LINE_LENGTH:
+        return [f"{indent}{function}(", inner, f"{indent})"]
+    return [
+        f"{indent}{function}(",
+        *(f"{indent}    {argument}," for argument in arguments),
+        f"{indent})",
+    ]
+
+
+def emit(classes: list[ClassSpec]) -> str:
+    """The source of the decoders module, formatted as by ruff format.
+
+    Types are sorted by qualified name, so that the output does not depend
+    on the order of the classes in the model nor in the generated modules.
+    """
+    classes = sorted(classes, key=lambda spec: spec.qualified)
+    specs = {spec.qualified: spec for spec in classes}
+
+    def attributes(spec: ClassSpec) -> dict[str, tuple[str, bool]]:
+        return {
+            name: parse_type(annotation, spec.package)
+            for name, annotation in spec.attributes.items()
+        }
+
+    # Types with (nested) repeated attributes, computed as a fixed point
+    needs: set[str] = set()
+    changed = True
+    while changed:
+        changed = False
+        for spec in classes:
+            if spec.qualified in needs:
+                continue
+            if spec.general in needs or any(
+                many or type_ in needs
+                for type_, many in attributes(spec).values()
+            ):
+                needs.add(spec.qualified)
+                changed = True
+
+    code = [HEADER.rstrip("\n")]
+    for spec in classes:
+        if spec.qualified not in needs:
+            continue
+        code += [
+            "",
+            "",
+            f"def {function(spec.qualified)}(value: Any) -> Any:",
+            "    if not isinstance(value, dict):",
+            "        return value",
+        ]
+        if spec.general in needs:
+            code.append(f"    {function(spec.general)}(value)")
+        for name, (type_, many) in attributes(spec).items():
+            decode = function(type_) if type_ in needs else None
+            if many:
+                arguments = [literal(name), *([decode] if decode else [])]
+                code += call("_many", "value", *arguments)
+            elif decode:
+                get = call("value.get", literal(name), "None", indent="")
+                if len(f"    if (v := {get[0]}) is not None:") <= LINE_LENGTH:
+                    code.append(f"    if (v := {get[0]}) is not None:")
+                else:
+                    code += [
+                        "    if (",
+                        f"        v := {get[0]}",
+                        *(f"        {line}" for line in get[1:]),
+                        "    ) is not None:",
+                    ]
+                code.append(f"        {decode}(v)")
+        code.append("    return value")
+
+    code += ["", "", "# Time attributes of each type, and their format"]
+    code.append("time_fields: dict[str, dict[str, str]] = {")
+    for spec in classes:
+        times: dict[str, str] = {}
+        current: None | ClassSpec = spec
+        while current is not None:
+            for name, (type_, many) in attributes(current).items():
+                if type_ in TIME_TYPES and not many:
+                    times.setdefault(name, TIME_TYPES[type_])
+            current = specs.get(current.general or "", None)
+        if times:
+            code.append(f"    {literal(spec.qualified)}: {{")
+            code += [f"        {literal(k)}: {v}," for k, v in times.items()]
+            code.append("    },")
+    code += ["}", ""]
+    return "\n".join(code)
+
+
+def from_generated(path: Path = output) -> list[ClassSpec]:
+    """Reads back the class specifications from the generated modules."""
+    classes: list[ClassSpec] = []
+    for file_ in sorted(path.glob("*.py")):
+        package = file_.stem
+        if package in ("__init__", "decoders"):
+            continue
+        for node in ast.parse(file_.read_text()).body:
+            if isinstance(node, ast.ClassDef):
+                base = ast.unparse(node.bases[0])
+                classes.append(
+                    ClassSpec(
+                        package,
+                        node.name,
+                        None if base == "TypedDict" else qualify(base, package),
+                        {
+                            ast.unparse(stmt.target): ast.unparse(
+                                stmt.annotation
+                            )
+                            for stmt in node.body
+                            if isinstance(stmt, ast.AnnAssign)
+                        },
+                    )
+                )
+            elif (
+                isinstance(node, ast.Assign)
+                and isinstance(node.value, ast.Call)
+                and ast.unparse(node.value.func) == "TypedDict"
+            ):
+                name, fields = node.value.args
+                assert isinstance(name, ast.Constant)
+                assert isinstance(fields, ast.Dict)
+                classes.append(
+                    ClassSpec(
+                        package,
+                        name.value,
+                        None,
+                        {
+                            ast.literal_eval(k): ast.literal_eval(v)
+                            for k, v in zip(fields.keys, fields.values)
+                            if k is not None
+                        },
+                    )
+                )
+    return classes
+
+
+def generate(path: Path = output) -> str:
+    """The source of the decoders module for the generated TypedDicts."""
+    return emit(from_generated(path))
+
+
+if __name__ == "__main__":
+    (output / "decoders.py").write_text(generate())
@@ -2,49 +2,67 @@ from __future__ import annotations
 
 import configparser
 import os
+import threading
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal
 
-from appdirs import user_config_dir
-
-from .main import B2B
+if TYPE_CHECKING:
+    from .main import B2B
 
 __all__ = ["b2b"]
 
 b2b: B2B
 
-config_dir = Path(user_config_dir("b2b"))
-if xdg_config := os.getenv("XDG_CONFIG_HOME"):
-    config_dir = Path(xdg_config) / "b2b"
 
-config_file = config_dir / "b2b.conf"
+def _from_config() -> B2B:
+    from appdirs import user_config_dir
+
+    from .main import B2B
+
+    config_dir = Path(user_config_dir("b2b"))
+    if xdg_config := os.getenv("XDG_CONFIG_HOME"):
+        config_dir = Path(xdg_config) / "b2b"
 
-if not config_dir.exists():  # coverage: ignore
-    config_template = """
+    config_file = config_dir / "b2b.conf"
+
+    if not config_dir.exists():  # coverage: ignore
+        config_template = """
 [global]
 pkcs12_filename =
 pkcs12_password =
 # mode =  # pick one of PREOPS (default) or OPS
 # version =  # 27.0.0 (default)
     """
-    config_dir.mkdir(parents=True)
-    config_file.write_text(config_template)
-
-config = configparser.ConfigParser()
-config.read(config_file.as_posix())
-
-http_proxy = config.get("network", "http.proxy", fallback="<>")
-https_proxy = config.get("network", "https.proxy", fallback="<>")
-
-pkcs12_filename = config.get("global", "pkcs12_filename", fallback="")
-pkcs12_password = config.get("global", "pkcs12_password", fallback="")
-b2b_mode: Literal["OPS", "PREOPS"]
-b2b_mode = config.get("global", "mode", fallback="PREOPS")  # type: ignore
-if b2b_mode not in ["OPS", "PREOPS"]:
-    raise ImportError("mode must be one of OPS or PREOPS")
-b2b_version = config.get("global", "version", fallback="27.0.0")
-
-if pkcs12_filename != "" and pkcs12_password != "":
-    b2b = B2B(b2b_mode, b2b_version, pkcs12_filename, pkcs12_password)
-else:
-    raise ImportError(f"Provide credentials in {config_file}")
+        config_dir.mkdir(parents=True)
+        config_file.write_text(config_template)
+
+    config = configparser.ConfigParser()
+    config.read(config_file.as_posix())
+
+    pkcs12_filename = config.get("global", "pkcs12_filename", fallback="")
+    pkcs12_password = config.get("global", "pkcs12_password", fallback="")
+    b2b_mode: Literal["OPS", "PREOPS"]
+    b2b_mode = config.get("global", "mode", fallback="PREOPS")  # type: ignore
+    if b2b_mode not in ["OPS", "PREOPS"]:
+        raise ImportError("mode must be one of OPS or PREOPS")
+    b2b_version = config.get("global", "version", fallback="27.0.0")
+
+    if pkcs12_filename != "" and pkcs12_password != "":
+        return B2B(b2b_mode, b2b_version, pkcs12_filename, pkcs12_password)
+    else:
+        raise ImportError(f"Provide credentials in {config_file}")
+
+
+_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: the b2b instance is only created on first access, i.e. with
+    # `from pyb2b import b2b`, so that `import pyb2b.xxx` remains cheap and
+    # b2b is a genuine B2B instance (attributes may be set, isinstance works)
+    if name == "b2b":
+        with _lock:
+            if "b2b" not in globals():
+                globals()["b2b"] = _from_config()
+        return globals()["b2b"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,13 @@
+import hashlib
+import logging
 import os
+import threading
+import time
 import typing
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from pathlib import Path
 from ssl import PROTOCOL_TLS, SSLContext
 from tempfile import NamedTemporaryFile
 
@@ -11,6 +18,10 @@ from cryptography.hazmat.primitives.serialization.pkcs12 import (
 )
 from cryptography.x509.base import Certificate
 
+_log = logging.getLogger(__name__)
+
+PROC_FD = Path("/proc/self/fd")
+
 
 def check_cert(cert: typing.Optional[Certificate]) -> None:
     if not cert:
@@ -22,10 +33,73 @@ def check_cert(cert: typing.Optional[Certificate]) -> None:
         )
 
 
+# SSL contexts (and their client certificate) per digest of the PKCS#12 data
+# and password. Processes forked after the first call inherit the cache.
+_contexts: dict[tuple[bytes, bytes], tuple[SSLContext, Certificate]] = {}
+_contexts_lock = threading.Lock()
+
+
 def create_ssl_context(
     pkcs12_data: bytes,
     pkcs12_password_bytes: typing.Optional[bytes],
 ) -> SSLContext:
+    """Returns an SSL context authenticating with the client certificate.
+
+    Contexts are cached in-process: the same certificate and password always
+    return the same context, which may be shared by several clients.
+    """
+    key = (
+        hashlib.sha256(pkcs12_data).digest(),
+        hashlib.sha256(pkcs12_password_bytes or b"").digest(),
+    )
+    with _contexts_lock:
+        if (entry := _contexts.get(key, None)) is None:
+            entry = _contexts[key] = load_ssl_context(
+                pkcs12_data, pkcs12_password_bytes
+            )
+    ssl_context, cert = entry
+    check_cert(cert)  # the certificate may expire while in cache
+    return ssl_context
+
+
+@contextmanager
+def pem_file(data: bytes, in_memory: bool = True) -> Iterator[str]:
+    """Exposes PEM data as a path for :meth:`SSLContext.load_cert_chain`.
+
+    On Linux, the data is written to an anonymous memory-backed file
+    (``memfd_create``), reachable through ``/proc/self/fd``: the unencrypted
+    key never reaches the filesystem. Otherwise, a temporary file is used.
+    """
+    if in_memory and hasattr(os, "memfd_create") and PROC_FD.exists():
+        fd = os.memfd_create("pyb2b")  # close-on-exec by default
+        try:
+            with open(fd, "wb", closefd=False) as f:
+                f.write(data)
+            yield f"{PROC_FD}/{fd}"
+        finally:
+            os.close(fd)
+        return
+
+    with NamedTemporaryFile(delete=False) as c:
+        try:
+            c.write(data)
+            c.close()
+            yield c.name
+        finally:
+            os.remove(c.name)
+
+
+def load_ssl_context(
+    pkcs12_data: bytes,
+    pkcs12_password_bytes: typing.Optional[bytes],
+    in_memory: bool = True,
+) -> tuple[SSLContext, Certificate]:
+    """Parses the PKCS#12 data and loads the key material in a new context.
+
+    :param in_memory: load the key and certificate chain through a memory
+        backed file when available (see :func:`pem_file`)
+    """
+    start = time.perf_counter()
     (private_key, cert, ca_certs) = load_key_and_certificates(
         pkcs12_data, pkcs12_password_bytes
     )
@@ -34,29 +108,25 @@ def create_ssl_context(
     assert cert is not None
     check_cert(cert)
 
-    ssl_context = SSLContext(PROTOCOL_TLS)
-    with NamedTemporaryFile(delete=False) as c:
-        try:
-            private_bytes = private_key.private_bytes(
-                Encoding.PEM,
-                PrivateFormat.TraditionalOpenSSL,
-                serialization.NoEncryption(),
-            )
-            c.write(private_bytes)
-
-            public_bytes = cert.public_bytes(Encoding.PEM)
-            c.write(public_bytes)
-
-            if ca_certs:
-                for ca_cert in ca_certs:
-                    check_cert(ca_cert)
-                    ca_public_bytes = ca_cert.public_bytes(Encoding.PEM)
-                    c.write(ca_public_bytes)
+    pem = private_key.private_bytes(
+        Encoding.PEM,
+        PrivateFormat.TraditionalOpenSSL,
+        serialization.NoEncryption(),
+    )
+    pem += cert.public_bytes(Encoding.PEM)
+    for ca_cert in ca_certs or []:
+        check_cert(ca_cert)
+        pem += ca_cert.public_bytes(Encoding.PEM)
+    parsed = time.perf_counter()
 
-            c.flush()
-            c.close()
-            ssl_context.load_cert_chain(c.name, password=pkcs12_password_bytes)
-        finally:
-            os.remove(c.name)
+    ssl_context = SSLContext(PROTOCOL_TLS)
+    with pem_file(pem, in_memory) as path:
+        ssl_context.load_cert_chain(path, password=pkcs12_password_bytes)
+        loaded = time.perf_counter()
 
-    return ssl_context
+    _log.debug(
+        f"SSL context created in {1000 * (loaded - start):.1f}ms "
+        f"(PKCS#12: {1000 * (parsed - start):.1f}ms, "
+        f"load_cert_chain from {path}: {1000 * (loaded - parsed):.1f}ms)"
+    )
+    return ssl_context, cert
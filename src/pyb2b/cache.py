@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Mapping, Protocol
+
+from .types.generated.common import Reply
+
+_log = logging.getLogger(__name__)
+
+# Time to live (in seconds) of cached replies, per request. Other requests
+# are not cached.
+DEFAULT_TTL: Mapping[str, float] = {
+    "FlightListByAerodromeRequest": 60,
+    "RegulationListRequest": 60,
+}
+
+# Fields of the request which do not change the reply
+IGNORED_FIELDS = frozenset({"sendTime"})
+
+
+def request_name(data: Mapping[str, Any]) -> str:
+    """The name of the request, without namespace prefix."""
+    ((tag, _),) = data.items()
+    return tag.split(":")[-1]
+
+
+def request_key(data: Mapping[str, Any], *extra: Any) -> str:
+    """A digest of the request, ignoring fields such as ``sendTime``.
+
+    :param extra: other parameters to include in the key, e.g. the URL
+    """
+    ((tag, content),) = data.items()
+    content = {k: v for k, v in content.items() if k not in IGNORED_FIELDS}
+    normalized = json.dumps([tag, content, *extra], sort_keys=True, default=str)
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> None | Reply: ...
+
+    def set(self, key: str, reply: Reply, ttl: float) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+
+class MemoryBackend:
+    """In-memory LRU storage of replies.
+
+    Replies are copied when stored and returned: services modify them in
+    place when decoding them (e.g. :class:`FlightList`).
+
+    :param maxsize: the maximum number of replies kept in memory
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, Reply]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> None | Reply:
+        with self._lock:
+            if (entry := self._entries.get(key, None)) is None:
+                return None
+            expires, reply = entry
+            if expires < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(reply)
+
+    def set(self, key: str, reply: Reply, ttl: float) -> None:
+        reply = copy.deepcopy(reply)
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, reply)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteBackend:
+    """On-disk LRU storage of replies, shared between processes.
+
+    :param path: the database file, created if necessary
+    :param maxsize: the maximum number of replies kept in the database
+    """
+
+    def __init__(self, path: str | Path, maxsize: int = 4096) -> None:
+        self.path = Path(path)
+        self.maxsize = maxsize
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS replies ("
+            "key TEXT PRIMARY KEY, expires REAL, accessed REAL, reply TEXT)"
+        )
+
+    def get(self, key: str) -> None | Reply:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT expires, reply FROM replies WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] < now:
+                self._db.execute("DELETE FROM replies WHERE key = ?", (key,))
+                return None
+            self._db.execute(
+                "UPDATE replies SET accessed = ? WHERE key = ?", (now, key)
+            )
+        return json.loads(row[1])  # type: ignore
+
+    def set(self, key: str, reply: Reply, ttl: float) -> None:
+        now = time.time()
+        content = json.dumps(reply)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO replies VALUES (?, ?, ?, ?)",
+                (key, now + ttl, now, content),
+            )
+            self._db.execute(
+                "DELETE FROM replies WHERE expires < ? OR key IN ("
+                "SELECT key FROM replies ORDER BY accessed DESC "
+                "LIMIT -1 OFFSET ?)",
+                (now, self.maxsize),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM replies")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._db.execute(
+                "SELECT COUNT(*) FROM replies"
+            ).fetchone()
+        return int(count)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    shared: int = 0  # requests waiting for an identical request in flight
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """Caches the replies of idempotent requests for a limited time.
+
+    Requests are identified by their content (except the ``sendTime``
+    field), so that identical queries issued within the time to live of
+    the first reply are served locally. Synchronous requests issued from
+    several threads while an identical request is in flight wait for its
+    reply rather than sending a duplicate.
+
+    .. code:: python
+
+        cache = ResponseCache(SQLiteBackend("b2b.sqlite"))
+        b2b = B2B("PREOPS", "27.0.0", pkcs12_filename, password, cache=cache)
+
+    :param backend: the storage of replies, by default a
+        :class:`MemoryBackend`
+    :param ttl: time to live (in seconds) of replies, per request name
+        (e.g. ``"RegulationListRequest"``); other requests are not cached
+    """
+
+    def __init__(
+        self,
+        backend: None | CacheBackend = None,
+        ttl: None | Mapping[str, float] = None,
+    ) -> None:
+        self.backend: CacheBackend = (
+            backend if backend is not None else MemoryBackend()
+        )
+        self.ttl = dict(ttl if ttl is not None else DEFAULT_TTL)
+        self.stats = CacheStats()
+        self._pending: dict[str, Future[Reply]] = {}
+        self._waiting: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def lookup(
+        self, data: Mapping[str, Any], *extra: Any
+    ) -> tuple[None | str, None | Reply]:
+        """Returns the key of the request (None if not cached) and the
+        cached reply, if any."""
+        if self.ttl.get(request_name(data), 0) <= 0:
+            return None, None
+        key = request_key(data, *extra)
+        reply = self.backend.get(key)
+        with self._lock:
+            if reply is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return key, reply
+
+    def store(self, data: Mapping[str, Any], key: str, reply: Reply) -> None:
+        self.backend.set(key, reply, self.ttl[request_name(data)])
+
+    def fetch(
+        self,
+        data: Mapping[str, Any],
+        fun: Callable[[], Reply],
+        *extra: Any,
+    ) -> Reply:
+        """Returns the cached reply to the request, or calls fun."""
+        key, reply = self.lookup(data, *extra)
+        if key is None:
+            return fun()
+        if reply is not None:
+            return reply
+
+        with self._lock:
+            future = self._pending.get(key, None)
+            if owner := future is None:
+                future = self._pending[key] = Future()
+            else:
+                self.stats.shared += 1
+                self._waiting[key] += 1
+        assert future is not None
+        if not owner:
+            # each thread decodes (i.e. modifies) its own copy of the reply
+            return copy.deepcopy(future.result())
+
+        try:
+            reply = fun()
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+                self._waiting.pop(key, None)
+            future.set_exception(e)
+            raise
+        self.store(data, key, reply)
+        with self._lock:
+            del self._pending[key]
+            shared = self._waiting.pop(key, 0)
+        future.set_result(reply)
+        return copy.deepcopy(reply) if shared else reply
+
+    async def async_fetch(
+        self,
+        data: Mapping[str, Any],
+        fun: Callable[[], Awaitable[Reply]],
+        *extra: Any,
+    ) -> Reply:
+        """Returns the cached reply to the request, or awaits fun().
+
+        The backend is accessed in a thread, so that the event loop is not
+        blocked (e.g. by the SQLite database).
+        """
+        if self.ttl.get(request_name(data), 0) <= 0:
+            return await fun()
+        key, reply = await asyncio.to_thread(self.lookup, data, *extra)
+        assert key is not None
+        if reply is not None:
+            return reply
+        reply = await fun()
+        await asyncio.to_thread(self.store, data, key, reply)
+        return reply
+
+    def clear(self) -> None:
+        self.backend.clear()
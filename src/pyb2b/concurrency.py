@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Coroutine, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+def run_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Runs a coroutine to completion from synchronous code.
+
+    If an event loop is already running in the current thread (e.g. in a
+    Jupyter notebook), the coroutine runs in a new event loop in a separate
+    thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+class SingleFlight:
+    """Shares the result of identical calls running concurrently.
+
+    The first call with a given key runs; calls with the same key issued
+    (in the same event loop) before it completes await its result instead.
+    The shared call is shielded: it keeps running if one of the callers is
+    cancelled (its exception, if any, is dropped once no caller is left).
+
+    When a result is shared, each caller receives its own deep copy, so
+    that callers may modify it (e.g. decode replies in place).
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.collapsed = 0
+        # the shared call, and the number of its callers
+        self._tasks: dict[
+            tuple[asyncio.AbstractEventLoop, Hashable],
+            tuple[asyncio.Future[Any], list[int]],
+        ] = {}
+
+    async def run(self, key: Hashable, fun: Callable[[], Awaitable[T]]) -> T:
+        index = (asyncio.get_running_loop(), key)
+        if (entry := self._tasks.get(index, None)) is not None:
+            self.collapsed += 1
+            task, callers = entry
+            callers[0] += 1
+        else:
+            self.calls += 1
+            task, callers = asyncio.ensure_future(fun()), [1]
+            self._tasks[index] = task, callers
+
+            def done(_: asyncio.Future[Any]) -> None:
+                if self._tasks.get(index, (None,))[0] is task:
+                    del self._tasks[index]
+                # retrieved here as all callers may have been cancelled
+                if not task.cancelled():
+                    task.exception()
+
+            # registered first: no caller joins once the result is returned
+            task.add_done_callback(done)
+        result: T = await asyncio.shield(task)
+        return copy.deepcopy(result) if callers[0] > 1 else result
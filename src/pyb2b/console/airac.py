@@ -3,10 +3,6 @@ import asyncio
 import logging
 from pathlib import Path
 
-import httpx
-
-from pyb2b import b2b
-
 description = """
 Get data from Network Manager B2B Service.
 """
@@ -24,6 +20,33 @@ def main() -> None:
     )
 
     parser.add_argument("-a", dest="airac", default=None, help="AIRAC version")
+    parser.add_argument(
+        "-o",
+        dest="output_dir",
+        type=Path,
+        default=Path("."),
+        help="output directory",
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="update the AIRAC cycle (by default, the current one) in a "
+        "subdirectory of the output directory, only downloading the files "
+        "changed since the last run, e.g. in a cron job",
+    )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help="store the features of the dataset in an indexed database "
+        "(aixm.sqlite in the output directory)",
+    )
+    parser.add_argument(
+        "-j",
+        dest="concurrency",
+        type=int,
+        default=4,
+        help="number of files downloaded at the same time",
+    )
 
     args = parser.parse_args()
 
@@ -33,16 +56,35 @@ def main() -> None:
     elif args.verbose >= 2:
         logger.setLevel(logging.DEBUG)
 
-    if args.airac is not None:
+    airac, output_dir = args.airac, args.output_dir
+    if args.sync:
+        if airac is None:
+            from pitot.airac import airac_cycle
 
-        async def download_data() -> None:
-            async with httpx.AsyncClient(verify=b2b.context) as client:
-                await b2b.async_aixm_request(client, args.airac, Path("."))
+            import pandas as pd
 
-        asyncio.run(download_data())
-    else:
+            airac = airac_cycle(pd.Timestamp("now", tz="utc"))
+        output_dir = output_dir / airac
+    elif airac is None:
         raise RuntimeError("No action requested")
 
+    from pyb2b import b2b
+
+    async def download_data() -> list[Path]:
+        async with b2b:
+            return await b2b.async_aixm_request(
+                None, airac, output_dir, concurrency=args.concurrency
+            )
+
+    for path in asyncio.run(download_data()):
+        print(f"Updated: {path}")
+
+    if args.index:
+        from pyb2b.services.airspace.structure.aixm_store import AIXMStore
+
+        with AIXMStore(output_dir / "aixm.sqlite") as store:
+            store.add(output_dir.glob("*.zip"))
+
 
 if __name__ == "__main__":
     main()
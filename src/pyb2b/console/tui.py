@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import json
 import logging
+from datetime import datetime, timezone
 from typing import Union
 
-import httpx
 from rich.json import JSON
 from rich.text import Text
 from textual import on
@@ -26,6 +26,7 @@ from textual.widgets import (
 
 import pandas as pd
 from pyb2b import b2b
+from pyb2b.frames import to_timestamp
 from pyb2b.services.flight.management import (
     FlightListByAerodrome,
     FlightListByAirspace,
@@ -49,12 +50,15 @@ class Time:
         self.ts = timestamp
 
     def __format__(self, __format_spec: str) -> str:
-        if self.ts is None:
+        ts: datetime
+        if self.ts is None or self.ts == "":
             return ""
         if isinstance(self.ts, int):
-            ts = pd.Timestamp(self.ts, unit="s", tz="utc")
+            ts = datetime.fromtimestamp(self.ts, timezone.utc)
+        elif isinstance(self.ts, str):
+            ts = to_timestamp(self.ts)
         else:
-            ts = pd.Timestamp(self.ts, tz="utc")
+            ts = self.ts
         return format(ts, __format_spec)
 
 
@@ -227,7 +231,7 @@ class B2B(App[None]):
     ]
 
     def compose(self) -> ComposeResult:
-        self.client = httpx.AsyncClient(verify=b2b.context)
+        self.client = b2b.async_client
         yield Header()
         yield Footer()
         with TabbedContent():
@@ -405,8 +409,7 @@ class B2B(App[None]):
 
         fpl_data = flightlist.json
         s = fpl_data["data"]["flights"]
-        summaries: list[FlightOrFlightPlan] = s if isinstance(s, list) else [s]
-        summaries = sorted(summaries, key=eobt)
+        summaries: list[FlightOrFlightPlan] = sorted(s, key=eobt)  # type: ignore
 
         table.add_rows(
             (
@@ -449,8 +452,8 @@ class B2B(App[None]):
 
         fpl_data = flightplanlist.json
         s = fpl_data["data"]["summaries"]
-        summaries = s if isinstance(s, list) else [s]
-        summaries = sorted(summaries, key=eobt)
+        summaries: list[FlightPlanOrInvalidFiling]
+        summaries = sorted(s, key=eobt)  # type: ignore
 
         table.add_rows(
             (
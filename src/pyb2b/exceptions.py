@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+
+class ReplyError(RuntimeError):
+    """Raised when the B2B gateway replies with a status other than OK.
+
+    :param status: the status of the reply, e.g. ``TOO_MANY_RESULTS`` or
+        ``OBJECT_NOT_FOUND`` (see :data:`ReplyStatus`)
+    """
+
+    def __init__(self, message: str, status: None | str = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class DownloadError(RuntimeError):
+    """Raised when a downloaded file does not match its description, e.g.
+    its length differs from the ``fileLength`` announced by the gateway.
+    """
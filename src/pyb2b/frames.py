@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import functools
+import json
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    import pandas as pd
+
+
+DATETIME_MINUTE = "%Y-%m-%d %H:%M"
+DATETIME_SECOND = "%Y-%m-%d %H:%M:%S"
+
+Path = tuple[str, ...]
+
+
+def walk(value: Any, path: Path) -> Any:
+    try:
+        for key in path:
+            value = value[key]
+    except (KeyError, TypeError):
+        return None
+    return value
+
+
+def extract(
+    records: Iterable[Any],
+    paths: Mapping[str, Path],
+    defaults: None | Mapping[str, Any] = None,
+) -> dict[str, list[Any]]:
+    """Extracts values from nested records into per-column lists.
+
+    :param records: nested dictionaries, as found in B2B replies
+    :param paths: for each column, the sequence of keys to the value
+    :param defaults: values for missing entries (None otherwise)
+    """
+    records = list(records)
+    columns: dict[str, list[Any]] = {}
+    for name, path in paths.items():
+        if len(path) == 1:
+            key = path[0]
+            values = [record.get(key, None) for record in records]
+        else:
+            values = [walk(record, path) for record in records]
+        if defaults is not None and name in defaults:
+            default = defaults[name]
+            values = [default if v is None else v for v in values]
+        columns[name] = values
+    return columns
+
+
+def to_datetime(values: list[Any], format: str) -> pd.DatetimeIndex:
+    """Converts NM timestamps (UTC, fixed format) in one vectorized pass."""
+    import pandas as pd
+
+    try:
+        return pd.to_datetime(values, format=format, utc=True)
+    except ValueError:  # e.g. seconds in a DateTimeMinute field
+        return pd.to_datetime(values, format="ISO8601", utc=True)
+
+
+@functools.lru_cache(maxsize=4096)
+def to_timestamp(value: str) -> datetime:
+    """Parses one NM timestamp (``YYYY-MM-DD HH:MM[:SS]``, in UTC).
+
+    Use :func:`to_datetime` for many values: this function is meant for
+    formatting individual cells, e.g. in the TUI, where the same
+    timestamps occur many times.
+    """
+    timestamp = datetime.fromisoformat(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
+
+@functools.cache
+def _default_dtypes() -> tuple[Any, str]:
+    """The dtype of strings, and the unit of parsed timestamps, as inferred
+    by the installed version of pandas (e.g. object and ns for pandas 2)."""
+    import pandas as pd
+
+    timestamp = pd.to_datetime(["2024-01-01 00:00"], format=DATETIME_MINUTE)
+    return pd.Series(["x"]).dtype, timestamp.unit
+
+
+def to_frame(
+    columns: Mapping[str, list[Any]],
+    times: None | Mapping[str, str] = None,
+    categories: Iterable[str] = (),
+    numeric: Iterable[str] = (),
+) -> pd.DataFrame:
+    """Builds a DataFrame from per-column lists.
+
+    Column dtypes do not depend on the number of rows nor on missing
+    values, so that DataFrames (e.g. empty ones) can be concatenated
+    without upcasting: time columns are timestamps in UTC, categorical
+    columns have string categories, numeric columns are floats, and other
+    columns are strings, unless they hold nested values.
+
+    :param times: the format of time columns. All time columns sharing the
+        same format are converted at once.
+    :param categories: columns to convert to categorical dtype, e.g. ICAO
+        codes or states
+    :param numeric: columns to convert to numeric dtype
+    """
+    import pandas as pd
+
+    string, unit = _default_dtypes()
+    data: dict[str, Any] = dict(columns)
+    times = {k: v for k, v in (times or {}).items() if k in columns}
+
+    for format in set(times.values()):
+        names = [name for name in times if times[name] == format]
+        values = to_datetime(
+            [value for name in names for value in columns[name]], format
+        ).as_unit(unit)
+        size = len(values) // len(names)
+        for i, name in enumerate(names):
+            data[name] = values[i * size : (i + 1) * size]
+
+    categories = [name for name in categories if name in columns]
+    for name in categories:
+        data[name] = pd.Series(columns[name], dtype=string).astype("category")
+
+    numeric = [name for name in numeric if name in columns]
+    for name in numeric:
+        data[name] = pd.to_numeric(columns[name], errors="coerce").astype(float)
+
+    for name in columns.keys() - times.keys() - {*categories, *numeric}:
+        values = columns[name]
+        if all(value is None or isinstance(value, str) for value in values):
+            data[name] = pd.Series(values, dtype=string)
+
+    return pd.DataFrame(data)
+
+
+def to_table(frame: pd.DataFrame, metadata: Mapping[str, Any]) -> pa.Table:
+    """Converts a DataFrame built by :func:`to_frame` to an Arrow table.
+
+    Time, categorical and numeric columns keep their type (timestamps in
+    UTC, dictionary-encoded strings, numbers). Columns of nested values
+    (e.g. lists of structures) are stored as JSON-encoded strings.
+
+    :param metadata: JSON serializable information stored with the schema
+    """
+    import pyarrow as pa
+
+    import pandas as pd
+
+    encoded: list[str] = []
+    for name in frame.columns:
+        dtype = frame[name].dtype
+        if isinstance(dtype, pd.CategoricalDtype) and dtype.categories.empty:
+            # otherwise stored as floating point values in Parquet files
+            empty = pd.Index([], dtype=str)
+            frame = frame.assign(
+                **{name: frame[name].cat.set_categories(empty)}
+            )
+        if frame[name].dtype != object:
+            continue
+        values = frame[name]
+        if not all(v is None or isinstance(v, str) for v in values):
+            encoded.append(name)
+            frame = frame.assign(
+                **{name: [None if v is None else json.dumps(v) for v in values]}
+            )
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    info = {"json_columns": encoded, **metadata}
+    return table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), b"pyb2b": json.dumps(info)}
+    )
+
+
+def from_table(table: pa.Table) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """Converts an Arrow table written by :func:`to_table` to a DataFrame.
+
+    Returns the DataFrame and the metadata stored with the schema.
+    """
+    import pandas as pd
+
+    string, _ = _default_dtypes()
+    metadata = json.loads((table.schema.metadata or {}).get(b"pyb2b", "{}"))
+    frame = table.to_pandas()
+    for name, dtype in frame.dtypes.items():
+        # as built by to_frame
+        if isinstance(dtype, pd.CategoricalDtype) and dtype.categories.empty:
+            frame[name] = pd.Series([None] * len(frame), dtype=string).astype(
+                "category"
+            )
+    for name in metadata.pop("json_columns", []):
+        if name in frame.columns:
+            frame[name] = [
+                json.loads(v) if isinstance(v, str) else None
+                for v in frame[name]
+            ]
+    return frame, metadata
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Any, ClassVar, Literal, TypedDict
-from xml.dom import minidom
-from xml.etree import ElementTree
+from typing import Any, Awaitable, ClassVar, Iterator, Literal, TypedDict
 
 import httpx
 import xmltodict
 
-from .auth.pkcs12 import create_ssl_context
+from .cache import ResponseCache, request_key
+from .concurrency import SingleFlight, run_sync
+from .exceptions import ReplyError
+from .parser import ReplyParser, insert_records, parse_reply
+from .retry import RetryPolicy, TokenBucket, async_retry, retry
 from .services.airspace.structure.aixm_dataset import _AIXMDataset
 from .services.flight.management import (
     _FlightListByAerodrome,
@@ -31,6 +35,23 @@ class OperationMode(TypedDict):
 
 _log = logging.getLogger(__name__)
 
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=10,
+    max_keepalive_connections=10,
+    keepalive_expiry=60,
+)
+DEFAULT_TIMEOUT = httpx.Timeout(30, connect=10)
+
+# references to the tasks closing clients, until they complete
+_closing: set[Future[None]] = set()
+
+
+async def _close_on_cancel(client: httpx.AsyncClient) -> None:
+    try:
+        await asyncio.get_running_loop().create_future()
+    except asyncio.CancelledError:
+        await client.aclose()
+
 
 class B2B(
     _AIXMDataset,
@@ -49,7 +70,8 @@ class B2B(
         from pyb2b import b2b
 
     A path to your certificate and your password must be set in the
-    configuration file. An ImportError is raised if the information is not
+    configuration file. The instance is only created on first access to
+    ``pyb2b.b2b``; an ImportError is raised then if the information is not
     available.
 
     """
@@ -71,89 +93,333 @@ class B2B(
 
     def __init__(
         self,
-        mode: Literal["PREOPS", "OPS"],
+        mode: Literal["PREOPS", "OPS"] | OperationMode,
         version: str,
         pkcs12_filename: str | Path,
         pkcs12_password: str,
+        *,
+        http2: bool = False,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        timeout: None | float | httpx.Timeout = DEFAULT_TIMEOUT,
+        retry: None | RetryPolicy = None,
+        rate_limit: None | TokenBucket = None,
+        cache: None | ResponseCache = None,
+        coalesce: bool = True,
     ) -> None:
-        self.mode: OperationMode = getattr(self.__class__, mode)
+        """
+        :param mode: PREOPS or OPS, or the URLs of another gateway (e.g. a
+            :class:`~pyb2b.mock.MockGateway`)
+        :param http2: negotiate HTTP/2 with the gateway (requires the
+            ``h2`` package, available with ``httpx[http2]``)
+        :param limits: connection pool limits (maximum number of connections,
+            of keep-alive connections, keep-alive expiry)
+        :param timeout: timeout configuration for all requests
+        :param retry: retry policy for transient errors (e.g. overload or
+            quota exceeded), by default :class:`RetryPolicy` with default
+            parameters
+        :param rate_limit: throttle requests on the client side; the same
+            :class:`TokenBucket` may be shared by several instances
+        :param cache: serve identical idempotent requests from a
+            :class:`~pyb2b.cache.ResponseCache` (e.g. regulation lists
+            requested again within a few seconds)
+        :param coalesce: asynchronous requests identical to a request in
+            flight await its reply rather than being sent again; the number
+            of such requests is reported in ``single_flight.collapsed``
+
+        HTTP clients are created on first use and reused for all subsequent
+        requests, so that the mutual TLS handshake with the client certificate
+        is only performed once per pooled connection. Release them with
+        :meth:`close` (resp. :meth:`aclose`), or use the instance as a
+        (resp. asynchronous) context manager.
+
+        """
+        from .auth.pkcs12 import create_ssl_context
+
+        self.mode: OperationMode = (
+            getattr(self.__class__, mode) if isinstance(mode, str) else mode
+        )
         self.version = version
         self.context = create_ssl_context(
             Path(pkcs12_filename).read_bytes(),
             pkcs12_password.encode(),
         )
+        self.http2 = http2
+        self.limits = limits
+        self.timeout = timeout
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rate_limit = rate_limit
+        self.cache = cache
+        self.single_flight: None | SingleFlight = (
+            SingleFlight() if coalesce else None
+        )
+        self._client: None | httpx.Client = None
+        self._async_client: None | httpx.AsyncClient = None
+        # the event loop of the asynchronous client, and the task closing
+        # the client when the event loop completes
+        self._async_loop: None | asyncio.AbstractEventLoop = None
+        self._async_closer: None | asyncio.Task[None] = None
+
+    @property
+    def client(self) -> httpx.Client:
+        """The pooled HTTP client used by all synchronous methods."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.Client(
+                verify=self.context,
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout,
+            )
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """The pooled HTTP client used by all asynchronous methods.
+
+        It is used by default when no client is passed to the ``async_``
+        methods. The client is bound to the running event loop: another
+        client is created in another event loop (e.g. in successive calls
+        to :func:`asyncio.run`), and the client is closed when its event
+        loop completes.
+        """
+        try:
+            loop: None | asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        client = self._async_client
+        if (
+            client is None
+            or client.is_closed
+            or (loop is not None and self._async_loop not in (None, loop))
+        ):
+            self._close_async_client()
+            client = self._async_client = self.new_async_client()
+        if loop is not None and self._async_loop is None:
+            # asyncio.run() cancels pending tasks before closing the loop
+            self._async_loop = loop
+            self._async_closer = loop.create_task(_close_on_cancel(client))
+        return client
+
+    def new_async_client(self) -> httpx.AsyncClient:
+        """Returns a new asynchronous client configured as the pooled ones.
+
+        This is convenient to run asynchronous methods in a separate event
+        loop; the caller is responsible for closing the client.
+        """
+        return httpx.AsyncClient(
+            verify=self.context,
+            http2=self.http2,
+            limits=self.limits,
+            timeout=self.timeout,
+        )
+
+    def close(self) -> None:
+        """Close all pooled HTTP clients.
+
+        In a coroutine, prefer :meth:`aclose`: the asynchronous client is
+        then only closed once the coroutine yields to the event loop.
+        """
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        self._close_async_client()
+
+    async def aclose(self) -> None:
+        """Close all pooled HTTP clients."""
+        client, closer = self._async_client, self._async_closer
+        self._async_client = self._async_loop = self._async_closer = None
+        self.close()
+        if closer is not None:
+            closer.cancel()
+        if client is not None:
+            await client.aclose()
+
+    def _close_async_client(self) -> None:
+        client, loop = self._async_client, self._async_loop
+        closer = self._async_closer
+        self._async_client = self._async_loop = self._async_closer = None
+        if closer is not None:
+            closer.cancel()
+        if client is None or client.is_closed:
+            return
+        if loop is None:  # not used in an event loop yet
+            run_sync(client.aclose())
+        elif loop.is_closed():
+            # connections can only be closed in their event loop
+            _log.warning("The event loop of the HTTP client is closed")
+        elif loop.is_running():  # e.g. close() called in a coroutine
+            future = asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            _closing.add(future)
+            future.add_done_callback(_closing.discard)
+        else:
+            loop.run_until_complete(client.aclose())
+
+    def __enter__(self) -> B2B:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> B2B:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
 
     def raise_xml_errors(
-        self, data: dict[str, Any], res: httpx.Response
+        self, data: dict[str, Any], reply: dict[str, Any]
     ) -> None:
-        print("Request", xmltodict.unparse(data))
-        try:
-            tree = ElementTree.fromstring(res.content)
-        except ElementTree.ParseError:
-            print(res.content)
-            raise RuntimeError()
+        ((tag, content),) = reply.items()
+        status = content.get("status", None) if content else None
+        if status == "OK":
+            return
 
-        if tree is None:
-            raise RuntimeError("Unexpected error")
-        status = tree.find("status")
-        assert status is not None
+        _log.warning(f"Request {xmltodict.unparse(data)}")
 
-        if status.text == "INVALID_INPUT":
+        if status == "INVALID_INPUT":
             errors: list[str] = []
-            for error in tree.findall("inputValidationErrors"):
-                rough_string = ElementTree.tostring(error)
-                errors_dict: Reply = xmltodict.parse(rough_string)
-                invalid = errors_dict["inputValidationErrors"]
-                if isinstance(invalid, list):
-                    invalid = invalid[0]
-                _type = invalid["type"]
-                try:
-                    if invalid.get("parameters", None) is not None:
-                        parameters = invalid["parameters"]
-                except Exception:
-                    errors.clear()
-                    break
-                errors.append(f"{_type} {json.dumps(parameters, indent=2)}")
+            invalid = content.get("inputValidationErrors", [])
+            for error in invalid if isinstance(invalid, list) else [invalid]:
+                parameters = error.get("parameters", None)
+                errors.append(
+                    f"{error.get('type')} {json.dumps(parameters, indent=2)}"
+                )
             if len(errors) > 0:
-                raise AttributeError(tree.tag + " " + "\n".join(errors))
+                raise AttributeError(tag + " " + "\n".join(errors))
 
-        if status.text != "OK":
-            reason = tree.find("reason")
-            reason = None
-            if reason is not None:
-                raise RuntimeError(f"{tree.tag} {status.text}: {reason.text}")
+        if reason := content.get("reason", None) if content else None:
+            raise ReplyError(f"{tag} {status}: {reason}", status)
 
-            # otherwise
-            rough_string = ElementTree.tostring(tree)
-            reparsed = minidom.parseString(rough_string)
-            raise RuntimeError(reparsed.toprettyxml(indent="  "))
+        # otherwise
+        raise ReplyError(json.dumps(reply, indent=2), status)
 
-    def post(self, data: dict[str, Any]) -> Reply:
-        # TODO some pretty printing?
+    def post(
+        self,
+        data: dict[str, Any],
+        records: tuple[str, ...] = (),
+    ) -> Reply:
+        """Sends a request and parses the reply in a single pass.
+
+        :param data: the request, as expected by :func:`xmltodict.unparse`
+        :param records: path (below the root element) to repeated elements
+            in the reply, always gathered in a list (see :class:`ReplyParser`)
+
+        Transient errors are retried according to the retry policy.
+        """
+        if self.cache is None:
+            return retry(
+                lambda: self._post(data, records), self.retry, self.rate_limit
+            )
+        return self.cache.fetch(
+            data,
+            lambda: retry(
+                lambda: self._post(data, records), self.retry, self.rate_limit
+            ),
+            self.mode["post_url"] + self.version,
+            records,
+        )
+
+    def _post(
+        self,
+        data: dict[str, Any],
+        records: tuple[str, ...] = (),
+    ) -> Reply:
         _log.debug(data)
-        _log.debug(xmltodict.unparse(data))
-        res = httpx.post(
+        with self.client.stream(
+            "POST",
             url=self.mode["post_url"] + self.version,
-            data=xmltodict.unparse(data).encode(),
+            content=xmltodict.unparse(data).encode(),
             headers={"Content-Type": "application/xml"},
-            verify=self.context,
-        )
-        res.raise_for_status()
-        self.raise_xml_errors(data, res)
-        return xmltodict.parse(res.content)  # type: ignore
+        ) as res:
+            res.raise_for_status()
+            reply = parse_reply(res.iter_bytes(), records)
+        self.raise_xml_errors(data, reply)
+        return reply  # type: ignore
+
+    def iter_post(
+        self,
+        data: dict[str, Any],
+        records: tuple[str, ...],
+    ) -> Iterator[dict[str, Any]]:
+        """Sends a request and yields records as soon as they are parsed.
+
+        This is the most memory efficient way to process large replies, e.g.
+        flight lists with ``records=("data", "flights")``. Errors are raised
+        once the full reply is received, so they are not retried.
+        """
+        if self.rate_limit is not None:
+            self.rate_limit.acquire()
+        _log.debug(data)
+        parser = ReplyParser(records)
+        with self.client.stream(
+            "POST",
+            url=self.mode["post_url"] + self.version,
+            content=xmltodict.unparse(data).encode(),
+            headers={"Content-Type": "application/xml"},
+        ) as res:
+            res.raise_for_status()
+            for chunk in res.iter_bytes():
+                yield from parser.feed(chunk)
+        yield from parser.close()
+        assert parser.reply is not None
+        self.raise_xml_errors(data, parser.reply)
 
     async def async_post(
+        self,
+        client: None | httpx.AsyncClient,
+        data: dict[str, Any],
+        records: tuple[str, ...] = (),
+    ) -> Reply:
+        """Sends a request and parses the reply in a single pass.
+
+        Transient errors are retried according to the retry policy.
+        Concurrent identical requests are only sent once (see the
+        ``coalesce`` parameter).
+        """
+        if client is None:
+            client = self.async_client
+
+        def send() -> Awaitable[Reply]:
+            return async_retry(
+                lambda: self._async_post(client, data, records),
+                self.retry,
+                self.rate_limit,
+            )
+
+        def post() -> Awaitable[Reply]:
+            if self.single_flight is None:
+                return send()
+            key = request_key(
+                data, self.mode["post_url"] + self.version, records
+            )
+            return self.single_flight.run(key, send)
+
+        if self.cache is None:
+            return await post()
+        return await self.cache.async_fetch(
+            data, post, self.mode["post_url"] + self.version, records
+        )
+
+    async def _async_post(
         self,
         client: httpx.AsyncClient,
         data: dict[str, Any],
+        records: tuple[str, ...] = (),
     ) -> Reply:
-        request = httpx.Request(
+        _log.debug(data)
+        parser = ReplyParser(records)
+        collected: list[dict[str, Any]] = []
+        async with client.stream(
             "POST",
             url=self.mode["post_url"] + self.version,
-            data=xmltodict.unparse(data).encode(),
+            content=xmltodict.unparse(data).encode(),
             headers={"Content-Type": "application/xml"},
-        )
-        res = await client.send(request)
-        res.raise_for_status()
-        self.raise_xml_errors(data, res)
-        return xmltodict.parse(res.content)  # type: ignore
+        ) as res:
+            res.raise_for_status()
+            async for chunk in res.aiter_bytes():
+                collected.extend(parser.feed(chunk))
+        collected.extend(parser.close())
+        assert parser.reply is not None
+        if collected:
+            insert_records(parser.reply, records, collected)
+        self.raise_xml_errors(data, parser.reply)
+        return parser.reply  # type: ignore
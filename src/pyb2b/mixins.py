@@ -1,17 +1,25 @@
 from __future__ import annotations
 
-import json
+from abc import ABC, abstractmethod
 from numbers import Integral, Real
 from pathlib import Path
-from typing import Any, ClassVar, Generic, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Generic,
+    Type,
+    TypeVar,
+    cast,
+)
 
-from rich.box import SIMPLE_HEAVY
-from rich.console import Console, ConsoleOptions, RenderResult
-from rich.table import Table
+from .types.generated.common import Reply
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from rich.console import Console, ConsoleOptions, RenderResult
 
-from .types.generated.common import Reply
+    import pandas as pd
 
 D = TypeVar("D", bound="DataFrameMixin")
 J = TypeVar("J", bound="JSONMixin[Any]")
@@ -25,32 +33,174 @@ class JSONMixin(Generic[T]):
         self.json = json
 
     @classmethod
-    def from_file(cls: Type[J], filename: str | Path) -> J:
-        path = Path(filename)
-        return cls(json.loads(path.read_text()))
+    def from_file(
+        cls: Type[J],
+        filename: str | Path,
+        serializer: None | str = None,
+    ) -> J:
+        """Reads a reply written by :meth:`to_file`.
+
+        :param serializer: the name of the JSON library (see
+            :func:`~pyb2b.serialization.get_serializer`)
+        """
+        from .serialization import get_serializer, load, open_file
+
+        with open_file(Path(filename), "rb") as file:
+            return cls(load(file, get_serializer(serializer)))
+
+    def to_file(
+        self,
+        filename: None | str | Path = None,
+        serializer: None | str = None,
+    ) -> Path:
+        """Writes the reply as (compact) JSON, returns the file path.
+
+        The file is compressed with gzip (resp. zstd) if its name ends with
+        ``.gz`` (resp. ``.zst``); otherwise, the ``.json`` suffix is used.
+
+        :param serializer: the name of the JSON library, by default orjson
+            or msgspec if installed (see
+            :func:`~pyb2b.serialization.get_serializer`)
+        """
+        from .serialization import (
+            COMPRESSION_SUFFIXES,
+            dump,
+            get_serializer,
+            open_file,
+        )
 
-    def to_file(self, filename: None | str | Path = None) -> None:
         if filename is None:
             time, id_ = (
                 self.json["requestReceptionTime"],
                 self.json["requestId"],
             )
             filename = f"{time} {self.__class__.__name__} {id_}"
-        path = Path(filename).with_suffix(".json")
-        path.write_text(json.dumps(self.json, indent=2))
+        path = Path(filename)
+        if path.suffix not in COMPRESSION_SUFFIXES:
+            path = path.with_suffix(".json")
+        with open_file(path, "wb") as file:
+            dump(self.json, file, get_serializer(serializer))
+        return path
+
+
+def strip_records(json: Any, path: tuple[str, ...]) -> Any:
+    """A shallow copy of the reply, with an empty list of records."""
+    if not path:
+        return []
+    if not isinstance(json, dict) or path[0] not in json:
+        return json
+    return {**json, path[0]: strip_records(json[path[0]], path[1:])}
 
 
-class DataFrameMixin:
+class DataFrameMixin(ABC):
+    # box styles may be passed by name (see rich.box)
     table_options: ClassVar[dict[str, Any]] = dict(
-        show_lines=False, box=SIMPLE_HEAVY
+        show_lines=False, box="SIMPLE_HEAVY"
     )
     max_rows: int = 10
     columns_options: ClassVar[None | dict[str, dict[str, Any]]] = None
     _obfuscate: None | list[str] = None
+    _data_cache: None | tuple[Any, pd.DataFrame] = None
+    # path to the records in the reply, i.e. the rows of the DataFrame
+    records: ClassVar[tuple[str, ...]] = ()
 
     @property
     def data(self) -> pd.DataFrame:
-        ...
+        """The reply as a DataFrame.
+
+        The DataFrame is built once per instance and rebuilt only if the
+        ``json`` attribute is replaced (in-place edits are not detected).
+        """
+        json = getattr(self, "json", None)
+        cache = self._data_cache
+        if cache is None or cache[0] is not json:
+            cache = self._data_cache = (json, self._build_data())
+        return cache[1]
+
+    @abstractmethod
+    def _build_data(self) -> pd.DataFrame:
+        """Builds the DataFrame from the reply (see :attr:`data`)."""
+
+    def to_arrow(self, filename: str | Path, **kwargs: Any) -> None:
+        """Writes the DataFrame to an Arrow IPC (Feather) file.
+
+        The rest of the reply (without the records) is kept in the metadata
+        of the file. Additional arguments are passed to
+        :func:`pyarrow.feather.write_feather` (e.g. ``compression``).
+        Requires the ``pyarrow`` package.
+        """
+        from pyarrow import feather
+
+        feather.write_feather(self._to_table(), filename, **kwargs)
+
+    def to_parquet(self, filename: str | Path, **kwargs: Any) -> None:
+        """Writes the DataFrame to a Parquet file.
+
+        The rest of the reply (without the records) is kept in the metadata
+        of the file. Additional arguments are passed to
+        :func:`pyarrow.parquet.write_table` (e.g. ``compression``).
+        Requires the ``pyarrow`` package.
+        """
+        from pyarrow import parquet
+
+        parquet.write_table(self._to_table(), filename, **kwargs)
+
+    @classmethod
+    def from_arrow(
+        cls: Type[D],
+        filename: str | Path,
+        columns: None | list[str] = None,
+    ) -> D:
+        """Reads a file written by :meth:`to_arrow`.
+
+        :param columns: only read these columns
+        """
+        from pyarrow import feather
+
+        return cls._from_table(feather.read_table(filename, columns=columns))
+
+    @classmethod
+    def from_parquet(
+        cls: Type[D],
+        filename: str | Path,
+        columns: None | list[str] = None,
+    ) -> D:
+        """Reads a file written by :meth:`to_parquet`.
+
+        :param columns: only read these columns
+        """
+        from pyarrow import parquet
+
+        return cls._from_table(parquet.read_table(filename, columns=columns))
+
+    def _arguments(self) -> dict[str, Any]:
+        """Arguments of the constructor other than the reply, kept in the
+        metadata of Arrow and Parquet files (e.g. the requested fields)."""
+        return {}
+
+    def _to_table(self) -> pa.Table:
+        from .frames import to_table
+
+        json = strip_records(getattr(self, "json", None), self.records)
+        return to_table(
+            self.data,
+            {
+                "class": self.__class__.__name__,
+                "json": json,
+                "arguments": self._arguments(),
+            },
+        )
+
+    @classmethod
+    def _from_table(cls: Type[D], table: pa.Table) -> D:
+        from .frames import from_table
+
+        data, metadata = from_table(table)
+        instance: D = cast(Any, cls)(
+            metadata.get("json", None), **metadata.get("arguments", {})
+        )
+        instance._data_cache = (getattr(instance, "json", None), data)
+        return instance
 
     def _repr_html_(self) -> None | str:
         return self.data._repr_html_()  # type: ignore
@@ -60,7 +210,13 @@ class DataFrameMixin:
         _console: Console,
         _options: ConsoleOptions,
     ) -> RenderResult:
-        my_table = Table(**self.table_options)
+        from rich import box
+        from rich.table import Table
+
+        options = dict(self.table_options)
+        if isinstance(options.get("box", None), str):
+            options["box"] = getattr(box, options["box"])
+        my_table = Table(**options)
 
         if self.columns_options is None:
             self.columns_options = dict(  # type: ignore
@@ -0,0 +1,4 @@
+from .certificate import self_signed_pkcs12
+from .server import MockGateway
+
+__all__ = ["MockGateway", "self_signed_pkcs12"]
@@ -0,0 +1,59 @@
+"""
+Run a mock B2B gateway serving synthetic replies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from .server import MockGateway
+
+
+def error(value: str) -> tuple[str, float]:
+    status, probability = value.split("=")
+    return status, float(probability)
+
+
+async def serve(gateway: MockGateway) -> None:
+    async with gateway:
+        print(f"post_url: {gateway.mode['post_url']}")
+        print(f"file_url: {gateway.mode['file_url']}")
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--flights-per-hour", type=int, default=200)
+    parser.add_argument("--max-results", type=int, default=None)
+    parser.add_argument(
+        "--error",
+        type=error,
+        action="append",
+        default=[],
+        metavar="STATUS=PROBABILITY",
+        help="e.g. RESOURCE_OVERLOAD=0.1",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    gateway = MockGateway(
+        args.host,
+        args.port,
+        flights_per_hour=args.flights_per_hour,
+        latency=args.latency,
+        errors=dict(args.error),
+        max_results=args.max_results,
+    )
+    try:
+        asyncio.run(serve(gateway))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
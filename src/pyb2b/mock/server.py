@@ -0,0 +1,356 @@
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import logging
+import random
+import re
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+from xml.etree import ElementTree
+
+from . import synthetic
+
+if TYPE_CHECKING:
+    from ..main import OperationMode
+
+_log = logging.getLogger(__name__)
+
+POST_PATH = "/B2B_MOCK/gateway/spec/"
+FILE_PATH = "/FILE_MOCK/gateway/spec/"
+
+REASONS = {
+    200: "OK",
+    206: "Partial Content",
+    400: "Bad Request",
+    404: "Not Found",
+    416: "Range Not Satisfiable",
+}
+
+
+def _time(element: ElementTree.Element, path: str) -> datetime:
+    text = element.findtext(path, default="")
+    return datetime.fromisoformat(text).replace(tzinfo=timezone.utc)
+
+
+def _match(pattern: None | str, value: str) -> bool:
+    return pattern is None or fnmatch.fnmatchcase(value, pattern)
+
+
+class MockGateway:
+    """A local stand-in for the NM B2B gateway, serving synthetic replies.
+
+    The gateway runs a minimal HTTP/1.1 server (no TLS), either in the
+    current event loop (``async with``) or in a background thread (``with``).
+    Point a :class:`~pyb2b.main.B2B` instance to it with the :attr:`mode`
+    property:
+
+    .. code:: python
+
+        with MockGateway(latency=0.05) as gateway:
+            b2b = B2B(gateway.mode, "27.0.0", pkcs12_filename, password)
+            b2b.flightlistbyairspace("LFBBBDX", "2024-06-01", "2024-06-02")
+
+    :param flights_per_hour: the density of flights in flight lists
+    :param regulations: the number of regulations in regulation lists
+    :param aixm_features: the number of features in each AIXM file
+    :param latency: delay (in seconds) before each reply
+    :param bandwidth: the maximum throughput (in bytes per second) of each
+        connection, e.g. to simulate the download of large files
+    :param errors: probability of replying with a given error status, e.g.
+        ``{"RESOURCE_OVERLOAD": 0.1}``
+    :param max_results: reply TOO_MANY_RESULTS to flight lists with more
+        flights
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        flights_per_hour: int = 200,
+        regulations: int = 20,
+        aixm_features: int = 1000,
+        latency: float = 0,
+        bandwidth: None | float = None,
+        errors: None | Mapping[str, float] = None,
+        max_results: None | int = None,
+        seed: int = 42,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.flights_per_hour = flights_per_hour
+        self.regulations = regulations
+        self.aixm_features = aixm_features
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.errors = dict(errors or {})
+        self.max_results = max_results
+        self.seed = seed
+        self.requests: Counter[str] = Counter()
+        self.files: dict[str, bytes] = {}
+        self.release_times: dict[str, datetime] = {}
+        self.updates: Counter[str] = Counter()  # AIXM dataset, per AIRAC
+        self._random = random.Random(seed)
+        self._server: None | asyncio.Server = None
+        self._connections: dict[asyncio.StreamWriter, asyncio.Task[None]] = {}
+        self._loop: None | asyncio.AbstractEventLoop = None
+        self._thread: None | threading.Thread = None
+        self._handlers: dict[
+            str, Callable[[ElementTree.Element], tuple[str, bytes]]
+        ] = {
+            "FlightPlanListRequest": self._flightplanlist,
+            "FlightListByAerodromeRequest": self._flightlist,
+            "FlightListByAirspaceRequest": self._flightlist,
+            "FlightListByMeasureRequest": self._flightlist,
+            "FlightRetrievalRequest": self._flightretrieval,
+            "RegulationListRequest": self._regulationlist,
+            "CompleteAIXMDatasetRequest": self._aixm_dataset,
+        }
+
+    @property
+    def mode(self) -> OperationMode:
+        """The operation mode to pass to :class:`~pyb2b.main.B2B`."""
+        base_url = f"http://{self.host}:{self.port}/"
+        return {
+            "base_url": base_url,
+            "post_url": base_url + POST_PATH[1:],
+            "file_url": base_url + FILE_PATH[1:],
+        }
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._serve, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        _log.info(f"Mock B2B gateway listening on {self.mode['base_url']}")
+
+    async def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        for writer in self._connections:
+            writer.close()
+        await asyncio.gather(*self._connections.values())
+        await self._server.wait_closed()
+        self._server = None
+
+    async def __aenter__(self) -> MockGateway:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.stop()
+
+    def __enter__(self) -> MockGateway:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, daemon=True
+        )
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.start(), self._loop).result()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        assert self._loop is not None and self._thread is not None
+        asyncio.run_coroutine_threadsafe(self.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections[writer] = task
+        try:
+            while line := await reader.readline():
+                method, target, _ = line.decode().split(" ", 2)
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()).strip():
+                    key, value = line.decode().split(":", 1)
+                    headers[key.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length)
+
+                if self.latency > 0:
+                    await asyncio.sleep(self.latency)
+                status, content, extra = self.respond(
+                    method, target, body, headers
+                )
+
+                head = (
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    "Content-Type: application/xml\r\n"
+                    + "".join(f"{k}: {v}\r\n" for k, v in extra.items())
+                    + f"Content-Length: {len(content)}\r\n\r\n"
+                )
+                writer.write(head.encode())
+                await self._write(writer, content)
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._connections[writer]
+            writer.close()
+
+    async def _write(
+        self, writer: asyncio.StreamWriter, content: bytes
+    ) -> None:
+        if self.bandwidth is None:
+            writer.write(content)
+            await writer.drain()
+            return
+        chunk_size = 1 << 16
+        for i in range(0, len(content), chunk_size):
+            chunk = content[i : i + chunk_size]
+            writer.write(chunk)
+            await writer.drain()
+            await asyncio.sleep(len(chunk) / self.bandwidth)
+
+    def respond(
+        self,
+        method: str,
+        target: str,
+        body: bytes,
+        headers: None | Mapping[str, str] = None,
+    ) -> tuple[int, bytes, dict[str, str]]:
+        """Returns the HTTP status, content and extra headers of the reply
+        to a request."""
+        if method == "GET" and target.startswith(FILE_PATH):
+            return self._file(target[len(FILE_PATH) :], headers or {})
+
+        if method != "POST" or not target.startswith(POST_PATH):
+            return 404, b"", {}
+
+        try:
+            request = ElementTree.fromstring(body)
+        except ElementTree.ParseError as e:
+            return 400, str(e).encode(), {}
+        name = request.tag.split("}")[-1]
+        if (handler := self._handlers.get(name, None)) is None:
+            return 400, f"Unsupported request: {name}".encode(), {}
+        self.requests[name] += 1
+
+        root, content = handler(request)
+        for status, probability in self.errors.items():
+            if self._random.random() < probability:
+                error = synthetic.error_reply(root, status, "mock error")
+                return 200, error, {}
+        return 200, content, {}
+
+    def _file(
+        self, file_id: str, headers: Mapping[str, str]
+    ) -> tuple[int, bytes, dict[str, str]]:
+        self.requests["File"] += 1
+        if (content := self.files.get(file_id, None)) is None:
+            return 404, b"", {}
+        # only open-ended ranges (bytes=start-), as sent by the client
+        if match := re.fullmatch(r"bytes=(\d+)-", headers.get("range", "")):
+            self.requests["FileRange"] += 1
+            start = int(match.group(1))
+            if start >= len(content):
+                return 416, b"", {"Content-Range": f"bytes */{len(content)}"}
+            content_range = f"bytes {start}-{len(content) - 1}/{len(content)}"
+            return 206, content[start:], {"Content-Range": content_range}
+        return 200, content, {}
+
+    def _flights(
+        self, request: ElementTree.Element, window: str
+    ) -> list[dict[str, Any]]:
+        return list(
+            synthetic.flights_between(
+                _time(request, f"{window}/wef"),
+                _time(request, f"{window}/unt"),
+                self.flights_per_hour,
+                self.seed,
+            )
+        )
+
+    def _flightplanlist(
+        self, request: ElementTree.Element
+    ) -> tuple[str, bytes]:
+        root = "fl:FlightPlanListReply"
+        callsign = request.findtext("aircraftId")
+        origin = request.findtext("aerodromeOfDeparture")
+        destination = request.findtext("aerodromeOfDestination")
+        flights = [
+            f
+            for f in self._flights(request, "estimatedOffBlockTime")
+            if _match(callsign, f["callsign"])
+            and _match(origin, f["origin"])
+            and _match(destination, f["destination"])
+        ]
+        return root, synthetic.flight_plan_list_reply(flights)
+
+    def _flightlist(self, request: ElementTree.Element) -> tuple[str, bytes]:
+        name = request.tag.split("}")[-1].replace("Request", "Reply")
+        flights = self._flights(request, "trafficWindow")
+        if self.max_results is not None and len(flights) > self.max_results:
+            reason = f"{len(flights)} flights > {self.max_results}"
+            return f"fl:{name}", synthetic.error_reply(
+                f"fl:{name}", "TOO_MANY_RESULTS", reason
+            )
+        return f"fl:{name}", synthetic.flight_list_reply(flights, root=name)
+
+    def _flightretrieval(
+        self, request: ElementTree.Element
+    ) -> tuple[str, bytes]:
+        keys = "flightId/keys/"
+        eobt = _time(request, keys + "estimatedOffBlockTime")
+        k = int(eobt.timestamp()) // 60
+        flight = synthetic.flight(k, eobt, self.seed)
+        flight["callsign"] = request.findtext(keys + "aircraftId")
+        flight["origin"] = request.findtext(keys + "aerodromeOfDeparture")
+        flight["destination"] = request.findtext(
+            keys + "aerodromeOfDestination"
+        )
+        root = "fl:FlightRetrievalReply"
+        return root, synthetic.flight_retrieval_reply(flight)
+
+    def _regulationlist(
+        self, request: ElementTree.Element
+    ) -> tuple[str, bytes]:
+        root = "fw:RegulationListReply"
+        return root, synthetic.regulation_list_reply(
+            self.regulations, self.seed
+        )
+
+    def _aixm_dataset(self, request: ElementTree.Element) -> tuple[str, bytes]:
+        airac = request.findtext("queryCriteria/airac/airacId", "0000")
+        lengths: dict[str, int] = {}
+        for i, name in enumerate(synthetic.AIXM_FILES):
+            file_id = f"{airac}/{name}.BASELINE.zip"
+            if file_id not in self.files:
+                self.publish(
+                    file_id,
+                    synthetic.aixm_file(
+                        name, airac, self.aixm_features, self.seed + i
+                    ),
+                )
+            lengths[file_id] = len(self.files[file_id])
+        self.updates.setdefault(airac, 2)
+        root = "as:CompleteAIXMDatasetReply"
+        return root, synthetic.complete_aixm_dataset_reply(
+            airac, lengths, self.updates[airac], self.release_times
+        )
+
+    def publish(self, file_id: str, content: bytes) -> None:
+        """Publishes a new version of a file of the AIXM dataset.
+
+        Files of an AIRAC cycle already requested are part of a new update
+        of the dataset.
+        """
+        airac = file_id.split("/")[0]
+        if airac in self.updates:
+            self.updates[airac] += 1
+        self.files[file_id] = content
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        if (previous := self.release_times.get(file_id, None)) is not None:
+            # release times are given to the second
+            now = max(now, previous + timedelta(seconds=1))
+        self.release_times[file_id] = now
@@ -0,0 +1,306 @@
+"""
+Synthetic B2B replies, shaped after actual NM replies.
+"""
+
+from __future__ import annotations
+
+import io
+import random
+import zipfile
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator, Mapping
+
+AERODROMES = ["EGLL", "LFPG", "EHAM", "EDDF", "LEMD", "LIRF", "LFBO", "LSZH"]
+TYPECODES = ["A320", "A20N", "A321", "B738", "B38M", "A359", "B77W", "E190"]
+OPERATORS = ["AFR", "BAW", "KLM", "DLH", "IBE", "EZY", "RYR", "SWR"]
+REGULATIONS = ["LFPGA01", "EGLLA02", "LFBBBDX", "EDDFA03"]
+
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Prefix and namespace of replies, for each service
+NAMESPACES = {
+    "fl": "eurocontrol/cfmu/b2b/FlightServices",
+    "fw": "eurocontrol/cfmu/b2b/FlowServices",
+    "as": "eurocontrol/cfmu/b2b/AirspaceServices",
+}
+
+HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<{root} xmlns:{prefix}="{namespace}">
+<requestReceptionTime>{now:%Y-%m-%d %H:%M:%S}</requestReceptionTime>
+<requestId>B2B_CUR:123456</requestId>
+<sendTime>{now:%Y-%m-%d %H:%M:%S}</sendTime>
+<status>{status}</status>
+"""
+
+KEYS = """<id>AA{id:08d}</id><keys>
+<aircraftId>{callsign}</aircraftId>
+<aerodromeOfDeparture>{origin}</aerodromeOfDeparture>
+<nonICAOAerodromeOfDeparture>false</nonICAOAerodromeOfDeparture>
+<airFiled>false</airFiled>
+<aerodromeOfDestination>{destination}</aerodromeOfDestination>
+<nonICAOAerodromeOfDestination>false</nonICAOAerodromeOfDestination>
+<estimatedOffBlockTime>{eobt:%Y-%m-%d %H:%M}</estimatedOffBlockTime>
+</keys>"""
+
+FLIGHT = """<flightId>{keys}</flightId>
+<aircraftType>{typecode}</aircraftType>
+<aircraftAddress>{icao24:06x}</aircraftAddress>
+<estimatedTakeOffTime>{etot:%Y-%m-%d %H:%M}</estimatedTakeOffTime>
+<calculatedTakeOffTime>{ctot:%Y-%m-%d %H:%M}</calculatedTakeOffTime>
+<estimatedTimeOfArrival>{eta:%Y-%m-%d %H:%M}</estimatedTimeOfArrival>
+<calculatedTimeOfArrival>{cta:%Y-%m-%d %H:%M}</calculatedTimeOfArrival>
+<requestedFlightLevel><unit>F</unit><level>{level}</level></requestedFlightLevel>
+<wakeTurbulenceCategory>MEDIUM</wakeTurbulenceCategory>
+<mostPenalisingRegulation>{regulation}</mostPenalisingRegulation>
+<iataFlightDesignator><id>{iata}</id></iataFlightDesignator>
+<icaoRoute>N0450F{level} DCT {route} DCT</icaoRoute>
+"""
+
+SUMMARY = """<summaries><lastValidFlightPlan>
+<id>{keys}</id>
+<status>FILED</status>
+</lastValidFlightPlan></summaries>
+"""
+
+REGULATION = """<item>
+<regulationId>{regulation}{id}</regulationId>
+<applicability><wef>{wef:%Y-%m-%d %H:%M}</wef><unt>{unt:%Y-%m-%d %H:%M}</unt>
+</applicability>
+<lastUpdate><eventTime>{wef:%Y-%m-%d %H:%M:%S}</eventTime></lastUpdate>
+<reason>ATC_CAPACITY</reason>
+<subType>ATC_CAPACITY</subType>
+<location><id>{regulation}</id></location>
+<regulationState>APPLIED</regulationState>
+</item>
+"""
+
+AIXM_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<message:AIXMBasicMessage
+ xmlns:message="http://www.aixm.aero/schema/5.1/message"
+ xmlns:aixm="http://www.aixm.aero/schema/5.1"
+ xmlns:gml="http://www.opengis.net/gml/3.2"
+ gml:id="M{airac}">
+"""
+
+DESIGNATED_POINT = """<message:hasMember>
+<aixm:DesignatedPoint gml:id="ID_DP_{id}">
+<gml:identifier codeSpace="urn:uuid:">{uuid}</gml:identifier>
+<aixm:timeSlice><aixm:DesignatedPointTimeSlice gml:id="ID_DP_TS_{id}">
+<gml:validTime><gml:TimePeriod gml:id="ID_DP_VT_{id}">
+<gml:beginPosition>{begin:%Y-%m-%dT%H:%M:%S}</gml:beginPosition>
+<gml:endPosition indeterminatePosition="unknown"/>
+</gml:TimePeriod></gml:validTime>
+<aixm:interpretation>BASELINE</aixm:interpretation>
+<aixm:designator>{designator}</aixm:designator>
+<aixm:type>ICAO</aixm:type>
+<aixm:location><aixm:Point gml:id="ID_DP_PT_{id}">
+<gml:pos>{latitude:.6f} {longitude:.6f}</gml:pos>
+</aixm:Point></aixm:location>
+</aixm:DesignatedPointTimeSlice></aixm:timeSlice>
+</aixm:DesignatedPoint>
+</message:hasMember>
+"""
+
+# Names of the files in a complete AIXM dataset
+AIXM_FILES = [
+    "AirportHeliport",
+    "DesignatedPoint",
+    "Navaid",
+    "Route",
+    "RouteSegment",
+    "Airspace",
+]
+
+
+def header(root: str, status: str = "OK") -> str:
+    prefix = root.split(":")[0]
+    return HEADER.format(
+        root=root,
+        prefix=prefix,
+        namespace=NAMESPACES[prefix],
+        status=status,
+        now=datetime.now(timezone.utc),
+    )
+
+
+def error_reply(root: str, status: str, reason: str = "") -> bytes:
+    """A reply with an error status, e.g. RESOURCE_OVERLOAD."""
+    content = header(root, status)
+    if reason:
+        content += f"<reason>{reason}</reason>\n"
+    content += f"</{root}>\n"
+    return content.encode()
+
+
+def flight(k: int, eobt: datetime, seed: int = 42) -> dict[str, Any]:
+    """The k-th synthetic flight. The same k always yields the same flight."""
+    rng = random.Random(seed * 1_000_003 + k)
+    operator = rng.choice(OPERATORS)
+    etot = eobt + timedelta(minutes=rng.randrange(5, 30))
+    eta = etot + timedelta(minutes=rng.randrange(40, 600))
+    delay = timedelta(minutes=rng.randrange(0, 45))
+    return dict(
+        id=k,
+        callsign=f"{operator}{rng.randrange(10000):04d}",
+        iata=f"{operator[:2]}{rng.randrange(10000)}",
+        origin=rng.choice(AERODROMES),
+        destination=rng.choice(AERODROMES),
+        typecode=rng.choice(TYPECODES),
+        icao24=rng.randrange(2**24),
+        eobt=eobt,
+        etot=etot,
+        ctot=etot + delay,
+        eta=eta,
+        cta=eta + delay,
+        level=rng.randrange(200, 410, 10),
+        regulation=rng.choice(REGULATIONS),
+        route=" DCT ".join(f"P{rng.randrange(1000):03d}" for _ in range(5)),
+    )
+
+
+def flights(n: int, seed: int = 42) -> Iterator[dict[str, Any]]:
+    """n flights scattered over one day."""
+    rng = random.Random(seed)
+    start = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    for k in range(n):
+        eobt = start + timedelta(minutes=rng.randrange(24 * 60))
+        yield flight(k, eobt, seed)
+
+
+def flights_between(
+    start: datetime,
+    stop: datetime,
+    per_hour: int,
+    seed: int = 42,
+) -> Iterator[dict[str, Any]]:
+    """Flights regularly scheduled in [start, stop).
+
+    Flights are consistent across calls: overlapping windows yield the same
+    flights (with the same flightId) over their intersection.
+    """
+    interval = 3600 / per_hour
+    first = -int(-(start - EPOCH).total_seconds() // interval)
+    k = first
+    while (eobt := EPOCH + timedelta(seconds=k * interval)) < stop:
+        yield flight(k, eobt.replace(second=0, microsecond=0), seed)
+        k += 1
+
+
+def _keys(f: dict[str, Any]) -> str:
+    return KEYS.format(**f)
+
+
+def flight_list_reply(
+    n: int | list[dict[str, Any]],
+    root: str = "FlightListByAerodromeReply",
+    status: str = "OK",
+    seed: int = 42,
+) -> bytes:
+    """A reply to FlightListByAerodrome, FlightListByAirspace or
+    FlightListByMeasure requests, with n flights (or the given flights)."""
+    entries = flights(n, seed) if isinstance(n, int) else n
+    content = header(f"fl:{root}", status)
+    content += "<data>\n"
+    content += "".join(
+        f"<flights><flight>{FLIGHT.format(keys=_keys(f), **f)}</flight>"
+        "</flights>\n"
+        for f in entries
+    )
+    content += f"</data>\n</fl:{root}>\n"
+    return content.encode()
+
+
+def flight_plan_list_reply(
+    n: int | list[dict[str, Any]], seed: int = 42
+) -> bytes:
+    """A reply to FlightPlanList requests, with n flight plans (or the given
+    flights)."""
+    entries = flights(n, seed) if isinstance(n, int) else n
+    content = header("fl:FlightPlanListReply")
+    content += "<data>\n"
+    content += "".join(SUMMARY.format(keys=_keys(f)) for f in entries)
+    content += "</data>\n</fl:FlightPlanListReply>\n"
+    return content.encode()
+
+
+def flight_retrieval_reply(f: dict[str, Any]) -> bytes:
+    """A reply to FlightRetrieval requests, for the given flight."""
+    content = header("fl:FlightRetrievalReply")
+    content += f"<data><flight>{FLIGHT.format(keys=_keys(f), **f)}"
+    content += "</flight></data>\n</fl:FlightRetrievalReply>\n"
+    return content.encode()
+
+
+def regulation_list_reply(n: int, seed: int = 42) -> bytes:
+    """A reply to RegulationList requests, with n regulations."""
+    rng = random.Random(seed)
+    start = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    content = header("fw:RegulationListReply")
+    content += "<data><regulations>\n"
+    for i in range(n):
+        wef = start + timedelta(minutes=rng.randrange(24 * 60))
+        content += REGULATION.format(
+            id=i,
+            regulation=rng.choice(REGULATIONS),
+            wef=wef,
+            unt=wef + timedelta(hours=rng.randrange(1, 6)),
+        )
+    content += "</regulations></data>\n</fw:RegulationListReply>\n"
+    return content.encode()
+
+
+def aixm_file(name: str, airac: str, n: int, seed: int = 42) -> bytes:
+    """A zipped AIXM file with n features (designated points)."""
+    rng = random.Random(seed)
+    content = AIXM_HEADER.format(airac=airac)
+    content += "".join(
+        DESIGNATED_POINT.format(
+            id=i,
+            uuid=f"{rng.getrandbits(128):032x}",
+            begin=EPOCH,
+            designator=f"P{i:04d}",
+            latitude=rng.uniform(35, 60),
+            longitude=rng.uniform(-10, 20),
+        )
+        for i in range(n)
+    )
+    content += "</message:AIXMBasicMessage>\n"
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(f"{name}.BASELINE", content)
+    return buffer.getvalue()
+
+
+def complete_aixm_dataset_reply(
+    airac: str,
+    files: dict[str, int],
+    updates: int = 2,
+    release_times: None | Mapping[str, datetime] = None,
+) -> bytes:
+    """A reply to CompleteAIXMDataset requests.
+
+    :param files: the identifier and length of each file of the dataset
+    :param updates: the number of dataset summaries (only the files of the
+        most recent update are listed)
+    :param release_times: the release time of each file (by default, now)
+    """
+    now = datetime.now(timezone.utc)
+    release_times = release_times or {}
+    content = header("as:CompleteAIXMDatasetReply")
+    content += "<data>\n"
+    for update in range(updates):
+        content += "<datasetSummaries>\n"
+        content += f"<updateId>{airac}.{update}</updateId>\n"
+        content += f"<publicationDate>{now:%Y-%m-%d}</publicationDate>\n"
+        content += f"<sourceAIRACs>{airac}</sourceAIRACs>\n"
+        for file_id, length in files.items() if update == updates - 1 else []:
+            content += (
+                f"<files><id>{file_id}</id><type>AIXM</type>"
+                "<releaseTime>"
+                f"{release_times.get(file_id, now):%Y-%m-%d %H:%M:%S}"
+                "</releaseTime>"
+                f"<fileLength>{length}</fileLength></files>\n"
+            )
+        content += "</datasetSummaries>\n"
+    content += "</data>\n</as:CompleteAIXMDatasetReply>\n"
+    return content.encode()
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, cast
+from xml.etree import ElementTree
+
+
+class ReplyParser:
+    """Incremental single-pass parser for B2B replies.
+
+    The parser is fed with chunks of bytes as they are received and builds
+    the same nested structure as :func:`xmltodict.parse` (without
+    intermediate string or DOM of the full reply).
+
+    :param records: path (below the root element) to repeated elements,
+        e.g. ``("data", "flights")``. Those elements are converted and
+        released as soon as they are parsed: they are yielded by
+        :meth:`feed` and :meth:`close` rather than kept in :attr:`reply`.
+
+    The status of the reply is available in :attr:`status` as soon as it
+    is parsed: records are only yielded if the status is ``OK``.
+
+    """
+
+    def __init__(self, records: tuple[str, ...] = ()) -> None:
+        self._parser: ElementTree.XMLPullParser[ElementTree.Element]
+        self._parser = ElementTree.XMLPullParser(
+            events=("start-ns", "start", "end")
+        )
+        self._records = list(records)
+        self._path: list[str] = []
+        self._stack: list[ElementTree.Element] = []
+        self._prefixes: dict[str, str] = {}
+        self._tags: dict[str, str] = {}
+        self._declarations: list[tuple[str, str]] = []
+        self._namespaces: dict[ElementTree.Element, list[tuple[str, str]]]
+        self._namespaces = {}
+        self.status: None | str = None
+        self.reply: None | dict[str, Any] = None
+
+    def feed(self, data: bytes) -> Iterator[dict[str, Any]]:
+        try:
+            self._parser.feed(data)
+        except ElementTree.ParseError as error:
+            raise RuntimeError(f"Invalid XML reply: {error}") from error
+        yield from self._events()
+
+    def close(self) -> Iterator[dict[str, Any]]:
+        try:
+            self._parser.close()
+        except ElementTree.ParseError as error:
+            raise RuntimeError(f"Invalid XML reply: {error}") from error
+        yield from self._events()
+        if self.reply is None:
+            raise RuntimeError("Incomplete XML reply")
+
+    def _events(self) -> Iterator[dict[str, Any]]:
+        events = cast(Iterator[tuple[str, Any]], self._parser.read_events())
+        for event, elem in events:
+            if event == "start-ns":
+                prefix, uri = elem
+                self._prefixes[uri] = prefix
+                self._declarations.append((prefix, uri))
+            elif event == "start":
+                assert isinstance(elem, ElementTree.Element)
+                if self._declarations:
+                    self._namespaces[elem] = self._declarations
+                    self._declarations = []
+                self._stack.append(elem)
+                self._path.append(self._tag(elem.tag))
+            else:  # event == "end"
+                assert isinstance(elem, ElementTree.Element)
+                self._stack.pop()
+                path = self._path[1:]
+                self._path.pop()
+                if len(self._stack) == 0:
+                    self.reply = {self._tag(elem.tag): self._to_dict(elem)}
+                elif len(self._stack) == 1 and path == ["status"]:
+                    self.status = elem.text
+                elif path == self._records and self.status == "OK":
+                    yield self._to_dict(elem)
+                    self._stack[-1].remove(elem)
+
+    def _tag(self, tag: str) -> str:
+        if (name := self._tags.get(tag)) is not None:
+            return name
+        name = tag
+        if tag.startswith("{"):
+            uri, local = tag[1:].split("}")
+            prefix = self._prefixes.get(uri, "")
+            name = f"{prefix}:{local}" if prefix else local
+        self._tags[tag] = name
+        return name
+
+    def _to_dict(self, elem: ElementTree.Element) -> Any:
+        text = elem.text.strip() if elem.text else None
+        if len(elem) == 0 and not elem.attrib and elem not in self._namespaces:
+            return text if text else None
+
+        result: dict[str, Any] = {}
+        for prefix, uri in self._namespaces.pop(elem, []):
+            result["@xmlns:" + prefix if prefix else "@xmlns"] = uri
+        for key, value in elem.attrib.items():
+            result["@" + self._tag(key)] = value
+        for child in elem:
+            tag = self._tag(child.tag)
+            value = self._to_dict(child)
+            if tag not in result:
+                result[tag] = value
+            elif isinstance(result[tag], list):
+                result[tag].append(value)
+            else:
+                result[tag] = [result[tag], value]
+        if text:
+            result["#text"] = text
+        return result
+
+
+def parse_reply(
+    chunks: bytes | Iterable[bytes],
+    records: tuple[str, ...] = (),
+) -> dict[str, Any]:
+    """Parses a B2B reply in a single pass.
+
+    Elements found at the ``records`` path are always gathered in a list.
+    """
+    parser = ReplyParser(records)
+    if isinstance(chunks, bytes):
+        chunks = [chunks]
+    collected: list[dict[str, Any]] = []
+    for chunk in chunks:
+        collected.extend(parser.feed(chunk))
+    collected.extend(parser.close())
+    assert parser.reply is not None
+    if collected:
+        insert_records(parser.reply, records, collected)
+    return parser.reply
+
+
+def insert_records(
+    reply: dict[str, Any],
+    records: tuple[str, ...],
+    collected: list[dict[str, Any]],
+) -> None:
+    """Inserts records, as yielded by a :class:`ReplyParser`, in the reply."""
+    ((root, content),) = reply.items()
+    if content is None:
+        content = reply[root] = {}
+    for key in records[:-1]:
+        if content.get(key, None) is None:
+            content[key] = {}
+        content = content[key]
+    content[records[-1]] = collected
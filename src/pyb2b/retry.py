@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Mapping, TypeVar
+
+import httpx
+
+from .exceptions import ReplyError
+
+_log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Minimum delay (in seconds) before retrying a request, for each transient
+# ReplyStatus. Other statuses are not retried.
+DEFAULT_STATUSES: Mapping[str, float] = {
+    "SERVICE_UNAVAILABLE": 1,
+    "RESOURCE_OVERLOAD": 1,
+    "PARALLEL_REQUEST_COUNT_QUOTA_EXCEEDED": 1,
+    "REQUEST_OVERBOOKING_REJECTED": 5,
+    "REQUEST_COUNT_QUOTA_EXCEEDED": 10,
+    "BANDWIDTH_QUOTAS_EXCEEDED": 10,
+}
+
+# HTTP status codes of transient errors
+DEFAULT_HTTP_STATUSES: frozenset[int] = frozenset({429, 502, 503, 504})
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with jitter for transient errors.
+
+    The n-th retry (starting at 0) waits ``backoff * factor ** n`` seconds
+    (capped at ``max_delay``), randomly shortened by up to ``jitter`` times
+    this duration, but never less than the minimum delay associated to the
+    reply status (or the ``Retry-After`` header of the HTTP response).
+
+    :param max_attempts: total number of attempts, including the first one
+    :param statuses: transient reply statuses and their minimum delay
+    :param http_statuses: transient HTTP status codes
+    """
+
+    max_attempts: int = 5
+    backoff: float = 1.0
+    factor: float = 2.0
+    max_delay: float = 60.0
+    jitter: float = 0.5
+    statuses: Mapping[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_STATUSES)
+    )
+    http_statuses: frozenset[int] = DEFAULT_HTTP_STATUSES
+
+    def delay(self, error: Exception, attempt: int) -> None | float:
+        """Returns how long to wait before retrying, None to give up.
+
+        :param error: the exception raised by the last attempt
+        :param attempt: the number of the last attempt, starting at 0
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+
+        minimum: float
+        if isinstance(error, ReplyError):
+            if error.status is None or error.status not in self.statuses:
+                return None
+            minimum = self.statuses[error.status]
+        elif isinstance(error, httpx.HTTPStatusError):
+            if error.response.status_code not in self.http_statuses:
+                return None
+            retry_after = error.response.headers.get("Retry-After", "")
+            minimum = float(retry_after) if retry_after.isdigit() else 0
+        elif isinstance(error, httpx.TransportError):
+            minimum = 0
+        else:
+            return None
+
+        delay = min(self.max_delay, self.backoff * self.factor**attempt)
+        delay *= 1 - self.jitter * random.random()
+        return max(delay, minimum)
+
+
+class TokenBucket:
+    """Client-side rate limiter, shared by synchronous and asynchronous calls.
+
+    :param rate: number of requests per second in the long run
+    :param capacity: maximum number of requests sent in a burst (by default,
+        one second worth of requests)
+    """
+
+    def __init__(self, rate: float, capacity: None | float = None) -> None:
+        if rate <= 0:
+            raise ValueError(f"The rate must be positive: {rate}")
+        if capacity is not None and capacity <= 0:
+            raise ValueError(f"The capacity must be positive: {capacity}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token, returns how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self) -> None:
+        if (delay := self.reserve()) > 0:
+            time.sleep(delay)
+
+    async def async_acquire(self) -> None:
+        if (delay := self.reserve()) > 0:
+            await asyncio.sleep(delay)
+
+
+def retry(
+    fun: Callable[[], T],
+    policy: None | RetryPolicy = None,
+    limiter: None | TokenBucket = None,
+) -> T:
+    """Calls fun until it succeeds or the policy gives up."""
+    attempt = 0
+    while True:
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            return fun()
+        except Exception as error:
+            delay = policy.delay(error, attempt) if policy else None
+            if delay is None:
+                raise
+            _log.warning(f"{error!r}, retrying in {delay:.1f}s")
+        time.sleep(delay)
+        attempt += 1
+
+
+async def async_retry(
+    fun: Callable[[], Awaitable[T]],
+    policy: None | RetryPolicy = None,
+    limiter: None | TokenBucket = None,
+) -> T:
+    """Awaits fun() until it succeeds or the policy gives up."""
+    attempt = 0
+    while True:
+        if limiter is not None:
+            await limiter.async_acquire()
+        try:
+            return await fun()
+        except Exception as error:
+            delay = policy.delay(error, attempt) if policy else None
+            if delay is None:
+                raise
+            _log.warning(f"{error!r}, retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+        attempt += 1
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import gzip
+import importlib.util
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Callable
+
+# Compressed files are recognized by their suffix
+COMPRESSION_SUFFIXES = (".gz", ".zst")
+
+
+@dataclass(frozen=True)
+class Serializer:
+    """Encodes Python values to JSON (as bytes) and decodes them."""
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+def _json() -> Serializer:
+    return Serializer(
+        "json",
+        lambda obj: json.dumps(obj, ensure_ascii=False).encode(),
+        json.loads,
+    )
+
+
+def _orjson() -> Serializer:
+    import orjson
+
+    return Serializer("orjson", orjson.dumps, orjson.loads)
+
+
+def _msgspec() -> Serializer:
+    import msgspec
+
+    encoder, decoder = msgspec.json.Encoder(), msgspec.json.Decoder()
+    return Serializer("msgspec", encoder.encode, decoder.decode)
+
+
+serializers: dict[str, Callable[[], Serializer]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "json": _json,
+}
+
+
+def get_serializer(name: None | str = None) -> Serializer:
+    """Returns a serializer by name, by default the fastest available one.
+
+    orjson and msgspec are used when installed; other serializers may be
+    registered in the ``serializers`` dictionary.
+    """
+    if name is not None:
+        return serializers[name]()
+    for name, factory in serializers.items():
+        if name == "json" or importlib.util.find_spec(name) is not None:
+            return factory()
+    return _json()
+
+
+def open_file(path: Path, mode: str) -> IO[bytes]:
+    """Opens a binary file, compressed according to its suffix.
+
+    zstd compression requires the ``zstandard`` package (before Python
+    3.14).
+    """
+    if path.suffix == ".gz":
+        return gzip.open(path, mode)  # type: ignore
+    if path.suffix == ".zst":
+        try:
+            from compression import zstd
+        except ImportError:
+            import zstandard as zstd
+        return zstd.open(path, mode)  # type: ignore
+    return open(path, mode)
+
+
+def dump(
+    obj: Any,
+    file: IO[bytes],
+    serializer: None | Serializer = None,
+    depth: int = 3,
+) -> None:
+    """Writes obj as JSON, piece by piece.
+
+    The outer levels of dictionaries and lists (up to depth) are written
+    element by element, so that the encoded document is never entirely held
+    in memory, e.g. for replies with a large number of flights.
+    """
+    if serializer is None:
+        serializer = get_serializer()
+    if depth > 0 and isinstance(obj, dict) and obj:
+        file.write(b"{")
+        for i, (key, value) in enumerate(obj.items()):
+            file.write((b"," if i else b"") + serializer.dumps(key) + b":")
+            dump(value, file, serializer, depth - 1)
+        file.write(b"}")
+    elif depth > 0 and isinstance(obj, list) and obj:
+        file.write(b"[")
+        for i, value in enumerate(obj):
+            if i:
+                file.write(b",")
+            dump(value, file, serializer, depth - 1)
+        file.write(b"]")
+    else:
+        file.write(serializer.dumps(obj))
+
+
+def load(file: IO[bytes], serializer: None | Serializer = None) -> Any:
+    if serializer is None:
+        serializer = get_serializer()
+    return serializer.loads(file.read())
@@ -1,69 +1,201 @@
-import io
+from __future__ import annotations
+
+import asyncio
+import hashlib
 import logging
+import os
 import re
+import zipfile
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
 import httpx
-from pitot.airac import airac_cycle
-from tqdm.asyncio import tqdm
-
-import pandas as pd
 
+from ....exceptions import DownloadError
+from ....retry import async_retry
+from ....types.generated import decoders
 from ....types.generated.airspace import CompleteAIXMDatasetReply
 from ....types.generated.common import File
+from .manifest import Manifest, sha256, update_key
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 _log = logging.getLogger(__name__)
 
 
+# Size (in bytes) of the chunks written to disk while downloading files
+CHUNK_SIZE = 1 << 20
+
+# Timeout configuration of file requests, e.g. waiting for the next chunk
+FILE_TIMEOUT = httpx.Timeout(10, read=60)
+
+
 class _AIXMDataset:
     async def _async_file_get(
         self,
-        client: httpx.AsyncClient,
+        client: None | httpx.AsyncClient,
         file: File,
         output_dir: str | Path,
-    ) -> None:
-        buffer = io.BytesIO()
+        chunk_size: int = CHUNK_SIZE,
+        manifest: None | Manifest = None,
+        verify: bool = False,
+        progress: None | Callable[[int], Any] = None,
+        timeout: None | float | httpx.Timeout = FILE_TIMEOUT,
+    ) -> None | Path:
+        """Downloads a file, chunk by chunk, to the output directory.
+
+        Chunks are appended to a ``.part`` file as they arrive: memory usage
+        does not depend on the size of the file, and an interrupted download
+        is resumed from the end of the ``.part`` file with a ``Range``
+        request. The file is renamed when its length matches the
+        ``fileLength`` announced by the gateway.
+
+        :param manifest: where completed files are recorded
+        :param verify: check the SHA-256 digest of recorded files, rather
+            than their length only
+        :param progress: called with the number of bytes of the file
+            available on disk since the last call (negative if some are
+            dropped)
+        :param timeout: the timeout configuration of the request
+
+        Returns the path of the file, None if it was already downloaded.
+        """
+        if client is None:
+            client = self.async_client  # type: ignore
         output_dir = Path(output_dir)
         path = output_dir / Path(file["id"].split("/")[-1])
-        if path.exists():
-            return
-
-        async with client.stream(
-            "GET",
-            url=self.mode["file_url"] + file["id"],  # type: ignore
-        ) as response:
-            total = int(file["fileLength"])
-            async for chunk in tqdm(
-                response.aiter_bytes(1024),
-                total=total // 1024 + 1 if total % 1024 > 0 else 0,
-                desc=path.stem,
-            ):
-                buffer.write(chunk)
-
-        buffer.seek(0)
+        length = int(file["fileLength"])
+        reported = 0
+
+        def report(size: int) -> None:
+            nonlocal reported
+            reported += size
+            if progress is not None:
+                progress(size)
+
+        if manifest is not None and file["id"] in manifest.files:
+            if manifest.check(file, digest=verify):
+                report(length)
+                return None
+        elif (manifest is None or manifest.adopt) and (
+            path.exists() and path.stat().st_size == length
+        ):
+            # downloaded before manifests were kept
+            if manifest is not None:
+                manifest.add(file, path, sha256(path))
+            report(length)
+            return None
+
+        part = path.with_name(path.name + ".part")
+        offset = part.stat().st_size if part.exists() else 0
+        if offset > length:
+            offset = 0
+        digest = hashlib.sha256()
+        downloading = offset < length
+        report(offset)
+
+        try:
+            if downloading:
+                headers = {"Range": f"bytes={offset}-"} if offset else {}
+                async with client.stream(
+                    "GET",
+                    url=self.mode["file_url"] + file["id"],  # type: ignore
+                    headers=headers,
+                    timeout=timeout,
+                ) as response:
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        report(-offset)
+                        offset = 0  # the whole file is sent
+                    elif not response.headers.get(
+                        "content-range", ""
+                    ).startswith(f"bytes {offset}-"):
+                        part.unlink()
+                        raise DownloadError(
+                            f"{path.name}: unexpected range "
+                            f"{response.headers.get('content-range')}"
+                        )
+                    if offset:
+                        _log.info(f"resume {path} from byte {offset}")
+                    with part.open("r+b" if offset else "wb") as fh:
+                        while offset and (chunk := fh.read(chunk_size)):
+                            digest.update(chunk)
+                        fh.truncate()
+                        async for chunk in response.aiter_bytes(chunk_size):
+                            fh.write(chunk)
+                            digest.update(chunk)
+                            report(len(chunk))
+
+            size = part.stat().st_size
+            if size != length:
+                if size > length:
+                    part.unlink()
+                raise DownloadError(
+                    f"{path.name}: {size} bytes received, {length} expected"
+                )
+            if path.suffix == ".zip" and not zipfile.is_zipfile(part):
+                part.unlink()
+                raise DownloadError(f"{path.name}: not a valid zip file")
+        except BaseException:
+            # progress is reported again if the download is retried
+            report(-reported)
+            raise
 
         _log.info(f"write {path}")
-        path.write_bytes(buffer.getvalue())
+        os.replace(part, path)
+        if manifest is not None:
+            checksum = digest.hexdigest() if downloading else sha256(path)
+            manifest.add(file, path, checksum)
+        return path
 
     async def async_aixm_request(
         self,
-        client: httpx.AsyncClient,
+        client: None | httpx.AsyncClient,
         airac_id: str | int | pd.Timestamp,
         output_dir: str | Path,
-    ) -> None:
+        chunk_size: int = CHUNK_SIZE,
+        verify: bool = False,
+        concurrency: int = 4,
+        timeout: None | float | httpx.Timeout = FILE_TIMEOUT,
+    ) -> list[Path]:
         """
         Downloads the EUROCONTROL data files following the AIXM standard.
 
         :param airac_id: the AIRAC cycle, e.g. 2201 (1st cycle of 2022)
         :param output_dir: where to download the data.
+        :param chunk_size: the size (in bytes) of chunks written to disk
+        :param verify: check the SHA-256 digest of files already downloaded
+        :param concurrency: the maximum number of files downloaded at the
+            same time
+        :param timeout: the timeout configuration of each file request
+
+        Files failing with transient errors (e.g. ``ReadTimeout``) are
+        downloaded again, from where they stopped, according to the retry
+        policy.
+
+        Interrupted downloads are resumed. Downloaded files are listed,
+        with their length and digest, in a JSON manifest in the output
+        directory. When NM publishes a new update of the dataset within
+        the cycle, only the files which changed since the previous update
+        (by id, release time or length) are downloaded.
+
+        Returns the paths of the downloaded files (files already up to date
+        are not listed).
 
         **See also**: :ref:`How to configure EUROCONTROL data files?`
         """
+        from pitot.airac import airac_cycle
+        from tqdm import tqdm
+
+        import pandas as pd
 
         if isinstance(airac_id, int) and not re.match(r"\d{4}", str(airac_id)):
             raise ValueError(
                 "airac_id must be a 4 digit number, or a timestamp"
             )
+        if isinstance(airac_id, int):
+            airac_id = str(airac_id)
         if isinstance(airac_id, str) and not re.match(r"\d{4}", airac_id):
             airac_id = pd.Timestamp(airac_id, tz="utc")
         if isinstance(airac_id, pd.Timestamp):
@@ -84,14 +216,61 @@ class _AIXMDataset:
         res = await self.async_post(client, request)  # type: ignore
 
         reply: CompleteAIXMDatasetReply
-        reply = res["as:CompleteAIXMDatasetReply"]
+        reply = decoders.decode_airspace_CompleteAIXMDatasetReply(
+            res["as:CompleteAIXMDatasetReply"]
+        )
         data = reply["data"]
         summaries = data["datasetSummaries"]
         assert isinstance(summaries, list)
-        entry = max(summaries, key=lambda x: x["updateId"])
+        entry = max(summaries, key=lambda x: update_key(x["updateId"]))
         files = entry["files"]
         assert isinstance(files, list)
-        # don't do asyncio.gather (ReadTimeout)
-        for file in files:
-            await self._async_file_get(client, file, output_dir)
-        return
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        manifest = Manifest(output_dir, airac_id, entry["updateId"])
+        manifest.summary = {k: v for k, v in entry.items() if k != "files"}
+        previous = [
+            update
+            for update in Manifest.updates(output_dir, airac_id)
+            if update.update_id != manifest.update_id
+        ]
+        if reused := manifest.reuse(files, previous):
+            _log.info(f"{reused} files unchanged since {previous[-1]}")
+        manifest.save()
+
+        # a bounded number of files at a time: downloading all of them at
+        # once results in ReadTimeout errors
+        semaphore = asyncio.Semaphore(concurrency)
+        progress = tqdm(
+            total=sum(int(file["fileLength"]) for file in files),
+            unit="B",
+            unit_scale=True,
+            desc=f"AIRAC {airac_id}",
+            disable=None,  # not in cron jobs
+        )
+
+        async def fetch(file: File) -> None | Path:
+            async with semaphore:
+                return await async_retry(
+                    lambda: self._async_file_get(
+                        client,
+                        file,
+                        output_dir,
+                        chunk_size,
+                        manifest,
+                        verify,
+                        progress.update,
+                        timeout,
+                    ),
+                    self.retry,  # type: ignore
+                )
+
+        tasks = [asyncio.ensure_future(fetch(file)) for file in files]
+        try:
+            with progress:
+                paths = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return [path for path in paths if path is not None]
@@ -0,0 +1,394 @@
+"""
+Streaming reader of AIXM files, and indexed local storage of their features.
+
+Complete AIXM datasets (see :meth:`async_aixm_request`) weigh hundreds of
+megabytes of XML. :func:`features` parses them incrementally: only one
+feature is held in memory at a time. :class:`AIXMStore` keeps the most
+relevant attributes of airspaces, designated points, navaids, routes and
+aerodromes in a SQLite database, indexed by designator, so that lookups
+are immediate in later sessions:
+
+.. code:: python
+
+    store = AIXMStore("2401/aixm.sqlite")
+    store.add(Path("2401").glob("*.zip"))  # only new or modified files
+    store.get("Airspace", "LFBBBDX")
+
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import sqlite3
+import threading
+import zipfile
+from pathlib import Path
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from xml.etree import ElementTree
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_log = logging.getLogger(__name__)
+
+# Attributes stored for each feature, as paths in the BASELINE time slice,
+# without namespace prefix. Alternative paths are tried in turn; @name
+# selects an attribute rather than the text of an element. References to
+# other features (xlink:href) are stored as the identifier of the feature.
+# "pos" is split into latitude and longitude.
+FEATURES: Mapping[str, Mapping[str, tuple[str, ...]]] = {
+    "AirportHeliport": {
+        "designator": ("designator",),
+        "icao": ("locationIndicatorICAO",),
+        "name": ("name",),
+        "pos": ("ARP/ElevatedPoint/pos",),
+    },
+    "DesignatedPoint": {
+        "designator": ("designator",),
+        "name": ("name",),
+        "type": ("type",),
+        "pos": ("location/Point/pos",),
+    },
+    "Navaid": {
+        "designator": ("designator",),
+        "name": ("name",),
+        "type": ("type",),
+        "pos": ("location/ElevatedPoint/pos",),
+    },
+    "Route": {
+        "prefix": ("designatorPrefix",),
+        "second_letter": ("designatorSecondLetter",),
+        "number": ("designatorNumber",),
+        "multiple": ("multipleIdentifier",),
+        "name": ("name",),
+    },
+    "RouteSegment": {
+        "route": ("routeFormed@href",),
+        "start": (
+            "start/EnRouteSegmentPoint/pointChoice_fixDesignatedPoint@href",
+            "start/EnRouteSegmentPoint/pointChoice_navaidSystem@href",
+        ),
+        "end": (
+            "end/EnRouteSegmentPoint/pointChoice_fixDesignatedPoint@href",
+            "end/EnRouteSegmentPoint/pointChoice_navaidSystem@href",
+        ),
+        "upper": ("upperLimit",),
+        "upper_uom": ("upperLimit@uom",),
+        "lower": ("lowerLimit",),
+        "lower_uom": ("lowerLimit@uom",),
+    },
+    "Airspace": {
+        "designator": ("designator",),
+        "name": ("name",),
+        "type": ("type",),
+        "upper": (
+            "geometryComponent/AirspaceGeometryComponent/theAirspaceVolume"
+            "/AirspaceVolume/upperLimit",
+        ),
+        "upper_uom": (
+            "geometryComponent/AirspaceGeometryComponent/theAirspaceVolume"
+            "/AirspaceVolume/upperLimit@uom",
+        ),
+        "lower": (
+            "geometryComponent/AirspaceGeometryComponent/theAirspaceVolume"
+            "/AirspaceVolume/lowerLimit",
+        ),
+        "lower_uom": (
+            "geometryComponent/AirspaceGeometryComponent/theAirspaceVolume"
+            "/AirspaceVolume/lowerLimit@uom",
+        ),
+        # only for airspaces with an explicit (simple) horizontal projection
+        "polygon": (
+            "geometryComponent/AirspaceGeometryComponent/theAirspaceVolume"
+            "/AirspaceVolume/horizontalProjection/Surface/patches"
+            "/PolygonPatch/exterior/LinearRing/posList",
+        ),
+    },
+}
+
+# Columns indexed in addition to the designator
+INDEXES: Mapping[str, tuple[str, ...]] = {"RouteSegment": ("route",)}
+
+
+def columns(feature: str) -> list[str]:
+    """The columns of the table of a feature type."""
+    names = ["identifier", "designator"]
+    for name in FEATURES[feature]:
+        if name == "pos":
+            names += ["latitude", "longitude"]
+        elif name != "designator":
+            names.append(name)
+    return names
+
+
+@functools.lru_cache
+def _compile(path: str) -> tuple[str, str]:
+    path, _, attribute = path.partition("@")
+    return "/".join(f"{{*}}{step}" for step in path.split("/")), attribute
+
+
+def _find(element: ElementTree.Element, path: str) -> None | str:
+    path, attribute = _compile(path)
+    node = element.find(path)
+    if node is None:
+        return None
+    if not attribute:
+        return node.text
+    for key, value in node.attrib.items():
+        if key == attribute or key.endswith("}" + attribute):
+            return value.removeprefix("urn:uuid:")
+    return None
+
+
+def _values(feature: str, time_slice: ElementTree.Element) -> dict[str, Any]:
+    values: dict[str, Any] = {}
+    for name, paths in FEATURES[feature].items():
+        value = next(
+            (v for path in paths if (v := _find(time_slice, path)) is not None),
+            None,
+        )
+        if name == "pos":
+            lat, lon = value.split() if value is not None else (None, None)
+            values["latitude"] = float(lat) if lat is not None else None
+            values["longitude"] = float(lon) if lon is not None else None
+        else:
+            values[name] = value
+    if feature == "Route":
+        parts = ("prefix", "second_letter", "number", "multiple")
+        values["designator"] = "".join(values[p] or "" for p in parts) or None
+    values.setdefault("designator", None)
+    return values
+
+
+def _version(time_slice: ElementTree.Element) -> tuple[int, int, str]:
+    """The sort key of BASELINE time slices: sequence and correction
+    numbers, then the start of validity (ISO 8601 strings, comparable)."""
+    sequence = _find(time_slice, "sequenceNumber")
+    correction = _find(time_slice, "correctionNumber")
+    begin = _find(time_slice, "validTime/TimePeriod/beginPosition")
+    return (int(sequence or 0), int(correction or 0), begin or "")
+
+
+def _open(source: str | Path) -> Iterator[IO[bytes]]:
+    """The XML files of a (zipped) AIXM file."""
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for name in archive.namelist():
+                if not name.endswith("/"):
+                    with archive.open(name) as fh:
+                        yield fh
+    else:
+        with open(source, "rb") as fh:
+            yield fh
+
+
+def features(
+    source: str | Path | IO[bytes],
+    types: None | Collection[str] = None,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Parses an AIXM file, one feature at a time.
+
+    Only features with a BASELINE time slice are returned, with the values
+    of the most recent one (see :data:`FEATURES`), i.e. with the highest
+    sequence and correction numbers, whatever their order in the file.
+
+    :param source: an AIXM file, possibly zipped, or an open XML file
+    :param types: the feature types to return (by default, all the types
+        in :data:`FEATURES`)
+    """
+    if isinstance(source, (str, Path)):
+        for fh in _open(source):
+            yield from features(fh, types)
+        return
+
+    types = set(types if types is not None else FEATURES)
+    root: None | ElementTree.Element = None
+    for event, element in ElementTree.iterparse(source, ("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            continue
+        if not element.tag.endswith("}hasMember"):
+            continue
+        for feature in element:
+            kind = feature.tag.split("}")[-1]
+            if kind not in types:
+                continue
+            baseline = [
+                ts
+                for ts in feature.iterfind("{*}timeSlice/*")
+                if _find(ts, "interpretation") == "BASELINE"
+            ]
+            identifier = _find(feature, "identifier")
+            if not baseline or identifier is None:
+                continue
+            values = _values(kind, max(baseline, key=_version))
+            yield kind, {"identifier": identifier, **values}
+        # members already parsed are not kept in memory
+        assert root is not None
+        root.clear()
+
+
+class AIXMStore:
+    """Indexed local storage of AIXM features, in a SQLite database.
+
+    Each feature type of :data:`FEATURES` has its own table, indexed by
+    designator. The files added to the store are recorded (by name, size
+    and modification time): adding them again is immediate, unless they
+    changed.
+
+    :param path: the database file, created if necessary
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS sources ("
+                "name TEXT PRIMARY KEY, size INTEGER, mtime REAL)"
+            )
+            for feature in FEATURES:
+                names = columns(feature)
+                self._db.execute(
+                    f"CREATE TABLE IF NOT EXISTS {feature} ("
+                    "identifier TEXT PRIMARY KEY, source TEXT, "
+                    + ", ".join(names[1:])
+                    + ")"
+                )
+                for column in ("designator", *INDEXES.get(feature, ())):
+                    self._db.execute(
+                        f"CREATE INDEX IF NOT EXISTS {feature}_{column} "
+                        f"ON {feature} ({column})"
+                    )
+
+    def __enter__(self) -> AIXMStore:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def add(
+        self,
+        paths: Iterable[str | Path],
+        force: bool = False,
+        batch_size: int = 10_000,
+    ) -> int:
+        """Stores the features of AIXM files, returns how many were stored.
+
+        Features of a file previously added are replaced by the content of
+        the new version of the file.
+
+        :param paths: AIXM files, possibly zipped
+        :param force: parse files even if they did not change
+        :param batch_size: the number of features inserted at once
+        """
+        count = 0
+        for path in map(Path, paths):
+            stat = path.stat()
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT size, mtime FROM sources WHERE name = ?",
+                    (path.name,),
+                ).fetchone()
+            if not force and row is not None:
+                if tuple(row) == (stat.st_size, stat.st_mtime):
+                    continue
+            _log.info(f"index {path}")
+            count += self._add(path, stat.st_size, stat.st_mtime, batch_size)
+        return count
+
+    def _add(self, path: Path, size: int, mtime: float, batch_size: int) -> int:
+        count = 0
+        batches: dict[str, list[dict[str, Any]]] = {f: [] for f in FEATURES}
+
+        def flush(feature: str) -> None:
+            names = columns(feature)
+            self._db.executemany(
+                f"INSERT OR REPLACE INTO {feature} (source, {', '.join(names)})"
+                f" VALUES (?, {', '.join('?' * len(names))})",
+                (
+                    (path.name, *(values[n] for n in names))
+                    for values in batches[feature]
+                ),
+            )
+            batches[feature].clear()
+
+        with self._lock, self._db:
+            for feature in FEATURES:
+                self._db.execute(
+                    f"DELETE FROM {feature} WHERE source = ?", (path.name,)
+                )
+            for feature, values in features(path):
+                batches[feature].append(values)
+                count += 1
+                if len(batches[feature]) >= batch_size:
+                    flush(feature)
+            for feature in FEATURES:
+                flush(feature)
+            self._db.execute(
+                "INSERT OR REPLACE INTO sources VALUES (?, ?, ?)",
+                (path.name, size, mtime),
+            )
+        return count
+
+    def get(self, feature: str, designator: str) -> list[dict[str, Any]]:
+        """The features of a given type with a given designator, e.g.
+        ``store.get("Airspace", "LFBBBDX")``.
+
+        Designators are not unique for all feature types, e.g. navaids.
+        """
+        if feature not in FEATURES:
+            raise ValueError(f"Unknown feature type: {feature}")
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT * FROM {feature} WHERE designator = ?", (designator,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def __getitem__(self, identifier: str) -> dict[str, Any]:
+        """A feature of any type, by identifier (e.g. references in route
+        segments)."""
+        with self._lock:
+            for feature in FEATURES:
+                row = self._db.execute(
+                    f"SELECT * FROM {feature} WHERE identifier = ?",
+                    (identifier,),
+                ).fetchone()
+                if row is not None:
+                    return {"feature": feature, **dict(row)}
+        raise KeyError(identifier)
+
+    def data(self, feature: str) -> pd.DataFrame:
+        """All the features of a given type."""
+        import pandas as pd
+
+        if feature not in FEATURES:
+            raise ValueError(f"Unknown feature type: {feature}")
+        with self._lock:
+            return pd.read_sql_query(f"SELECT * FROM {feature}", self._db)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(
+                self._db.execute(f"SELECT COUNT(*) FROM {feature}").fetchone()[
+                    0
+                ]
+                for feature in FEATURES
+            )
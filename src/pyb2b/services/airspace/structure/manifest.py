@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, TypedDict
+
+from ....types.generated.common import File
+
+
+class ManifestEntry(TypedDict):
+    path: str  # relative to the output directory
+    fileLength: int
+    releaseTime: None | str
+    sha256: str
+
+
+def sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        while chunk := fh.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def update_key(update_id: str) -> tuple[tuple[int, str], ...]:
+    """Sort key of update identifiers, compared part by part as numbers:
+    ``"2401.2" < "2401.10"``."""
+    return tuple(
+        (int(part), "") if part.isdigit() else (-1, part)
+        for part in update_id.split(".")
+    )
+
+
+class Manifest:
+    """The files downloaded for one update of an AIXM dataset.
+
+    The manifest is a JSON file stored next to the files, e.g.
+    ``manifest_2401_2401.1.json``, updated after each completed file, so
+    that an interrupted download can be resumed, and existing files
+    checked against their length and SHA-256 digest.
+
+    Manifests of previous updates of the same AIRAC cycle are kept: files
+    which did not change since then are not downloaded again (see
+    :meth:`reuse`).
+
+    :param output_dir: the directory of the downloaded files
+    :param airac: the AIRAC cycle of the dataset
+    :param update_id: the ``updateId`` of the dataset summary
+    """
+
+    def __init__(
+        self, output_dir: str | Path, airac: str, update_id: str
+    ) -> None:
+        self.output_dir = Path(output_dir)
+        self.airac = airac
+        self.update_id = update_id
+        self.summary: dict[str, Any] = {}
+        self.files: dict[str, ManifestEntry] = {}
+        # Files found on disk without a manifest are adopted, e.g. when
+        # downloaded by previous versions; not if the AIRAC cycle has
+        # already been updated, as they could be outdated.
+        self.adopt = not any(self.pattern(self.output_dir, airac))
+        if self.path.exists():
+            content = json.loads(self.path.read_text())
+            self.summary = content.get("summary", {})
+            self.files = content.get("files", {})
+
+    def __repr__(self) -> str:
+        return f"Manifest({self.airac!r}, {self.update_id!r})"
+
+    @staticmethod
+    def pattern(output_dir: Path, airac: str) -> Iterable[Path]:
+        return output_dir.glob(f"manifest_{airac}_*.json")
+
+    @classmethod
+    def updates(cls, output_dir: str | Path, airac: str) -> list[Manifest]:
+        """The manifests of all updates downloaded for an AIRAC cycle."""
+        prefix = f"manifest_{airac}_"
+        return sorted(
+            (
+                cls(output_dir, airac, path.stem[len(prefix) :])
+                for path in cls.pattern(Path(output_dir), airac)
+            ),
+            key=lambda manifest: update_key(manifest.update_id),
+        )
+
+    @property
+    def path(self) -> Path:
+        return self.output_dir / f"manifest_{self.airac}_{self.update_id}.json"
+
+    def save(self) -> None:
+        content = {
+            "airac": self.airac,
+            "updateId": self.update_id,
+            "summary": self.summary,
+            "files": self.files,
+        }
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(content, indent=2))
+        os.replace(tmp, self.path)
+
+    def add(self, file: File, path: Path, digest: str) -> None:
+        """Records a completed file, and saves the manifest."""
+        self.files[file["id"]] = {
+            "path": path.relative_to(self.output_dir).as_posix(),
+            "fileLength": int(file["fileLength"]),
+            "releaseTime": file.get("releaseTime", None),
+            "sha256": digest,
+        }
+        self.save()
+
+    def check(self, file: File, digest: bool = False) -> bool:
+        """Returns True if the file is recorded and complete on disk.
+
+        :param digest: also compare the SHA-256 digest of the file (slower)
+        """
+        entry = self.files.get(file["id"], None)
+        if entry is None or not _same(entry, file):
+            return False
+        path = self.output_dir / entry["path"]
+        if not path.exists() or path.stat().st_size != entry["fileLength"]:
+            return False
+        return not digest or sha256(path) == entry["sha256"]
+
+    def reuse(self, files: Iterable[File], previous: Iterable[Manifest]) -> int:
+        """Records the files unchanged since previous updates.
+
+        A file is unchanged if a previous update lists the same ``id``,
+        ``releaseTime`` and ``fileLength``, and the file is still complete
+        on disk. Returns the number of files reused.
+        """
+        count = 0
+        previous = list(previous)
+        for file in files:
+            if file["id"] in self.files:
+                continue
+            for manifest in reversed(previous):
+                if manifest.check(file):
+                    self.files[file["id"]] = manifest.files[file["id"]]
+                    count += 1
+                    break
+        if count:
+            self.save()
+        return count
+
+
+def _same(entry: ManifestEntry, file: File) -> bool:
+    return entry["fileLength"] == int(file["fileLength"]) and entry[
+        "releaseTime"
+    ] == file.get("releaseTime", None)
@@ -3,11 +3,14 @@ from .flightlistbyairspace import FlightListByAirspace, _FlightListByAirspace
 from .flightlistbymeasure import FlightListByMeasure, _FlightListByMeasure
 from .flightplanlist import FlightPlanList, _FlightPlanList
 from .flightretrieval import FlightRetrieval, _FlightRetrieval
+from .watcher import FlightListDelta, FlightListWatcher
 
 __all__ = [
     "FlightListByAerodrome",
     "FlightListByAirspace",
     "FlightListByMeasure",
+    "FlightListDelta",
+    "FlightListWatcher",
     "FlightPlanList",
     "FlightRetrieval",
     "_FlightListByAerodrome",
@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, ClassVar, TypeVar
+
+import httpx
+
+from ....concurrency import run_sync
+from ....exceptions import ReplyError
+from ....frames import DATETIME_MINUTE, Path, extract, to_frame, walk
+from ....mixins import DataFrameMixin, JSONMixin
+from ....types.generated import decoders
+from ....types.generated.common import Reply
+from ....types.generated.flight import Flight, FlightField
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from ....types.structs import Struct
+
+    Window = tuple[pd.Timestamp, pd.Timestamp]
+
+R = TypeVar("R", bound=Reply)
+
+_log = logging.getLogger(__name__)
+
+record_path = ("data", "flights")
+
+
+# Columns always present, identifying the flight
+flight_columns: dict[str, Path] = {
+    "flightId": ("flightId", "id"),
+    "callsign": ("flightId", "keys", "aircraftId"),
+    "origin": ("flightId", "keys", "aerodromeOfDeparture"),
+    "destination": ("flightId", "keys", "aerodromeOfDestination"),
+    "EOBT": ("flightId", "keys", "estimatedOffBlockTime"),
+}
+
+# Flight fields with a structure, reduced to their most relevant value
+nested_fields: dict[str, Path] = {
+    "iataFlightDesignator": ("iataFlightDesignator", "id"),
+    "requestedFlightLevel": ("requestedFlightLevel", "level"),
+    "requestedInitialFlightLevel": ("requestedInitialFlightLevel", "level"),
+}
+
+# Flight fields of type common.DateTimeMinute
+time_fields: dict[str, str] = {
+    "EOBT": DATETIME_MINUTE,
+    **decoders.time_fields["flight.Flight"],
+}
+
+categorical_fields: list[str] = [
+    "origin",
+    "destination",
+    "aircraftType",
+    "aircraftOperator",
+    "operatingAircraftOperator",
+    "divertedAerodromeOfDestination",
+    "flightState",
+    "wakeTurbulenceCategory",
+    "mostPenalisingRegulation",
+]
+
+numeric_fields: list[str] = [
+    "requestedFlightLevel",
+    "requestedInitialFlightLevel",
+]
+
+
+class FlightList(DataFrameMixin, JSONMixin[R]):
+    """Common structure of replies to flight list requests.
+
+    The ``data`` property flattens the requested flight fields into
+    columns.
+    """
+
+    fields: ClassVar[list[FlightField]] = []
+    records: ClassVar[tuple[str, ...]] = record_path
+
+    def __init__(
+        self,
+        json: R,
+        fields: None | list[FlightField] = None,
+    ) -> None:
+        decoders.decode_common_Reply(json)
+        decoders.decode_flight_FlightListReplyData(json.get("data", None))
+        self.json = json
+        if fields is not None:
+            self.fields = fields  # type: ignore
+
+    def _arguments(self) -> dict[str, Any]:
+        return {"fields": list(self.fields)}
+
+    def _build_data(self) -> pd.DataFrame:
+        data: Any = self.json.get("data", None)
+        flights = data.get("flights", []) if data is not None else []
+        paths: dict[str, Path] = {
+            **flight_columns,
+            **{
+                field: nested_fields.get(field, (field,))
+                for field in self.fields
+            },
+        }
+        columns = extract(
+            (
+                flight
+                for entry in flights
+                if (flight := entry.get("flight", None))
+            ),
+            paths,
+        )
+        return to_frame(
+            columns,
+            times=time_fields,
+            categories=categorical_fields,
+            numeric=numeric_fields,
+        ).sort_values("EOBT", kind="stable", ignore_index=True)
+
+    def decode(self) -> list[Struct]:
+        """The flights, decoded into :class:`~pyb2b.types.structs.Struct`
+        instances with only the identification and the requested fields.
+        """
+        from ....types.structs import decoder
+
+        decode_flight = decoder(Flight, ["flightId", *self.fields])
+        data: Any = self.json.get("data", None)
+        flights = data.get("flights", []) if data is not None else []
+        return [
+            decode_flight(flight)
+            for entry in flights
+            if (flight := entry.get("flight", None))
+        ]
+
+
+def traffic_window(
+    start: None | str | pd.Timestamp,
+    stop: None | str | pd.Timestamp,
+) -> Window:
+    """Returns the traffic window (UTC), by default one hour from now."""
+    import pandas as pd
+
+    start = utc(start if start is not None else "now").floor("min")
+    if stop is not None:
+        stop = utc(stop).ceil("min")
+    else:
+        stop = start + pd.Timedelta("1h")
+    return start, stop
+
+
+def utc(timestamp: str | pd.Timestamp) -> pd.Timestamp:
+    """Naive timestamps are considered as UTC."""
+    import pandas as pd
+
+    timestamp = pd.Timestamp(timestamp)
+    if timestamp.tz is None:
+        return timestamp.tz_localize("utc")
+    return timestamp.tz_convert("utc")
+
+
+def split_window(
+    start: pd.Timestamp,
+    stop: pd.Timestamp,
+    shard: None | str | pd.Timedelta = None,
+) -> list[Window]:
+    """Splits a traffic window into consecutive windows of (at most) shard.
+
+    Without shard, the window is split in two halves.
+    """
+    import pandas as pd
+
+    if shard is None:
+        middle = start + ((stop - start) / 2).floor("min")
+        if middle <= start:
+            return [(start, stop)]
+        return [(start, middle), (middle, stop)]
+    # traffic windows are expressed with a one minute resolution
+    step = max(pd.Timedelta(shard).ceil("min"), pd.Timedelta("1min"))
+    bounds = list(pd.date_range(start, stop, freq=step))
+    if bounds[-1] < stop:
+        bounds.append(stop)
+    return list(itertools.pairwise(bounds))
+
+
+async def fetch_windows(
+    fetch: Callable[[pd.Timestamp, pd.Timestamp], Awaitable[Any]],
+    windows: list[Window],
+    concurrency: int,
+) -> list[Any]:
+    """Fetches flight lists over several traffic windows concurrently.
+
+    Windows for which NM answers TOO_MANY_RESULTS are bisected until they
+    fit (or cannot be split anymore). Replies are returned in the
+    chronological order of their windows.
+
+    :param fetch: the coroutine fetching the flight list over a window
+    :param concurrency: maximum number of simultaneous requests
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_window(start: pd.Timestamp, stop: pd.Timestamp) -> Any:
+        try:
+            async with semaphore:
+                return [await fetch(start, stop)]
+        except ReplyError as e:
+            halves = split_window(start, stop)
+            if e.status != "TOO_MANY_RESULTS" or len(halves) == 1:
+                raise
+        _log.info(f"Too many results between {start} and {stop}, bisecting")
+        results = await asyncio.gather(*(fetch_window(*w) for w in halves))
+        return [reply for result in results for reply in result]
+
+    results = await asyncio.gather(*(fetch_window(*w) for w in windows))
+    return [reply for result in results for reply in result]
+
+
+def merge_replies(replies: list[Any]) -> Any:
+    """Merges flight list replies over consecutive traffic windows.
+
+    Flights reported in several windows are only kept once, based on their
+    flightId.
+    """
+    if len(replies) == 1:
+        return replies[0]
+
+    flights: dict[Any, Any] = {}
+    for reply in replies:
+        data = reply.get("data", None) or {}
+        entries = data.get("flights", [])
+        for entry in entries if isinstance(entries, list) else [entries]:
+            key = walk(entry, ("flight", "flightId", "id"))
+            flights.setdefault(key if key is not None else id(entry), entry)
+
+    merged = dict(replies[0])
+    data = dict(merged.get("data", None) or {})
+    data["flights"] = list(flights.values())
+    first = walk(replies[0], ("data", "effectiveTrafficWindow"))
+    last = walk(replies[-1], ("data", "effectiveTrafficWindow"))
+    if first is not None and last is not None:
+        data["effectiveTrafficWindow"] = {**first, "unt": last.get("unt")}
+    merged["data"] = data
+    return merged
+
+
+class _FlightList:
+    """Common implementation of flight list requests over long windows."""
+
+    def _flightlist(
+        self,
+        request: Callable[[pd.Timestamp, pd.Timestamp], Any],
+        tag: str,
+        start: None | str | pd.Timestamp,
+        stop: None | str | pd.Timestamp,
+        shard: None | str | pd.Timedelta,
+        concurrency: int,
+    ) -> Any:
+        start, stop = traffic_window(start, stop)
+        windows = split_window(start, stop, shard)
+
+        if shard is None:
+            data = request(start, stop)
+            try:
+                reply = self.post(data, record_path)  # type: ignore
+                return reply[tag]
+            except ReplyError as e:
+                if e.status != "TOO_MANY_RESULTS" or len(windows) == 1:
+                    raise
+                _log.info(f"Too many results between {start} and {stop}")
+
+        async def fetch_all() -> Any:
+            async with self.new_async_client() as client:  # type: ignore
+                return await self._fetch_flightlist(
+                    client, request, tag, windows, concurrency
+                )
+
+        return run_sync(fetch_all())
+
+    async def _async_flightlist(
+        self,
+        client: None | httpx.AsyncClient,
+        request: Callable[[pd.Timestamp, pd.Timestamp], Any],
+        tag: str,
+        start: None | str | pd.Timestamp,
+        stop: None | str | pd.Timestamp,
+        shard: None | str | pd.Timedelta,
+        concurrency: int,
+    ) -> Any:
+        start, stop = traffic_window(start, stop)
+        windows = (
+            [(start, stop)]
+            if shard is None
+            else split_window(start, stop, shard)
+        )
+        return await self._fetch_flightlist(
+            client, request, tag, windows, concurrency
+        )
+
+    async def _fetch_flightlist(
+        self,
+        client: None | httpx.AsyncClient,
+        request: Callable[[pd.Timestamp, pd.Timestamp], Any],
+        tag: str,
+        windows: list[Window],
+        concurrency: int,
+    ) -> Any:
+        if client is None:
+            client = self.async_client  # type: ignore
+
+        async def fetch(start: pd.Timestamp, stop: pd.Timestamp) -> Any:
+            reply = await self.async_post(  # type: ignore
+                client, request(start, stop), record_path
+            )
+            return reply[tag]
+
+        return merge_replies(await fetch_windows(fetch, windows, concurrency))
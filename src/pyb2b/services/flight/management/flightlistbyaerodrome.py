@@ -1,10 +1,9 @@
-from typing import TypedDict
+from __future__ import annotations
 
-import httpx
+from typing import TYPE_CHECKING, TypedDict
 
-import pandas as pd
+import httpx
 
-from ....mixins import DataFrameMixin, JSONMixin
 from ....types.generated.airspace import AerodromeICAOId
 from ....types.generated.flight import (
     AerodromeRole,
@@ -12,6 +11,10 @@ from ....types.generated.flight import (
     FlightListByAerodromeReply,
     FlightListByAerodromeRequest,
 )
+from .flightlist import FlightList, _FlightList
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 Request = TypedDict(
     "Request", {"fl:FlightListByAerodromeRequest": FlightListByAerodromeRequest}
@@ -39,12 +42,11 @@ default_fields: list[FlightField] = [
 ]
 
 
-class FlightListByAerodrome(
-    DataFrameMixin, JSONMixin[FlightListByAerodromeReply]
-): ...
+class FlightListByAerodrome(FlightList[FlightListByAerodromeReply]):
+    fields = default_fields
 
 
-class _FlightListByAerodrome:
+class _FlightListByAerodrome(_FlightList):
     def flightlistbyaerodrome(
         self,
         aerodrome: AerodromeICAOId,
@@ -54,6 +56,8 @@ class _FlightListByAerodrome:
         include_proposal: bool = False,
         include_forecast: bool = True,
         fields: list[FlightField] = default_fields,
+        shard: None | str | pd.Timedelta = None,
+        concurrency: int = 4,
     ) -> FlightListByAerodrome:
         """Returns requested information about flights matching a criterion.
 
@@ -63,6 +67,10 @@ class _FlightListByAerodrome:
         :param stop: (UTC), by default one hour later
         :param fields: additional fields to request. By default, a set of
             (arguably) relevant fields are requested.
+        :param shard: split the traffic window into windows of this duration
+            (e.g. ``"1h"``), requested concurrently. Windows with too many
+            results are bisected in any case.
+        :param concurrency: maximum number of simultaneous requests
 
         **Example usage:**
 
@@ -72,21 +80,27 @@ class _FlightListByAerodrome:
             b2b.flightlistbyaerodrome(aerodrome="LFPG")
 
         """
-        request = self._flightlistbyaerodrome_request(
-            aerodrome,
-            aerodrome_role,
+        json = self._flightlist(
+            lambda wef, unt: self._flightlistbyaerodrome_request(
+                aerodrome,
+                aerodrome_role,
+                wef,
+                unt,
+                include_proposal,
+                include_forecast,
+                fields,
+            ),
+            "fl:FlightListByAerodromeReply",
             start,
             stop,
-            include_proposal,
-            include_forecast,
-            fields,
+            shard,
+            concurrency,
         )
-        reply = self.post(request)  # type: ignore
-        return FlightListByAerodrome(reply["fl:FlightListByAerodromeReply"])
+        return FlightListByAerodrome(json, fields)
 
     async def async_flightlistbyaerodrome(
         self,
-        client: httpx.AsyncClient,
+        client: None | httpx.AsyncClient,
         aerodrome: AerodromeICAOId,
         aerodrome_role: AerodromeRole = "GLOBAL",
         start: None | str | pd.Timestamp = None,
@@ -94,6 +108,8 @@ class _FlightListByAerodrome:
         include_proposal: bool = False,
         include_forecast: bool = True,
         fields: list[FlightField] = default_fields,
+        shard: None | str | pd.Timedelta = None,
+        concurrency: int = 4,
     ) -> FlightListByAerodrome:
         """Returns requested information about flights matching a criterion.
 
@@ -103,6 +119,10 @@ class _FlightListByAerodrome:
         :param stop: (UTC), by default one hour later
         :param fields: additional fields to request. By default, a set of
             (arguably) relevant fields are requested.
+        :param shard: split the traffic window into windows of this duration
+            (e.g. ``"1h"``), requested concurrently. Windows with too many
+            results are bisected in any case.
+        :param concurrency: maximum number of simultaneous requests
 
         **Example usage:**
 
@@ -112,38 +132,38 @@ class _FlightListByAerodrome:
             b2b.flight_list(aerodrome="LFPG")
 
         """
-        request = self._flightlistbyaerodrome_request(
-            aerodrome,
-            aerodrome_role,
+        json = await self._async_flightlist(
+            client,
+            lambda wef, unt: self._flightlistbyaerodrome_request(
+                aerodrome,
+                aerodrome_role,
+                wef,
+                unt,
+                include_proposal,
+                include_forecast,
+                fields,
+            ),
+            "fl:FlightListByAerodromeReply",
             start,
             stop,
-            include_proposal,
-            include_forecast,
-            fields,
+            shard,
+            concurrency,
         )
-        reply = await self.async_post(client, request)  # type: ignore
-        return FlightListByAerodrome(reply["fl:FlightListByAerodromeReply"])
+        return FlightListByAerodrome(json, fields)
 
     def _flightlistbyaerodrome_request(
         self,
         aerodrome: AerodromeICAOId,
         aerodrome_role: AerodromeRole,
-        start: None | str | pd.Timestamp,
-        stop: None | str | pd.Timestamp,
+        start: pd.Timestamp,
+        stop: pd.Timestamp,
         include_proposal: bool,
         include_forecast: bool,
         fields: list[FlightField],
     ) -> Request:
+        import pandas as pd
+
         now = pd.Timestamp("now", tz="utc")
-        if start is not None:
-            start = pd.Timestamp(start, tz="utc")
-        else:
-            start = now
-
-        if stop is not None:
-            stop = pd.Timestamp(stop, tz="utc")
-        else:
-            stop = start + pd.Timedelta("1h")
 
         # Many fields specified as necessary but cause errors 🤷‍♂️
         request: FlightListByAerodromeRequest = {  # type: ignore
@@ -1,16 +1,19 @@
-from typing import TypedDict
+from __future__ import annotations
 
-import httpx
+from typing import TYPE_CHECKING, TypedDict
 
-import pandas as pd
+import httpx
 
-from ....mixins import DataFrameMixin, JSONMixin
 from ....types.generated.airspace import AirspaceId
 from ....types.generated.flight import (
     FlightField,
     FlightListByAirspaceReply,
     FlightListByAirspaceRequest,
 )
+from .flightlist import FlightList, _FlightList
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 Request = TypedDict(
     "Request", {"fl:FlightListByAirspaceRequest": FlightListByAirspaceRequest}
@@ -37,13 +40,11 @@ default_fields: list[FlightField] = [
 ]
 
 
-class FlightListByAirspace(
-    DataFrameMixin, JSONMixin[FlightListByAirspaceReply]
-):
-    ...
+class FlightListByAirspace(FlightList[FlightListByAirspaceReply]):
+    fields = default_fields
 
 
-class _FlightListByAirspace:
+class _FlightListByAirspace(_FlightList):
     def flightlistbyairspace(
         self,
         airspace: AirspaceId,
@@ -52,6 +53,8 @@ class _FlightListByAirspace:
         include_proposal: bool = False,
         include_forecast: bool = True,
         fields: list[FlightField] = default_fields,
+        shard: None | str | pd.Timedelta = None,
+        concurrency: int = 4,
     ) -> FlightListByAirspace:
         """Returns requested information about flights matching a criterion.
 
@@ -60,6 +63,10 @@ class _FlightListByAirspace:
         :param stop: (UTC), by default one hour later
         :param fields: additional fields to request. By default, a set of
             (arguably) relevant fields are requested.
+        :param shard: split the traffic window into windows of this duration
+            (e.g. ``"1h"``), requested concurrently. Windows with too many
+            results are bisected in any case.
+        :param concurrency: maximum number of simultaneous requests
 
         **Example usage:**
 
@@ -69,26 +76,34 @@ class _FlightListByAirspace:
             b2b.flightlistbyairspace(airspace="LFBBBDX")
 
         """
-        request = self._flightlistbyairspace_request(
-            airspace,
+        json = self._flightlist(
+            lambda wef, unt: self._flightlistbyairspace_request(
+                airspace,
+                wef,
+                unt,
+                include_proposal,
+                include_forecast,
+                fields,
+            ),
+            "fl:FlightListByAirspaceReply",
             start,
             stop,
-            include_proposal,
-            include_forecast,
-            fields,
+            shard,
+            concurrency,
         )
-        reply = self.post(request)  # type: ignore
-        return FlightListByAirspace(reply["fl:FlightListByAirspaceReply"])
+        return FlightListByAirspace(json, fields)
 
     async def async_flightlistbyairspace(
         self,
-        client: httpx.AsyncClient,
+        client: None | httpx.AsyncClient,
         airspace: AirspaceId,
         start: None | str | pd.Timestamp = None,
         stop: None | str | pd.Timestamp = None,
         include_proposal: bool = False,
         include_forecast: bool = True,
         fields: list[FlightField] = default_fields,
+        shard: None | str | pd.Timedelta = None,
+        concurrency: int = 4,
     ) -> FlightListByAirspace:
         """Returns requested information about flights matching a criterion.
 
@@ -97,6 +112,10 @@ class _FlightListByAirspace:
         :param stop: (UTC), by default one hour later
         :param fields: additional fields to request. By default, a set of
             (arguably) relevant fields are requested.
+        :param shard: split the traffic window into windows of this duration
+            (e.g. ``"1h"``), requested concurrently. Windows with too many
+            results are bisected in any case.
+        :param concurrency: maximum number of simultaneous requests
 
         **Example usage:**
 
@@ -106,34 +125,36 @@ class _FlightListByAirspace:
             b2b.flight_list(aerodrome="LFPG")
 
         """
-        request = self._flightlistbyairspace_request(
-            airspace,
+        json = await self._async_flightlist(
+            client,
+            lambda wef, unt: self._flightlistbyairspace_request(
+                airspace,
+                wef,
+                unt,
+                include_proposal,
+                include_forecast,
+                fields,
+            ),
+            "fl:FlightListByAirspaceReply",
             start,
             stop,
-            include_proposal,
-            include_forecast,
-            fields,
+            shard,
+            concurrency,
         )
-        reply = await self.async_post(client, request)  # type: ignore
-        return FlightListByAirspace(reply["fl:FlightListByAirspaceReply"])
+        return FlightListByAirspace(json, fields)
 
     def _flightlistbyairspace_request(
         self,
         airspace: AirspaceId,
-        start: None | str | pd.Timestamp,
-        stop: None | str | pd.Timestamp,
+        start: pd.Timestamp,
+        stop: pd.Timestamp,
         include_proposal: bool,
         include_forecast: bool,
         fields: list[FlightField],
     ) -> Request:
-        now = pd.Timestamp("now", tz="utc")
-        if start is not None:
-            start = pd.Timestamp(start, tz="utc")
+        import pandas as pd
 
-        if stop is not None:
-            stop = pd.Timestamp(stop, tz="utc")
-        else:
-            stop = start + pd.Timedelta("1H")
+        now = pd.Timestamp("now", tz="utc")
 
         # Many fields specified as necessary but cause errors 🤷‍♂️
         request: FlightListByAirspaceRequest = {  # type: ignore
@@ -1,10 +1,9 @@
-from typing import TypedDict
+from __future__ import annotations
 
-import httpx
+from typing import TYPE_CHECKING, TypedDict
 
-import pandas as pd
+import httpx
 
-from ....mixins import DataFrameMixin, JSONMixin
 from ....types.generated.flight import (
     FlightField,
     FlightListByMeasureMode,
@@ -12,6 +11,10 @@ from ....types.generated.flight import (
     FlightListByMeasureRequest,
 )
 from ....types.generated.flow import MeasureId, RegulationId, ReroutingId
+from .flightlist import FlightList, _FlightList
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 Request = TypedDict(
     "Request", {"fl:FlightListByMeasureRequest": FlightListByMeasureRequest}
@@ -38,12 +41,11 @@ default_fields: list[FlightField] = [
 ]
 
 
-class FlightListByMeasure(
-    DataFrameMixin, JSONMixin[FlightListByMeasureReply]
-): ...
+class FlightListByMeasure(FlightList[FlightListByMeasureReply]):
+    fields = default_fields
 
 
-class _FlightListByMeasure:
+class _FlightListByMeasure(_FlightList):
     def flightlistbymeasure(
         self,
         start: None | str | pd.Timestamp = None,
@@ -55,6 +57,8 @@ class _FlightListByMeasure:
         include_proposal: bool = False,
         include_forecast: bool = True,
         fields: list[FlightField] = default_fields,
+        shard: None | str | pd.Timedelta = None,
+        concurrency: int = 4,
     ) -> FlightListByMeasure:
         """Returns requested information about flights matching a criterion.
 
@@ -63,6 +67,10 @@ class _FlightListByMeasure:
         :param stop: (UTC), by default one hour later
         :param fields: additional fields to request. By default, a set of
             (arguably) relevant fields are requested.
+        :param shard: split the traffic window into windows of this duration
+            (e.g. ``"1h"``), requested concurrently. Windows with too many
+            results are bisected in any case.
+        :param concurrency: maximum number of simultaneous requests
 
         **Example usage:**
 
@@ -72,22 +80,28 @@ class _FlightListByMeasure:
             b2b.flightlistbyairspace(airspace="LFBBBDX")
 
         """
-        request = self._flightlistbymeasure_request(
-            regulation,
-            rerouting,
-            mode,
+        json = self._flightlist(
+            lambda wef, unt: self._flightlistbymeasure_request(
+                regulation,
+                rerouting,
+                mode,
+                wef,
+                unt,
+                include_proposal,
+                include_forecast,
+                fields,
+            ),
+            "fl:FlightListByMeasureReply",
             start,
             stop,
-            include_proposal,
-            include_forecast,
-            fields,
+            shard,
+            concurrency,
         )
-        reply = self.post(request)  # type: ignore
-        return FlightListByMeasure(reply["fl:FlightListByMeasureReply"])
+        return FlightListByMeasure(json, fields)
 
     async def async_flightlistbymeasure(
         self,
-        client: httpx.AsyncClient,
+        client: None | httpx.AsyncClient,
         regulation: None | RegulationId = None,
         rerouting: None | ReroutingId = None,
         mode: FlightListByMeasureMode = "CONCERNED_BY_MEASURE",
@@ -96,6 +110,8 @@ class _FlightListByMeasure:
         include_proposal: bool = False,
         include_forecast: bool = True,
         fields: list[FlightField] = default_fields,
+        shard: None | str | pd.Timedelta = None,
+        concurrency: int = 4,
     ) -> FlightListByMeasure:
         """Returns requested information about flights matching a criterion.
 
@@ -104,6 +120,10 @@ class _FlightListByMeasure:
         :param stop: (UTC), by default one hour later
         :param fields: additional fields to request. By default, a set of
             (arguably) relevant fields are requested.
+        :param shard: split the traffic window into windows of this duration
+            (e.g. ``"1h"``), requested concurrently. Windows with too many
+            results are bisected in any case.
+        :param concurrency: maximum number of simultaneous requests
 
         **Example usage:**
 
@@ -113,38 +133,40 @@ class _FlightListByMeasure:
             b2b.flightlistbyairspace(airspace="LFBBBDX")
 
         """
-        request = self._flightlistbymeasure_request(
-            regulation,
-            rerouting,
-            mode,
+        json = await self._async_flightlist(
+            client,
+            lambda wef, unt: self._flightlistbymeasure_request(
+                regulation,
+                rerouting,
+                mode,
+                wef,
+                unt,
+                include_proposal,
+                include_forecast,
+                fields,
+            ),
+            "fl:FlightListByMeasureReply",
             start,
             stop,
-            include_proposal,
-            include_forecast,
-            fields,
+            shard,
+            concurrency,
         )
-        reply = await self.async_post(client, request)  # type: ignore
-        return FlightListByMeasure(reply["fl:FlightListByMeasureReply"])
+        return FlightListByMeasure(json, fields)
 
     def _flightlistbymeasure_request(
         self,
         regulation: None | RegulationId,
         rerouting: None | ReroutingId,
         mode: FlightListByMeasureMode,
-        start: None | str | pd.Timestamp,
-        stop: None | str | pd.Timestamp,
+        start: pd.Timestamp,
+        stop: pd.Timestamp,
         include_proposal: bool,
         include_forecast: bool,
         fields: list[FlightField],
     ) -> Request:
-        now = pd.Timestamp("now", tz="utc")
-        if start is not None:
-            start = pd.Timestamp(start, tz="utc")
+        import pandas as pd
 
-        if stop is not None:
-            stop = pd.Timestamp(stop, tz="utc")
-        else:
-            stop = start + pd.Timedelta("1H")
+        now = pd.Timestamp("now", tz="utc")
 
         msg = "One of regulation and rerouting must be defined"
         if regulation is None and rerouting is None:
@@ -1,26 +1,32 @@
 from __future__ import annotations
 
-from typing import Any, ClassVar, TypedDict
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict
 
 import httpx
 
-import pandas as pd
-
+from ....frames import DATETIME_MINUTE, extract, to_frame, walk
 from ....mixins import DataFrameMixin, JSONMixin
+from ....types.generated import decoders
 from ....types.generated.flight import (
     FlightPlanListReply,
     FlightPlanListRequest,
-    FlightPlanOrInvalidFiling,
 )
 from .flightretrieval import FlightRetrieval
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 Request = TypedDict(
     "Request", {"fl:FlightPlanListRequest": FlightPlanListRequest}
 )
 Reply = TypedDict("Reply", {"fl:FlightPlanListReply": FlightPlanListReply})
 
+record_path = ("data", "summaries")
+
 
 class FlightPlanList(DataFrameMixin, JSONMixin[FlightPlanListReply]):
+    records: ClassVar[tuple[str, ...]] = record_path
+
     columns_options: ClassVar[None | dict[str, dict[str, Any]]] = dict(
         flightId=dict(style="blue bold"),
         callsign=dict(),
@@ -36,40 +42,51 @@ class FlightPlanList(DataFrameMixin, JSONMixin[FlightPlanListReply]):
         parent: None | _FlightPlanList = None,
     ):
         self.parent = parent
-        self.json = json
-
-    @property
-    def data(self) -> pd.DataFrame:
-        def eobt(entry: FlightPlanOrInvalidFiling) -> str:
-            if lfvp := entry.get("lastValidFlightPlan", None):
-                return lfvp["id"]["keys"]["estimatedOffBlockTime"]
-            return ""
-
-        summaries = self.json["data"]["summaries"]
-        if not isinstance(summaries, list):
-            summaries = [summaries]
-        summaries = sorted(summaries, key=eobt)
-        return pd.DataFrame.from_records(
+        self.json = decoders.decode_flight_FlightPlanListReply(json)
+
+    def _build_data(self) -> pd.DataFrame:
+        # e.g. <data/>, parsed as None, when no flight plan matches
+        summaries = walk(self.json, ("data", "summaries")) or []
+        columns = extract(
+            (
+                lvfp
+                for entry in summaries
+                if (lvfp := entry.get("lastValidFlightPlan", None))
+            ),
             {
-                "flightId": lvfp["id"]["id"],
-                "callsign": lvfp["id"]["keys"]["aircraftId"],
-                "origin": lvfp["id"]["keys"]["aerodromeOfDeparture"],
-                "destination": lvfp["id"]["keys"]["aerodromeOfDestination"],
-                "EOBT": pd.Timestamp(eobt_str, tz="utc")
-                if (eobt_str := eobt(entry))
-                else pd.Timestamp("NaT"),
-                "status": lvfp["status"],
-            }
-            for entry in summaries
-            if (lvfp := entry.get("lastValidFlightPlan", None))
+                "flightId": ("id", "id"),
+                "callsign": ("id", "keys", "aircraftId"),
+                "origin": ("id", "keys", "aerodromeOfDeparture"),
+                "destination": ("id", "keys", "aerodromeOfDestination"),
+                "EOBT": ("id", "keys", "estimatedOffBlockTime"),
+                "status": ("status",),
+            },
         )
+        return to_frame(
+            columns,
+            times={"EOBT": DATETIME_MINUTE},
+            categories=["origin", "destination", "status"],
+        ).sort_values("EOBT", kind="stable", ignore_index=True)
+
+    _index_cache: None | tuple[pd.DataFrame, dict[str, int]] = None
+
+    @property
+    def index(self) -> dict[str, int]:
+        """Maps each flightId to its (first) row in ``data``."""
+        data = self.data
+        cache = self._index_cache
+        if cache is None or cache[0] is not data:
+            index: dict[str, int] = {}
+            for i, flight_id in enumerate(data["flightId"]):
+                index.setdefault(flight_id, i)
+            cache = self._index_cache = (data, index)
+        return cache[1]
 
     def __getitem__(self, item: str) -> None | FlightRetrieval:
-        handle = next(
-            (df for _, df in self.data.iterrows() if df.flightId == item), None
-        )
-        if handle is None:
+        row = self.index.get(item, None)
+        if row is None:
             return None
+        handle = self.data.iloc[row]
         return self.parent.flightretrieval(  # type: ignore
             EOBT=handle.EOBT,
             callsign=handle.callsign,
@@ -114,12 +131,12 @@ class _FlightPlanList:
             origin=origin,
             destination=destination,
         )
-        reply: Reply = self.post(request)  # type: ignore
+        reply: Reply = self.post(request, record_path)  # type: ignore
         return FlightPlanList(reply["fl:FlightPlanListReply"], parent=self)
 
     async def async_flightplanlist(
         self,
-        client: httpx.AsyncClient,
+        client: None | httpx.AsyncClient,
         start: None | str | pd.Timestamp = None,
         stop: None | str | pd.Timestamp = None,
         *,
@@ -153,7 +170,9 @@ class _FlightPlanList:
             origin=origin,
             destination=destination,
         )
-        reply: Reply = await self.async_post(client, request)  # type: ignore
+        reply: Reply = await self.async_post(  # type: ignore
+            client, request, record_path
+        )
         return FlightPlanList(reply["fl:FlightPlanListReply"], parent=self)
 
     def _flightplanlist_request(
@@ -165,6 +184,8 @@ class _FlightPlanList:
         origin: None | str = None,
         destination: None | str = None,
     ) -> Request:
+        import pandas as pd
+
         if start is not None:
             start = pd.Timestamp(start, tz="utc")
 
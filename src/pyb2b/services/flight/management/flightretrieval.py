@@ -1,23 +1,57 @@
-from typing import TypedDict
+from __future__ import annotations
 
-import httpx
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, TypedDict
 
-import pandas as pd
+import httpx
 
-from ....mixins import JSONMixin
+from ....concurrency import run_sync
+from ....frames import DATETIME_MINUTE, to_datetime
+from ....mixins import DataFrameMixin, JSONMixin
 from ....types.generated.flight import (
+    Flight,
     FlightField,
     FlightRetrievalReply,
     FlightRetrievalRequest,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from ....types.structs import Struct
+
 Request = TypedDict(
     "Request", {"fl:FlightRetrievalRequest": FlightRetrievalRequest}
 )
 Reply = TypedDict("Reply", {"fl:FlightRetrievalReply": FlightRetrievalReply})
 
+_log = logging.getLogger(__name__)
+
+# Columns identifying a flight, expected in flightretrieval_many()
+key_columns = ["EOBT", "callsign", "origin", "destination"]
+
 
 class FlightRetrieval(JSONMixin[FlightRetrievalReply]):
+    _flight_cache: None | tuple[Any, Struct] = None
+
+    @property
+    def flight(self) -> Struct:
+        """The flight, decoded into a :class:`~pyb2b.types.structs.Struct`.
+
+        Fields are accessed as attributes, e.g.
+        ``flight.flightId.keys.aircraftId``, and are None when absent. The
+        flight is decoded once per instance.
+        """
+        from ....types.structs import decode
+
+        json = self.json
+        cache = self._flight_cache
+        if cache is None or cache[0] is not json:
+            flight = json["data"]["flight"]
+            cache = self._flight_cache = (json, decode(flight, Flight))
+        return cache[1]
+
     @property
     def callsign(self) -> str:
         return self.json["data"]["flight"]["flightId"]["keys"]["aircraftId"]
@@ -39,36 +73,29 @@ class FlightRetrieval(JSONMixin[FlightRetrievalReply]):
         return self.json["data"]["flight"]["icaoRoute"]
 
     def time_indicators(self) -> pd.DataFrame:
+        import pandas as pd
+
         flight = self.json["data"]["flight"]
-        return (
-            pd.DataFrame.from_dict(
-                {
-                    "key": [
-                        "EOBT",
-                        "ETOT",
-                        "ETOA",
-                        "COBT",
-                        "CTOT",
-                        "CTOA",
-                        "AOBT",
-                        "ATOT",
-                        "ATOA",
-                    ],
-                    "value": [
-                        flight["flightId"]["keys"]["estimatedOffBlockTime"],
-                        flight.get("estimatedTakeOffTime", None),
-                        flight.get("estimatedTimeOfArrival", None),
-                        flight.get("calculatedOffBlockTime", None),
-                        flight.get("calculatedTakeOffTime", None),
-                        flight.get("calculatedTimeOfArrival", None),
-                        flight.get("actualOffBlockTime", None),
-                        flight.get("actualTakeOffTime", None),
-                        flight.get("actualTimeOfArrival", None),
-                    ],
-                }
-            )
-            .dropna()
-            .eval("value = @pd.to_datetime(value, utc=True)")
+        values = {
+            "EOBT": flight["flightId"]["keys"]["estimatedOffBlockTime"],
+            "ETOT": flight.get("estimatedTakeOffTime", None),
+            "ETOA": flight.get("estimatedTimeOfArrival", None),
+            "COBT": flight.get("calculatedOffBlockTime", None),
+            "CTOT": flight.get("calculatedTakeOffTime", None),
+            "CTOA": flight.get("calculatedTimeOfArrival", None),
+            "AOBT": flight.get("actualOffBlockTime", None),
+            "ATOT": flight.get("actualTakeOffTime", None),
+            "ATOA": flight.get("actualTimeOfArrival", None),
+        }
+        index = [i for i, v in enumerate(values.values()) if v is not None]
+        keys = list(values)
+        times = [v for v in values.values() if v is not None]
+        return pd.DataFrame(
+            {
+                "key": [keys[i] for i in index],
+                "value": to_datetime(times, DATETIME_MINUTE),
+            },
+            index=index,
         )
 
 
@@ -123,7 +150,7 @@ class _FlightRetrieval:
 
     async def async_flightretrieval(
         self,
-        client: httpx.AsyncClient,
+        client: None | httpx.AsyncClient,
         EOBT: str | pd.Timestamp,
         callsign: str,
         origin: str,
@@ -148,6 +175,76 @@ class _FlightRetrieval:
         reply = await self.async_post(client, request)  # type: ignore
         return FlightRetrieval(reply["fl:FlightRetrievalReply"])
 
+    def flightretrieval_many(
+        self,
+        flights: DataFrameMixin | pd.DataFrame,
+        concurrency: int = 4,
+    ) -> list[FlightRetrieval | Exception]:
+        """Returns full information about many flights.
+
+        Requests are sent concurrently, see
+        :meth:`async_flightretrieval_many`.
+
+        **Example usage:**
+
+        .. code:: python
+
+            flights = b2b.flightplanlist(origin="LFBO")
+            details = b2b.flightretrieval_many(flights)
+
+        """
+
+        async def retrieve_all() -> list[FlightRetrieval | Exception]:
+            async with self.new_async_client() as client:  # type: ignore
+                return await self.async_flightretrieval_many(
+                    client, flights, concurrency
+                )
+
+        return run_sync(retrieve_all())
+
+    async def async_flightretrieval_many(
+        self,
+        client: None | httpx.AsyncClient,
+        flights: DataFrameMixin | pd.DataFrame,
+        concurrency: int = 4,
+    ) -> list[FlightRetrieval | Exception]:
+        """Returns full information about many flights.
+
+        :param flights: a flight list (e.g. a :class:`FlightPlanList`) or a
+            DataFrame with ``EOBT``, ``callsign``, ``origin`` and
+            ``destination`` columns
+        :param concurrency: maximum number of simultaneous requests, to
+            remain within the parallel request quota granted by NM
+
+        Results are returned in the order of the flights. A flight which
+        cannot be retrieved does not abort the batch: the corresponding
+        exception is returned in place of the result.
+        """
+        if isinstance(flights, DataFrameMixin):
+            flights = flights.data
+        if client is None:
+            client = self.async_client  # type: ignore
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def retrieve(
+            EOBT: pd.Timestamp, callsign: str, origin: str, destination: str
+        ) -> FlightRetrieval | Exception:
+            async with semaphore:
+                try:
+                    return await self.async_flightretrieval(
+                        client, EOBT, callsign, origin, destination
+                    )
+                except Exception as e:
+                    _log.warning(f"FlightRetrieval {callsign}: {e}")
+                    return e
+
+        return await asyncio.gather(
+            *(
+                retrieve(*keys)
+                for keys in flights[key_columns].itertuples(index=False)
+            )
+        )
+
     def _flightretrieval_request(
         self,
         EOBT: str | pd.Timestamp,
@@ -155,6 +252,8 @@ class _FlightRetrieval:
         origin: str,
         destination: str,
     ) -> Request:
+        import pandas as pd
+
         if isinstance(EOBT, str):
             EOBT = pd.Timestamp(EOBT, tz="utc")
         now = pd.Timestamp("now", tz="utc")
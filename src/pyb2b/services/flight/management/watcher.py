@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterator,
+    TypeVar,
+)
+
+from ....frames import walk
+from .flightlist import FlightList, flight_columns, nested_fields
+
+L = TypeVar("L", bound=FlightList[Any])
+
+
+@dataclass
+class FlightListDelta(Generic[L]):
+    """Differences between two consecutive flight lists.
+
+    ``added`` and ``changed`` are flight lists of the same type as the
+    replies, restricted to the relevant flights; ``removed`` contains the
+    flightId of flights which are no longer listed.
+    """
+
+    added: L
+    changed: L
+    removed: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __len__(self) -> int:
+        return (
+            len(flights(self.added))
+            + len(flights(self.changed))
+            + len(self.removed)
+        )
+
+
+def flights(reply: FlightList[Any]) -> list[Any]:
+    data: Any = reply.json.get("data", None)
+    return data.get("flights", []) if data is not None else []
+
+
+def restrict(reply: L, entries: list[Any]) -> L:
+    """A flight list of the same type, with only the given flights."""
+    json: Any = reply.json
+    data = dict(json.get("data", None) or {})
+    data["flights"] = entries
+    return type(reply)({**json, "data": data}, reply.fields)
+
+
+class FlightListWatcher(Generic[L]):
+    """Polls a flight list and yields the flights which changed.
+
+    Only the identification of the flights and the values of the requested
+    fields are kept between two polls, so memory remains flat over long
+    runs.
+
+    .. code:: python
+
+        watcher = FlightListWatcher(
+            lambda: b2b.flightlistbyairspace("LFBBBDX"), interval=60
+        )
+        for delta in watcher:
+            print(delta.added.data, delta.changed.data, delta.removed)
+
+    The query may also be a coroutine function, e.g. ``lambda:
+    b2b.async_flightlistbyairspace(None, "LFBBBDX")``: iterate with
+    ``async for`` then.
+
+    :param query: returns the current flight list
+    :param interval: the time (in seconds) between two queries
+    """
+
+    def __init__(
+        self,
+        query: Callable[[], L | Awaitable[L]],
+        interval: float = 60,
+    ) -> None:
+        self.query = query
+        self.interval = interval
+        self.store: dict[str, tuple[Any, ...]] = {}
+
+    def update(self, reply: L) -> FlightListDelta[L]:
+        """Updates the store with a new reply, returns the differences."""
+        paths = [
+            *flight_columns.values(),
+            *(nested_fields.get(f, (f,)) for f in reply.fields),
+        ]
+        added: list[Any] = []
+        changed: list[Any] = []
+        store: dict[str, tuple[Any, ...]] = {}
+        for entry in flights(reply):
+            if (flight := entry.get("flight", None)) is None:
+                continue
+            key = walk(flight, ("flightId", "id"))
+            values = tuple(walk(flight, path) for path in paths)
+            if (previous := self.store.get(key, None)) is None:
+                added.append(entry)
+            elif previous != values:
+                changed.append(entry)
+            store[key] = values
+
+        removed = [key for key in self.store if key not in store]
+        self.store = store
+        return FlightListDelta(
+            restrict(reply, added), restrict(reply, changed), removed
+        )
+
+    def __iter__(self) -> Iterator[FlightListDelta[L]]:
+        while True:
+            start = time.monotonic()
+            reply = self.query()
+            if inspect.isawaitable(reply):
+                if inspect.iscoroutine(reply):
+                    reply.close()  # never awaited
+                raise TypeError(
+                    "The query returns an awaitable: iterate with async for"
+                )
+            if delta := self.update(reply):
+                yield delta
+            time.sleep(max(0, self.interval - time.monotonic() + start))
+
+    async def __aiter__(self) -> AsyncIterator[FlightListDelta[L]]:
+        while True:
+            start = time.monotonic()
+            reply = self.query()
+            if inspect.isawaitable(reply):
+                reply = await reply
+            if delta := self.update(reply):
+                yield delta
+            await asyncio.sleep(
+                max(0, self.interval - time.monotonic() + start)
+            )
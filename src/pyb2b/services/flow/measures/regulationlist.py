@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from typing import Any, ClassVar, TypedDict, cast
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict
 
 import httpx
 
-import pandas as pd
-
+from ....frames import (
+    DATETIME_MINUTE,
+    DATETIME_SECOND,
+    extract,
+    to_frame,
+    walk,
+)
 from ....mixins import DataFrameMixin, JSONMixin
+from ....types.generated import decoders
 from ....types.generated.flow import (
-    Regulation,
     RegulationField,
     RegulationListReply,
     RegulationListRequest,
@@ -16,6 +21,9 @@ from ....types.generated.flow import (
     RegulationState,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 Request = TypedDict(
     "Request", {"fw:RegulationListRequest": RegulationListRequest}
 )
@@ -27,12 +35,16 @@ default_fields: list[RegulationField] = list(
     if field not in []
 )
 
+record_path = ("data", "regulations", "item")
+
 
 class RegulationList(DataFrameMixin, JSONMixin[RegulationListReply]):
     """
     A list of regulations.
     """
 
+    records: ClassVar[tuple[str, ...]] = record_path
+
     columns_options: ClassVar[None | dict[str, dict[str, Any]]] = dict(
         regulationId=dict(style="blue bold"),
         title=dict(),
@@ -47,27 +59,34 @@ class RegulationList(DataFrameMixin, JSONMixin[RegulationListReply]):
         parent: None | _RegulationList = None,
     ):
         self.parent = parent
-        self.json = json
-
-    @property
-    def data(self) -> pd.DataFrame:
-        item = self.json["data"]["regulations"]["item"]  # type: ignore
-        if not isinstance(item, list):
-            item = [item]
-        return pd.DataFrame.from_records(
+        self.json = decoders.decode_flow_RegulationListReply(json)
+
+    def _build_data(self) -> pd.DataFrame:
+        # e.g. <regulations/>, parsed as None, when no regulation matches
+        item = walk(self.json, ("data", "regulations", "item")) or []
+        columns = extract(
+            item,
             {
-                "regulation": e["regulationId"],
-                "from": pd.Timestamp(e["applicability"]["wef"], tz="utc"),
-                "until": pd.Timestamp(e["applicability"]["unt"], tz="utc"),
-                "update": pd.Timestamp(e["lastUpdate"]["eventTime"], tz="utc"),
-                "reason": e.get("reason", ""),
-                "type": e.get("subType", ""),
-                "location": e["location"]["id"],
-                "tv": e.get("delayTVSet", ""),
-                "state": e["regulationState"],
-            }
-            for entry in item
-            if (e := cast(Regulation, entry))
+                "regulation": ("regulationId",),
+                "from": ("applicability", "wef"),
+                "until": ("applicability", "unt"),
+                "update": ("lastUpdate", "eventTime"),
+                "reason": ("reason",),
+                "type": ("subType",),
+                "location": ("location", "id"),
+                "tv": ("delayTVSet",),
+                "state": ("regulationState",),
+            },
+            defaults={"reason": "", "type": "", "tv": ""},
+        )
+        return to_frame(
+            columns,
+            times={
+                "from": DATETIME_MINUTE,
+                "until": DATETIME_MINUTE,
+                "update": DATETIME_SECOND,
+            },
+            categories=["reason", "type", "location", "state"],
         )
 
 
@@ -90,12 +109,12 @@ class _RegulationList:
             reasons=reasons,
             states=states,
         )
-        reply: Reply = self.post(request)  # type: ignore
+        reply: Reply = self.post(request, record_path)  # type: ignore
         return RegulationList(reply["fw:RegulationListReply"], parent=self)
 
     async def async_regulationlist(
         self,
-        client: httpx.AsyncClient,
+        client: None | httpx.AsyncClient,
         start: None | str | pd.Timestamp = None,
         stop: None | str | pd.Timestamp = None,
         *,
@@ -112,7 +131,9 @@ class _RegulationList:
             reasons=reasons,
             states=states,
         )
-        reply: Reply = await self.async_post(client, request)  # type: ignore
+        reply: Reply = await self.async_post(  # type: ignore
+            client, request, record_path
+        )
         return RegulationList(reply["fw:RegulationListReply"], parent=self)
 
     def _regulationlist_request(
@@ -125,6 +146,8 @@ class _RegulationList:
         reasons: None | RegulationReason | list[RegulationReason] = None,
         states: None | RegulationState | list[RegulationState] = None,
     ) -> Request:
+        import pandas as pd
+
         if start is None:
             start = pd.Timestamp.now(tz="utc")
         elif isinstance(start, str):
@@ -0,0 +1,697 @@
+# Generated by scripts/decoders.py, do not edit
+from typing import Any, Callable
+
+from ...frames import DATETIME_MINUTE, DATETIME_SECOND
+
+
+def _many(
+    value: dict[str, Any],
+    key: str,
+    decode: None | Callable[[Any], Any] = None,
+) -> None:
+    """Normalizes repeated elements to a list.
+
+    NM wraps some collections in <item> elements: the list is then found
+    under the "item" key.
+    """
+    if (v := value.get(key, None)) is None:
+        return
+    if isinstance(v, dict) and v.keys() == {"item"}:
+        value, key, v = v, "item", v["item"]
+        if v is None:
+            return
+    if not isinstance(v, list):
+        value[key] = v = [v]
+    if decode is not None:
+        for item in v:
+            decode(item)
+
+
+def decode_airspace_CompleteAIXMDatasetReply(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_common_Reply(value)
+    if (v := value.get("data", None)) is not None:
+        decode_airspace_CompleteAIXMDatasetReplyData(v)
+    return value
+
+
+def decode_airspace_CompleteAIXMDatasetReplyData(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "datasetSummaries", decode_airspace_CompleteDatasetSummary)
+    return value
+
+
+def decode_airspace_CompleteDatasetSummary(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "sourceAIRACs")
+    _many(value, "files")
+    return value
+
+
+def decode_common_Reply(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "inputValidationErrors")
+    _many(value, "outputValidationErrors")
+    _many(value, "warnings")
+    return value
+
+
+def decode_flight_BasicTrajectoryData(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "topOfClimb")
+    _many(value, "topOfDescent")
+    _many(value, "bottomOfClimb")
+    _many(value, "bottomOfDescent")
+    if (v := value.get("distanceAtLocationInfo", None)) is not None:
+        decode_flight_DistanceAtLocation(v)
+    return value
+
+
+def decode_flight_DistanceAtLocation(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "dalPoints")
+    return value
+
+
+def decode_flight_Flight(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "regulationLocations")
+    _many(value, "atfcmMeasureLocations")
+    _many(value, "ftfmPointProfile")
+    _many(value, "rtfmPointProfile")
+    _many(value, "ctfmPointProfile")
+    _many(value, "ftfmAirspaceProfile")
+    _many(value, "rtfmAirspaceProfile")
+    _many(value, "ctfmAirspaceProfile")
+    _many(value, "ftfmTrafficVolumeProfile", decode_flight_FlightTrafficVolume)
+    _many(value, "rtfmTrafficVolumeProfile", decode_flight_FlightTrafficVolume)
+    _many(value, "ctfmTrafficVolumeProfile", decode_flight_FlightTrafficVolume)
+    _many(value, "ftfmRequestedFlightLevels")
+    _many(value, "rtfmRequestedFlightLevels")
+    _many(value, "ctfmRequestedFlightLevels")
+    _many(value, "flightHistory")
+    _many(value, "operationalLog")
+    _many(value, "ftfmRestrictionProfile")
+    _many(value, "rtfmRestrictionProfile")
+    _many(value, "ctfmRestrictionProfile")
+    _many(value, "hotspots")
+    _many(value, "slotSwapCandidateList")
+    _many(value, "applicableScenarios", decode_flow_TrafficVolumeScenarios)
+    _many(value, "avoidedRegulations")
+    _many(value, "excludedRegulations")
+    _many(value, "alternateAerodromes")
+    _many(value, "activeACDMAlerts")
+    _many(value, "aoReroutingFeedbacks")
+    return value
+
+
+def decode_flight_FlightListByAerodromeReply(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_common_Reply(value)
+    if (v := value.get("data", None)) is not None:
+        decode_flight_FlightListByAerodromeReplyData(v)
+    return value
+
+
+def decode_flight_FlightListByAerodromeReplyData(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_flight_FlightListByLocationReplyData(value)
+    return value
+
+
+def decode_flight_FlightListByAerodromeRequest(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_flight_FlightListByLocationRequest(value)
+    return value
+
+
+def decode_flight_FlightListByAirspaceReply(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_common_Reply(value)
+    if (v := value.get("data", None)) is not None:
+        decode_flight_FlightListByAirspaceReplyData(v)
+    return value
+
+
+def decode_flight_FlightListByAirspaceReplyData(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_flight_FlightListByLocationReplyData(value)
+    return value
+
+
+def decode_flight_FlightListByAirspaceRequest(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_flight_FlightListByLocationRequest(value)
+    return value
+
+
+def decode_flight_FlightListByLocationReplyData(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_flight_FlightListReplyData(value)
+    return value
+
+
+def decode_flight_FlightListByLocationRequest(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_flight_FlightListRequest(value)
+    _many(value, "aircraftOperators")
+    return value
+
+
+def decode_flight_FlightListByMeasureReply(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_common_Reply(value)
+    if (v := value.get("data", None)) is not None:
+        decode_flight_FlightListByMeasureReplyData(v)
+    return value
+
+
+def decode_flight_FlightListByMeasureReplyData(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_flight_FlightListByLocationReplyData(value)
+    return value
+
+
+def decode_flight_FlightListByMeasureRequest(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_flight_FlightListByLocationRequest(value)
+    return value
+
+
+def decode_flight_FlightListReplyData(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "flights", decode_flight_FlightOrFlightPlan)
+    return value
+
+
+def decode_flight_FlightListRequest(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "requestedFlightFields")
+    return value
+
+
+def decode_flight_FlightOrFlightPlan(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    if (v := value.get("flight", None)) is not None:
+        decode_flight_Flight(v)
+    return value
+
+
+def decode_flight_FlightPlan(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "eetsToLocations")
+    _many(value, "stayInformation")
+    _many(value, "enrouteDelays")
+    if (v := value.get("otherInformation", None)) is not None:
+        decode_flight_OtherInformation(v)
+    if (v := value.get("supplementaryInformation", None)) is not None:
+        decode_flight_SupplementaryInformation(v)
+    return value
+
+
+def decode_flight_FlightPlanHistory(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "infos")
+    return value
+
+
+def decode_flight_FlightPlanListReply(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_common_Reply(value)
+    if (v := value.get("data", None)) is not None:
+        decode_flight_FlightPlanListReplyData(v)
+    return value
+
+
+def decode_flight_FlightPlanListReplyData(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "summaries")
+    return value
+
+
+def decode_flight_FlightRetrievalReply(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_common_Reply(value)
+    if (v := value.get("data", None)) is not None:
+        decode_flight_FlightRetrievalReplyData(v)
+    return value
+
+
+def decode_flight_FlightRetrievalReplyData(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    if (v := value.get("structuredFlightPlan", None)) is not None:
+        decode_flight_StructuredFlightPlan(v)
+    if (v := value.get("flightPlanHistory", None)) is not None:
+        decode_flight_FlightPlanHistory(v)
+    if (v := value.get("flight", None)) is not None:
+        decode_flight_Flight(v)
+    return value
+
+
+def decode_flight_FlightRetrievalRequest(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "requestedFlightDatasets")
+    _many(value, "requestedFlightFields")
+    return value
+
+
+def decode_flight_FlightTrafficVolume(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "flows", decode_flow_Flow)
+    return value
+
+
+def decode_flight_OtherInformation(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    if (v := value.get("reasonForSpecialHandling", None)) is not None:
+        decode_flight_SpecialHandlingIndicators(v)
+    _many(value, "performanceBasedNavigationCodes")
+    return value
+
+
+def decode_flight_SpecialHandlingIndicators(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "icaoSTSIndicators")
+    _many(value, "eurSTSIndicators")
+    return value
+
+
+def decode_flight_StructuredFlightPlan(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    if (v := value.get("flightPlan", None)) is not None:
+        decode_flight_FlightPlan(v)
+    if (v := value.get("basicTrajectoryData", None)) is not None:
+        decode_flight_BasicTrajectoryData(v)
+    return value
+
+
+def decode_flight_SupplementaryInformation(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "frequencyAvailability")
+    _many(value, "survivalEquipment")
+    _many(value, "lifeJacketEquipment")
+    return value
+
+
+def decode_flow_EhelpDeskAddFlightsInFmpStamRerouting(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "flights")
+    return value
+
+
+def decode_flow_EhelpDeskExcludeReIncludeFlightInRegulation(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "regulations")
+    return value
+
+
+def decode_flow_EhelpDeskForceFlightsInRegulation(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "flights")
+    return value
+
+
+def decode_flow_EhelpDeskTicketChoice(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    if (v := value.get("forceFlightsInRegulation", None)) is not None:
+        decode_flow_EhelpDeskForceFlightsInRegulation(v)
+    if (v := value.get("unforceFlightsInRegulation", None)) is not None:
+        decode_flow_EhelpDeskUnforceFlightsInRegulation(v)
+    if (v := value.get("excludeFlightFromRegulation", None)) is not None:
+        decode_flow_EhelpDeskExcludeReIncludeFlightInRegulation(v)
+    if (v := value.get("reIncludeFlightInRegulation", None)) is not None:
+        decode_flow_EhelpDeskExcludeReIncludeFlightInRegulation(v)
+    if (v := value.get("addFlightsInFmpStamRerouting", None)) is not None:
+        decode_flow_EhelpDeskAddFlightsInFmpStamRerouting(v)
+    return value
+
+
+def decode_flow_EhelpDeskUnforceFlightsInRegulation(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "flights")
+    return value
+
+
+def decode_flow_Flow(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    if (v := value.get("applicableScenarios", None)) is not None:
+        decode_flow_TrafficVolumeScenarios(v)
+    return value
+
+
+def decode_flow_MCDMFlightTopic(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_flow_MCDMStatefulTopic(value)
+    if (v := value.get("ticket", None)) is not None:
+        decode_flow_EhelpDeskTicketChoice(v)
+    return value
+
+
+def decode_flow_MCDMMeasureTopic(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_flow_MCDMStatefulTopic(value)
+    _many(value, "userCategories")
+    _many(value, "flightTopics", decode_flow_MCDMFlightTopic)
+    _many(value, "predefinedUsersForFlightCoordinationLevel")
+    return value
+
+
+def decode_flow_MCDMStatefulTopic(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "userRolesAndApprovalStates")
+    return value
+
+
+def decode_flow_Measure(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    if (v := value.get("mcdmInfo", None)) is not None:
+        decode_flow_MCDMMeasureTopic(v)
+    return value
+
+
+def decode_flow_MeasureListRequest(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "tvs")
+    _many(value, "tvSets")
+    return value
+
+
+def decode_flow_Regulation(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_flow_RegulationOrMCDMOnly(value)
+    return value
+
+
+def decode_flow_RegulationListReply(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_common_Reply(value)
+    if (v := value.get("data", None)) is not None:
+        decode_flow_RegulationListReplyData(v)
+    return value
+
+
+def decode_flow_RegulationListReplyData(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "regulations", decode_flow_Regulation)
+    return value
+
+
+def decode_flow_RegulationListRequest(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_flow_RegulationOrMCDMOnlyListRequest(value)
+    _many(value, "requestedRegulationFields")
+    _many(value, "regulationStates")
+    return value
+
+
+def decode_flow_RegulationOrMCDMOnly(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_flow_Measure(value)
+    if (v := value.get("location", None)) is not None:
+        decode_flow_TrafficVolumeLocation(v)
+    _many(value, "initialConstraints")
+    _many(value, "supplementaryConstraints")
+    _many(value, "occupancyConstraints")
+    _many(value, "linkedRegulations")
+    return value
+
+
+def decode_flow_RegulationOrMCDMOnlyListRequest(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    decode_flow_MeasureListRequest(value)
+    _many(value, "regulations")
+    _many(value, "reasons")
+    return value
+
+
+def decode_flow_TrafficVolumeLocation(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "setIds")
+    return value
+
+
+def decode_flow_TrafficVolumeScenarios(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    _many(value, "scenarios")
+    return value
+
+
+# Time attributes of each type, and their format
+time_fields: dict[str, dict[str, str]] = {
+    "airspace.AIXMFile": {
+        "releaseTime": DATETIME_SECOND,
+    },
+    "airspace.CompleteAIXMDatasetReply": {
+        "requestReceptionTime": DATETIME_SECOND,
+        "sendTime": DATETIME_SECOND,
+    },
+    "airspace.CompleteAIXMDatasetRequest": {
+        "sendTime": DATETIME_SECOND,
+    },
+    "common.DateTimeMinutePeriod": {
+        "wef": DATETIME_MINUTE,
+        "unt": DATETIME_MINUTE,
+    },
+    "common.File": {
+        "releaseTime": DATETIME_SECOND,
+    },
+    "common.Reply": {
+        "requestReceptionTime": DATETIME_SECOND,
+        "sendTime": DATETIME_SECOND,
+    },
+    "common.Request": {
+        "sendTime": DATETIME_SECOND,
+    },
+    "flight.ACDMAlertData": {
+        "timestamp": DATETIME_MINUTE,
+    },
+    "flight.APISubmissionRules": {
+        "latestSubmissionTargetTakeOffAPI": DATETIME_MINUTE,
+        "earliestSubmissionTargetTimeOverAPI": DATETIME_MINUTE,
+    },
+    "flight.ActualTimeAtTarget": {
+        "estimatedActualTimeAtTarget": DATETIME_MINUTE,
+    },
+    "flight.AirFiledData": {
+        "estimatedTimeOver": DATETIME_SECOND,
+    },
+    "flight.ArrivalInformation": {
+        "landingTime": DATETIME_MINUTE,
+        "scheduledInBlockTime": DATETIME_MINUTE,
+        "inBlockTime": DATETIME_MINUTE,
+        "airportSlotArrival": DATETIME_MINUTE,
+        "targetTimeOver": DATETIME_MINUTE,
+        "earliestTargetTimeOver": DATETIME_MINUTE,
+        "consolidatedTargetTimeOver": DATETIME_MINUTE,
+        "calculatedTimeOver": DATETIME_MINUTE,
+        "minCalculatedTimeOver": DATETIME_MINUTE,
+        "maxCalculatedTimeOver": DATETIME_MINUTE,
+        "estimatedOrActualTimeOver": DATETIME_MINUTE,
+    },
+    "flight.CDMInfo": {
+        "turnaroundTargetTakeOffTime": DATETIME_MINUTE,
+        "earliestTargetTakeOffTime": DATETIME_MINUTE,
+        "consolidatedTargetTakeOffTime": DATETIME_MINUTE,
+        "atcTargetTakeOffTime": DATETIME_MINUTE,
+        "targetOffBlockTime": DATETIME_MINUTE,
+        "targetStartupApprovalTime": DATETIME_MINUTE,
+    },
+    "flight.Flight": {
+        "readyEstimatedOffBlockTime": DATETIME_MINUTE,
+        "cdmEstimatedOffBlockTime": DATETIME_MINUTE,
+        "calculatedOffBlockTime": DATETIME_MINUTE,
+        "actualOffBlockTime": DATETIME_MINUTE,
+        "estimatedTakeOffTime": DATETIME_MINUTE,
+        "calculatedTakeOffTime": DATETIME_MINUTE,
+        "actualTakeOffTime": DATETIME_MINUTE,
+        "estimatedTimeOfArrival": DATETIME_MINUTE,
+        "calculatedTimeOfArrival": DATETIME_MINUTE,
+        "actualTimeOfArrival": DATETIME_MINUTE,
+    },
+    "flight.FlightAirspace": {
+        "firstEntryTime": DATETIME_SECOND,
+        "lastExitTime": DATETIME_SECOND,
+    },
+    "flight.FlightEvent": {
+        "timestamp": DATETIME_SECOND,
+        "resultingOffBlockTime": DATETIME_MINUTE,
+    },
+    "flight.FlightKeys": {
+        "estimatedOffBlockTime": DATETIME_MINUTE,
+    },
+    "flight.FlightListByAerodromeReply": {
+        "requestReceptionTime": DATETIME_SECOND,
+        "sendTime": DATETIME_SECOND,
+    },
+    "flight.FlightListByAerodromeRequest": {
+        "sendTime": DATETIME_SECOND,
+    },
+    "flight.FlightListByAirspaceReply": {
+        "requestReceptionTime": DATETIME_SECOND,
+        "sendTime": DATETIME_SECOND,
+    },
+    "flight.FlightListByAirspaceRequest": {
+        "sendTime": DATETIME_SECOND,
+    },
+    "flight.FlightListByLocationRequest": {
+        "sendTime": DATETIME_SECOND,
+    },
+    "flight.FlightListByMeasureReply": {
+        "requestReceptionTime": DATETIME_SECOND,
+        "sendTime": DATETIME_SECOND,
+    },
+    "flight.FlightListByMeasureRequest": {
+        "sendTime": DATETIME_SECOND,
+    },
+    "flight.FlightListRequest": {
+        "sendTime": DATETIME_SECOND,
+    },
+    "flight.FlightOperationalLogEntry": {
+        "timestamp": DATETIME_SECOND,
+    },
+    "flight.FlightPlan": {
+        "estimatedOffBlockTime": DATETIME_MINUTE,
+    },
+    "flight.FlightPlanHistoryInfo": {
+        "timeStamp": DATETIME_SECOND,
+    },
+    "flight.FlightPlanListReply": {
+        "requestReceptionTime": DATETIME_SECOND,
+        "sendTime": DATETIME_SECOND,
+    },
+    "flight.FlightPlanListRequest": {
+        "sendTime": DATETIME_SECOND,
+    },
+    "flight.FlightPoint": {
+        "timeOver": DATETIME_SECOND,
+    },
+    "flight.FlightRestriction": {
+        "timeOver": DATETIME_SECOND,
+    },
+    "flight.FlightRetrievalReply": {
+        "requestReceptionTime": DATETIME_SECOND,
+        "sendTime": DATETIME_SECOND,
+    },
+    "flight.FlightRetrievalRequest": {
+        "sendTime": DATETIME_SECOND,
+    },
+    "flight.FlightTrafficVolume": {
+        "entryTime": DATETIME_SECOND,
+        "exitTime": DATETIME_SECOND,
+    },
+    "flight.FourDPosition": {
+        "timeOver": DATETIME_SECOND,
+    },
+    "flight.IATAFlightKeys": {
+        "estimatedOffBlockTime": DATETIME_MINUTE,
+    },
+    "flight.InvalidFiling": {
+        "filingTime": DATETIME_SECOND,
+    },
+    "flight.ProfileValidity": {
+        "lastValidEOBT": DATETIME_MINUTE,
+    },
+    "flight.ProposalInformation": {
+        "responseBy": DATETIME_MINUTE,
+        "proposedCTOT": DATETIME_MINUTE,
+    },
+    "flight.SlotSwapCandidate": {
+        "swapDecideByTime": DATETIME_MINUTE,
+    },
+    "flight.TargetTime": {
+        "targetTime": DATETIME_SECOND,
+    },
+    "flight.TimeAndModel": {
+        "dateTime": DATETIME_SECOND,
+    },
+    "flow.EhelpDeskForceFlightInRegulation": {
+        "newCto": DATETIME_MINUTE,
+        "newCtot": DATETIME_MINUTE,
+    },
+    "flow.EhelpDeskImproveSlotInRegulation": {
+        "minRequestedCto": DATETIME_MINUTE,
+        "minRequestedCtot": DATETIME_MINUTE,
+    },
+    "flow.EhelpDeskTicketFlightInfo": {
+        "estimatedOffBlockTime": DATETIME_MINUTE,
+        "ctot": DATETIME_MINUTE,
+    },
+    "flow.EhelpDeskTicketRequestDetails": {
+        "creationTime": DATETIME_SECOND,
+        "lastModificationTime": DATETIME_SECOND,
+    },
+    "flow.LifeCycleEvent": {
+        "eventTime": DATETIME_SECOND,
+        "userUpdateEventTime": DATETIME_SECOND,
+    },
+    "flow.MCDMDeadlines": {
+        "timeToCoordinate": DATETIME_MINUTE,
+        "timeToStartImplement": DATETIME_MINUTE,
+        "timeToImplement": DATETIME_MINUTE,
+    },
+    "flow.MeasureListRequest": {
+        "sendTime": DATETIME_SECOND,
+    },
+    "flow.RegulationListReply": {
+        "requestReceptionTime": DATETIME_SECOND,
+        "sendTime": DATETIME_SECOND,
+    },
+    "flow.RegulationListRequest": {
+        "sendTime": DATETIME_SECOND,
+    },
+    "flow.RegulationOrMCDMOnlyListRequest": {
+        "sendTime": DATETIME_SECOND,
+    },
+}
@@ -0,0 +1,206 @@
+"""
+Decoding of replies into slotted objects, typed after the generated
+TypedDicts.
+
+Replies are nested dictionaries by default. Decoding them into
+:class:`Struct` instances is optional: attribute access is faster, and
+repeated strings (aerodromes, aircraft types, timestamps) are interned so
+that they are stored only once. Restricting a structure to the fields
+actually requested (e.g. in flight lists) also saves the memory of one
+dictionary per record.
+
+.. code:: python
+
+    from pyb2b.types.generated.flight import Flight
+    from pyb2b.types.structs import decode
+
+    flight = decode(json["data"]["flight"], Flight)
+    flight.flightId.keys.aircraftId
+
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+import typing
+from typing import Any, Callable, ClassVar, Iterable, Literal, Union
+
+Decoder = Callable[[Any], Any]
+
+
+class Struct:
+    """Base class of the structures generated from TypedDicts.
+
+    Fields absent from the reply (or not selected, see :func:`struct_type`)
+    are None.
+    """
+
+    __slots__ = ()
+    __names__: ClassVar[tuple[str, ...]] = ()
+    __fields__: ClassVar[frozenset[str]] = frozenset()
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for unset slots or unknown attributes
+        if name in self.__fields__:
+            return None
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def items(self) -> Iterable[tuple[str, Any]]:
+        """The fields present in the reply, and their value."""
+        for name in self.__names__:
+            try:
+                yield name, object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts back to nested dictionaries."""
+        return {name: _to_dict(value) for name, value in self.items()}
+
+    def __eq__(self, other: object) -> bool:
+        if type(self) is not type(other):
+            return NotImplemented
+        assert isinstance(other, Struct)
+        return dict(self.items()) == dict(other.items())
+
+    # mutable, hence unhashable, as dictionaries
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.items())
+        return f"{type(self).__name__}({fields})"
+
+
+def _to_dict(value: Any) -> Any:
+    if isinstance(value, Struct):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_dict(v) for v in value]
+    return value
+
+
+_structs: dict[tuple[type, None | frozenset[str]], type[Struct]] = {}
+_decoders: dict[Any, Decoder] = {}
+
+
+def struct_type(
+    typed_dict: type, fields: None | Iterable[str] = None
+) -> type[Struct]:
+    """Returns the slotted class associated to a TypedDict.
+
+    :param fields: restrict the structure to these fields, e.g. the flight
+        fields requested in a flight list; other fields are ignored when
+        decoding
+    """
+    selection = frozenset(fields) if fields is not None else None
+    if (cls := _structs.get((typed_dict, selection), None)) is None:
+        hints = typing.get_type_hints(typed_dict)
+        names = [n for n in hints if selection is None or n in selection]
+        cls = type(
+            typed_dict.__name__,
+            (Struct,),
+            {
+                "__slots__": tuple(names),
+                "__names__": tuple(names),
+                "__fields__": frozenset(hints),
+                "__module__": __name__,
+                "__qualname__": typed_dict.__qualname__,
+            },
+        )
+        _structs[typed_dict, selection] = cls
+    return cls
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class _StructDecoder:
+    """Decodes a dictionary into a Struct.
+
+    Field decoders are resolved on first use to support recursive types.
+    """
+
+    def __init__(self, typed_dict: type, fields: None | frozenset[str]):
+        self.typed_dict = typed_dict
+        self.cls = struct_type(typed_dict, fields)
+        self.setters: None | dict[str, tuple[Any, Decoder]] = None
+
+    def resolve(self) -> dict[str, tuple[Any, Decoder]]:
+        hints = typing.get_type_hints(self.typed_dict)
+        self.setters = {
+            name: (self.cls.__dict__[name].__set__, decoder(hints[name]))
+            for name in self.cls.__names__
+        }
+        return self.setters
+
+    def __call__(self, value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        setters = self.setters if self.setters is not None else self.resolve()
+        instance = self.cls.__new__(self.cls)
+        for key, item in value.items():
+            if (entry := setters.get(key, None)) is not None:
+                setter, decode_item = entry
+                setter(instance, decode_item(item))
+        return instance
+
+
+def _list_decoder(decode_item: Decoder) -> Decoder:
+    """Decodes repeated elements into a list, even if there is only one."""
+
+    def decode_list(value: Any) -> Any:
+        if value is None:
+            return None
+        if not isinstance(value, list):
+            value = [value]
+        return [decode_item(item) for item in value]
+
+    return decode_list
+
+
+def decoder(tp: Any, fields: None | Iterable[str] = None) -> Decoder:
+    """Returns a function decoding values of type tp.
+
+    :param fields: for TypedDicts, the fields to keep (see
+        :func:`struct_type`)
+    """
+    key = (tp, frozenset(fields) if fields is not None else None)
+    if (result := _decoders.get(key, None)) is not None:
+        return result
+
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    result = _identity
+    if typing.is_typeddict(tp):
+        result = _StructDecoder(tp, key[1])
+    elif tp is str or origin is Literal:
+        result = _intern
+    elif origin is list:
+        result = _list_decoder(decoder(args[0]))
+    elif origin in (Union, types.UnionType):
+        # a single element or a list of elements: normalized to a list, as
+        # in the generated decoders
+        lists = [a for a in args if typing.get_origin(a) is list]
+        if len(lists) == 1:
+            result = decoder(lists[0])
+
+    _decoders[key] = result
+    return result
+
+
+def decode(value: Any, tp: Any, fields: None | Iterable[str] = None) -> Any:
+    """Decodes a (part of a) reply into :class:`Struct` instances.
+
+    :param tp: the type of value, as generated in
+        :mod:`pyb2b.types.generated`
+    :param fields: for TypedDicts, the fields to keep
+    """
+    return decoder(tp, fields)(value)
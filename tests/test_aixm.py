@@ -0,0 +1,126 @@
+import io
+import zipfile
+from pathlib import Path
+
+from pyb2b.mock import synthetic
+from pyb2b.services.airspace.structure.aixm_store import AIXMStore, features
+from pyb2b.services.airspace.structure.manifest import Manifest
+
+AIXM = b"""<?xml version="1.0" encoding="UTF-8"?>
+<message:AIXMBasicMessage
+ xmlns:message="http://www.aixm.aero/schema/5.1.1/message"
+ xmlns:aixm="http://www.aixm.aero/schema/5.1.1"
+ xmlns:gml="http://www.opengis.net/gml/3.2"
+ xmlns:xlink="http://www.w3.org/1999/xlink">
+<message:hasMember><aixm:Airspace gml:id="A1">
+<gml:identifier codeSpace="urn:uuid:">a1</gml:identifier>
+<aixm:timeSlice><aixm:AirspaceTimeSlice gml:id="A1_1">
+<aixm:interpretation>BASELINE</aixm:interpretation>
+<aixm:type>SECTOR</aixm:type>
+<aixm:designator>LFBBBDX</aixm:designator>
+<aixm:geometryComponent><aixm:AirspaceGeometryComponent>
+<aixm:theAirspaceVolume><aixm:AirspaceVolume>
+<aixm:upperLimit uom="FL">660</aixm:upperLimit>
+<aixm:lowerLimit uom="FL">365</aixm:lowerLimit>
+<aixm:horizontalProjection><aixm:Surface><gml:patches><gml:PolygonPatch>
+<gml:exterior><gml:LinearRing>
+<gml:posList>44 -1 45 0 44 1 44 -1</gml:posList>
+</gml:LinearRing></gml:exterior>
+</gml:PolygonPatch></gml:patches></aixm:Surface></aixm:horizontalProjection>
+</aixm:AirspaceVolume></aixm:theAirspaceVolume>
+</aixm:AirspaceGeometryComponent></aixm:geometryComponent>
+</aixm:AirspaceTimeSlice></aixm:timeSlice>
+<aixm:timeSlice><aixm:AirspaceTimeSlice gml:id="A1_2">
+<aixm:interpretation>TEMPDELTA</aixm:interpretation>
+<aixm:designator>LFBBTMP</aixm:designator>
+</aixm:AirspaceTimeSlice></aixm:timeSlice>
+</aixm:Airspace></message:hasMember>
+<message:hasMember><aixm:Route gml:id="R1">
+<gml:identifier codeSpace="urn:uuid:">r1</gml:identifier>
+<aixm:timeSlice><aixm:RouteTimeSlice gml:id="R1_1">
+<aixm:interpretation>BASELINE</aixm:interpretation>
+<aixm:designatorPrefix>U</aixm:designatorPrefix>
+<aixm:designatorSecondLetter>N</aixm:designatorSecondLetter>
+<aixm:designatorNumber>869</aixm:designatorNumber>
+</aixm:RouteTimeSlice></aixm:timeSlice>
+</aixm:Route></message:hasMember>
+<message:hasMember><aixm:RouteSegment gml:id="S1">
+<gml:identifier codeSpace="urn:uuid:">s1</gml:identifier>
+<aixm:timeSlice><aixm:RouteSegmentTimeSlice gml:id="S1_1">
+<aixm:interpretation>BASELINE</aixm:interpretation>
+<aixm:upperLimit uom="FL">660</aixm:upperLimit>
+<aixm:start><aixm:EnRouteSegmentPoint>
+<aixm:pointChoice_navaidSystem xlink:href="urn:uuid:n1"/>
+</aixm:EnRouteSegmentPoint></aixm:start>
+<aixm:routeFormed xlink:href="urn:uuid:r1"/>
+</aixm:RouteSegmentTimeSlice></aixm:timeSlice>
+</aixm:RouteSegment></message:hasMember>
+</message:AIXMBasicMessage>
+"""
+
+
+def test_features() -> None:
+    (airspace, route, segment) = (
+        values for _, values in features(io.BytesIO(AIXM))
+    )
+    assert airspace["designator"] == "LFBBBDX"
+    assert (airspace["upper"], airspace["upper_uom"]) == ("660", "FL")
+    assert airspace["polygon"] == "44 -1 45 0 44 1 44 -1"
+    assert route["designator"] == "UN869"
+    assert segment["route"] == "r1"
+    assert segment["start"] == "n1"
+    assert segment["end"] is None
+
+
+def test_most_recent() -> None:
+    def time_slice(sequence: int, correction: int, name: str) -> str:
+        return f"""<aixm:timeSlice><aixm:NavaidTimeSlice>
+<aixm:interpretation>BASELINE</aixm:interpretation>
+<aixm:sequenceNumber>{sequence}</aixm:sequenceNumber>
+<aixm:correctionNumber>{correction}</aixm:correctionNumber>
+<aixm:name>{name}</aixm:name>
+</aixm:NavaidTimeSlice></aixm:timeSlice>"""
+
+    # time slices are not sorted in the file
+    aixm = AIXM.replace(
+        b"</message:AIXMBasicMessage>",
+        f"""<message:hasMember><aixm:Navaid gml:id="N1">
+<gml:identifier codeSpace="urn:uuid:">n1</gml:identifier>
+{time_slice(10, 0, "SEQUENCE 10")}
+{time_slice(2, 1, "SEQUENCE 2")}
+{time_slice(10, 1, "CORRECTED")}
+{time_slice(9, 3, "SEQUENCE 9")}
+</aixm:Navaid></message:hasMember>
+</message:AIXMBasicMessage>""".encode(),
+    )
+    ((_, navaid),) = features(io.BytesIO(aixm), ["Navaid"])
+    assert navaid["name"] == "CORRECTED"
+
+
+def test_store(tmp_path: Path) -> None:
+    source = tmp_path / "Airspace.BASELINE.zip"
+    with zipfile.ZipFile(source, "w") as archive:
+        archive.writestr("Airspace.BASELINE", AIXM)
+    points = tmp_path / "DesignatedPoint.BASELINE.zip"
+    points.write_bytes(synthetic.aixm_file("DesignatedPoint", "2401", 100))
+
+    with AIXMStore(tmp_path / "aixm.sqlite") as store:
+        assert store.add([source, points]) == 103
+        assert store.add([source, points]) == 0  # unchanged files
+        assert len(store) == 103
+
+    with AIXMStore(tmp_path / "aixm.sqlite") as store:
+        (airspace,) = store.get("Airspace", "LFBBBDX")
+        assert airspace["lower"] == "365"
+        assert store.get("Airspace", "LFBBTMP") == []
+        (point,) = store.get("DesignatedPoint", "P0042")
+        assert -10 <= point["longitude"] <= 20
+        assert store["r1"]["designator"] == "UN869"
+        assert store.data("DesignatedPoint").shape[0] == 100
+
+
+def test_manifest_updates(tmp_path: Path) -> None:
+    for update_id in ["2401.10", "2401.2", "2401.9"]:
+        Manifest(tmp_path, "2401", update_id).save()
+    updates = Manifest.updates(tmp_path, "2401")
+    assert [u.update_id for u in updates] == ["2401.2", "2401.9", "2401.10"]
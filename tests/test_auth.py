@@ -0,0 +1,35 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from pyb2b.auth.pkcs12 import create_ssl_context, load_ssl_context, pem_file
+from pyb2b.mock import self_signed_pkcs12
+
+
+def test_ssl_context_cache() -> None:
+    data = self_signed_pkcs12(b"secret")
+    context = create_ssl_context(data, b"secret")
+    assert create_ssl_context(data, b"secret") is context
+    assert (
+        create_ssl_context(self_signed_pkcs12(b"secret"), b"secret")
+        is not context
+    )
+
+
+@pytest.mark.parametrize("in_memory", [True, False])
+def test_pem_file(in_memory: bool) -> None:
+    with pem_file(b"data", in_memory) as path:
+        assert Path(path).read_bytes() == b"data"
+    if in_memory and hasattr(os, "memfd_create"):
+        assert path.startswith("/proc/self/fd/")
+    else:
+        assert not Path(path).exists()
+
+
+@pytest.mark.parametrize("in_memory", [True, False])
+def test_load_ssl_context(in_memory: bool) -> None:
+    _, cert = load_ssl_context(
+        self_signed_pkcs12(b"secret"), b"secret", in_memory
+    )
+    assert cert.subject.rfc4514_string() == "CN=mock"
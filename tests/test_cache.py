@@ -0,0 +1,134 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pyb2b.cache import MemoryBackend, ResponseCache, SQLiteBackend, request_key
+from pyb2b.main import B2B
+from pyb2b.mock import MockGateway, self_signed_pkcs12
+
+
+def request(send_time: str, dataset: str = "OPERATIONAL") -> dict[str, Any]:
+    return {
+        "fw:RegulationListRequest": {
+            "sendTime": send_time,
+            "dataset": {"type": dataset},
+        }
+    }
+
+
+def test_request_key() -> None:
+    key = request_key(request("2024-06-01 10:00:00"))
+    assert key == request_key(request("2024-06-01 10:00:05"))
+    assert key != request_key(request("2024-06-01 10:00:00", "FORECAST"))
+    assert key != request_key(request("2024-06-01 10:00:00"), "27.0.0")
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_backend(backend: str, tmp_path: Path) -> None:
+    storage = (
+        MemoryBackend(maxsize=2)
+        if backend == "memory"
+        else SQLiteBackend(tmp_path / "cache.sqlite", maxsize=2)
+    )
+    storage.set("a", {"status": "OK"}, 60)  # type: ignore
+    storage.set("b", {"status": "OK"}, 60)  # type: ignore
+    assert storage.get("a") == {"status": "OK"}
+    storage.set("c", {"status": "OK"}, 60)  # type: ignore
+    assert storage.get("b") is None  # least recently used
+    assert len(storage) == 2
+    storage.set("d", {"status": "OK"}, -1)  # type: ignore
+    assert storage.get("d") is None  # expired
+
+
+def test_memory_copies() -> None:
+    # replies are modified in place when decoded
+    storage = MemoryBackend()
+    reply: Any = {"status": "OK", "data": {"regulations": {"item": {}}}}
+    storage.set("a", reply, 60)
+    reply["data"] = None
+    first = storage.get("a")
+    assert first is not None
+    first["data"]["regulations"]["item"] = [{}]  # type: ignore
+    assert storage.get("a") == {
+        "status": "OK",
+        "data": {"regulations": {"item": {}}},
+    }
+
+
+def test_shared_in_flight() -> None:
+    cache = ResponseCache()
+    calls = 0
+
+    def fetch() -> Any:
+        nonlocal calls
+        calls += 1
+        time.sleep(0.1)
+        return {"status": "OK"}
+
+    replies: list[Any] = []
+    threads = [
+        threading.Thread(
+            target=lambda i: replies.append(
+                cache.fetch(request(str(i)), fetch)
+            ),
+            args=(i,),
+        )
+        for i in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert calls == 1
+    assert cache.stats.shared == 3
+    # each thread receives its own copy
+    assert len({id(reply) for reply in replies}) == 4
+
+
+def test_b2b_cache(tmp_path: Path) -> None:
+    pkcs12_filename = tmp_path / "mock.p12"
+    pkcs12_filename.write_bytes(self_signed_pkcs12(b"mock"))
+    cache = ResponseCache(ttl={"RegulationListRequest": 60})
+
+    with MockGateway() as gateway:
+        with B2B(
+            gateway.mode, "27.0.0", pkcs12_filename, "mock", cache=cache
+        ) as b2b:
+            b2b.regulationlist()
+            b2b.regulationlist()
+            asyncio.run(b2b.async_regulationlist(None))
+            b2b.flightplanlist("2024-06-01 10:00", "2024-06-01 11:00")
+            b2b.flightplanlist("2024-06-01 10:00", "2024-06-01 11:00")
+
+    assert gateway.requests["RegulationListRequest"] == 1
+    assert gateway.requests["FlightPlanListRequest"] == 2  # not cached
+    assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+
+
+def test_async_fetch(tmp_path: Path) -> None:
+    # the backend is not accessed from the event loop
+    threads: list[int] = []
+    loop: list[int] = []
+
+    class Backend(SQLiteBackend):
+        def get(self, key: str) -> Any:
+            threads.append(threading.get_ident())
+            return super().get(key)
+
+    cache = ResponseCache(Backend(tmp_path / "cache.sqlite"))
+
+    async def fetch() -> Any:
+        loop.append(threading.get_ident())
+        return {"status": "OK"}
+
+    async def main() -> list[Any]:
+        return [await cache.async_fetch(request(str(i)), fetch) for i in "ab"]
+
+    assert asyncio.run(main()) == [{"status": "OK"}] * 2
+    assert len(loop) == 1 and len(threads) == 2
+    assert loop[0] not in threads
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
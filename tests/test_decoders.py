@@ -0,0 +1,54 @@
+import importlib.util
+from pathlib import Path
+
+from pyb2b.services.flight.management import FlightListByAirspace
+from pyb2b.services.flow.measures import RegulationList
+from pyb2b.types.generated import decoders
+
+
+def test_single_element() -> None:
+    flight = {"flightId": {"id": "AA00000001"}}
+    reply = {"status": "OK", "data": {"flights": {"flight": flight}}}
+    decoders.decode_flight_FlightListByAirspaceReply(reply)
+    assert reply["data"] == {"flights": [{"flight": flight}]}
+
+    flightlist = FlightListByAirspace(
+        {"status": "OK", "data": {"flights": {"flight": flight}}},
+        ["actualTakeOffTime"],
+    )
+    assert flightlist.data.flightId.tolist() == ["AA00000001"]
+    assert str(flightlist.data.actualTakeOffTime.dtype).startswith("datetime")
+
+
+def test_item_collection() -> None:
+    regulation = {
+        "regulationId": "LFBBB01",
+        "applicability": {"wef": "2024-06-01 10:00", "unt": "2024-06-01 12:00"},
+        "location": {"id": "LFBBBDX"},
+    }
+    reply = {"status": "OK", "data": {"regulations": {"item": regulation}}}
+    regulations = RegulationList(reply)
+    assert regulations.json["data"]["regulations"] == {"item": [regulation]}
+    assert regulations.data.regulation.tolist() == ["LFBBB01"]
+
+    # already normalized replies are left unchanged
+    decoders.decode_flow_RegulationListReply(reply)
+    assert reply["data"] == {"regulations": {"item": [regulation]}}
+
+
+def test_generated() -> None:
+    # scripts/decoders.py reproduces the committed module byte for byte
+    root = Path(__file__).parent.parent
+    spec = importlib.util.spec_from_file_location(
+        "generator", root / "scripts" / "decoders.py"
+    )
+    assert spec is not None and spec.loader is not None
+    generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generator)
+
+    generated = root / "src" / "pyb2b" / "types" / "generated"
+    code = generator.generate(generated)
+    assert code == (generated / "decoders.py").read_text()
+    # the order of the classes (e.g. in the UML model) does not matter
+    classes = generator.from_generated(generated)
+    assert generator.emit(classes[::-1]) == code
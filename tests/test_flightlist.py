@@ -0,0 +1,72 @@
+import pytest
+
+import pandas as pd
+from pyb2b.services.flight.management import (
+    FlightListByAirspace,
+    FlightListWatcher,
+)
+from pyb2b.services.flight.management.flightlist import (
+    merge_replies,
+    split_window,
+    traffic_window,
+)
+
+
+def test_split_window() -> None:
+    start, stop = traffic_window("2024-06-01 00:00", "2024-06-01 05:00")
+    windows = split_window(start, stop, "2h")
+    assert [(w[0].hour, w[1].hour) for w in windows] == [(0, 2), (2, 4), (4, 5)]
+    assert split_window(start, stop)[0][1] == pd.Timestamp(
+        "2024-06-01 02:30", tz="utc"
+    )
+    minute = start + pd.Timedelta("1min")
+    assert split_window(start, minute) == [(start, minute)]
+
+
+def test_merge_replies() -> None:
+    def reply(*ids: str) -> dict[str, object]:
+        flights = [{"flight": {"flightId": {"id": id_}}} for id_ in ids]
+        return {"status": "OK", "data": {"flights": flights}}
+
+    merged = merge_replies([reply("AA1", "AA2"), reply("AA2", "AA3")])
+    assert [
+        f["flight"]["flightId"]["id"] for f in merged["data"]["flights"]
+    ] == [
+        "AA1",
+        "AA2",
+        "AA3",
+    ]
+
+
+def test_watcher() -> None:
+    def reply(**flights: str) -> FlightListByAirspace:
+        entries = [
+            {"flight": {"flightId": {"id": key}, "aircraftType": value}}
+            for key, value in flights.items()
+        ]
+        return FlightListByAirspace(
+            {"status": "OK", "data": {"flights": entries}},  # type: ignore
+            ["aircraftType"],
+        )
+
+    replies = iter(
+        [
+            reply(AA1="A320", AA2="B738"),
+            reply(AA1="A320", AA2="B738"),
+            reply(AA1="A321", AA3="E190"),
+        ]
+    )
+    deltas = iter(FlightListWatcher(lambda: next(replies), interval=0))
+    first = next(deltas)
+    assert len(first.added.data) == 2
+    # the second reply is identical: no delta
+    last = next(deltas)
+    assert last.added.data.flightId.tolist() == ["AA3"]
+    assert last.changed.data.aircraftType.tolist() == ["A321"]
+    assert last.removed == ["AA2"]
+
+    async def query() -> FlightListByAirspace:
+        return reply(AA1="A320")
+
+    with pytest.raises(TypeError):
+        next(iter(FlightListWatcher(query, interval=0)))
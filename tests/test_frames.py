@@ -0,0 +1,88 @@
+from datetime import datetime, timezone
+from typing import Any
+
+import pandas as pd
+from pyb2b.frames import DATETIME_MINUTE, to_frame, to_timestamp
+from pyb2b.mock import synthetic
+from pyb2b.parser import parse_reply
+from pyb2b.services.flight.management import (
+    FlightListByAirspace,
+    FlightPlanList,
+    FlightRetrieval,
+)
+from pyb2b.services.flow.measures import RegulationList
+
+
+def test_to_timestamp() -> None:
+    utc = timezone.utc
+    assert to_timestamp("2024-06-01 10:05") == datetime(
+        2024, 6, 1, 10, 5, tzinfo=utc
+    )
+    assert to_timestamp("2024-06-01 10:05:30") == datetime(
+        2024, 6, 1, 10, 5, 30, tzinfo=utc
+    )
+    assert to_timestamp("2024-06-01 10:05") == pd.Timestamp(
+        "2024-06-01 10:05", tz="utc"
+    )
+
+
+def test_time_indicators() -> None:
+    flight = next(synthetic.flights(1))
+    reply = parse_reply(synthetic.flight_retrieval_reply(flight))
+    retrieval = FlightRetrieval(reply["fl:FlightRetrievalReply"])
+    indicators = retrieval.time_indicators()
+    assert indicators.key.iloc[0] == "EOBT"
+    assert isinstance(indicators.value.dtype, pd.DatetimeTZDtype)
+    assert indicators.value.iloc[0] == pd.Timestamp(
+        retrieval.json["data"]["flight"]["flightId"]["keys"][
+            "estimatedOffBlockTime"
+        ],
+        tz="utc",
+    )
+
+
+def test_dtypes() -> None:
+    # dtypes depend neither on the number of rows nor on missing values
+    def frame(*values: None | str) -> pd.DataFrame:
+        return to_frame(
+            {
+                "flightId": list(values),
+                "EOBT": ["2024-06-01 10:00" if v else None for v in values],
+                "origin": list(values),
+                "level": ["350" if v else None for v in values],
+            },
+            times={"EOBT": DATETIME_MINUTE},
+            categories=["origin"],
+            numeric=["level"],
+        )
+
+    def dtypes(df: pd.DataFrame) -> list[Any]:
+        return [
+            df[name].cat.categories.dtype
+            if isinstance(df[name].dtype, pd.CategoricalDtype)
+            else df[name].dtype
+            for name in df.columns
+        ]
+
+    empty, full, partial = frame(), frame("LFBO"), frame("LFBO", None)
+    assert dtypes(empty) == dtypes(full) == dtypes(partial)
+    concat = pd.concat([empty, full, partial])
+    assert dtypes(concat) == dtypes(full)
+
+
+def test_empty_replies() -> None:
+    flights = FlightListByAirspace(
+        {"status": "OK", "data": None},  # type: ignore
+        ["aircraftType"],
+    )
+    assert flights.data.shape == (0, 6)
+    assert flights.data.flightId.dtype == pd.Series(["x"]).dtype
+
+    plans = FlightPlanList({"status": "OK", "data": None})  # type: ignore
+    assert plans.data.shape == (0, 6)
+    assert isinstance(plans.data.EOBT.dtype, pd.DatetimeTZDtype)
+
+    reply = {"status": "OK", "data": {"regulations": None}}
+    regulations = RegulationList(reply)  # type: ignore
+    assert regulations.data.shape == (0, 9)
+    assert isinstance(regulations.data["from"].dtype, pd.DatetimeTZDtype)
@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Costly dependencies, only imported when actually needed
+heavy = {"pandas", "pitot", "rich", "textual", "tqdm", "cryptography"}
+
+
+def importtime(module: str) -> dict[str, int]:
+    """Cumulative import time (in us) of all modules imported by module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_pyb2b() -> None:
+    times = importtime("pyb2b")
+    assert "pyb2b" in times
+    assert not {name.split(".")[0] for name in times} & (heavy | {"httpx"})
+
+
+def test_import_main() -> None:
+    times = importtime("pyb2b.main")
+    assert "pyb2b.main" in times
+    assert not {name.split(".")[0] for name in times} & heavy
+
+
+def test_lazy_b2b(tmp_path: Path) -> None:
+    # credentials are only read on first access to pyb2b.b2b
+    env = {**os.environ, "XDG_CONFIG_HOME": str(tmp_path)}
+    code = "import pyb2b; print(sorted(vars(pyb2b)))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    assert "'b2b'" not in result.stdout
+
+    code = "from pyb2b import b2b"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env
+    )
+    assert result.returncode != 0
+    assert "ImportError" in result.stderr
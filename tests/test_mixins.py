@@ -0,0 +1,113 @@
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pyb2b.mixins import DataFrameMixin, JSONMixin
+from pyb2b.mock import synthetic
+from pyb2b.parser import parse_reply
+from pyb2b.services.flight.management.flightlistbyairspace import (
+    FlightListByAirspace,
+    default_fields,
+)
+from pyb2b.services.flight.management.flightplanlist import FlightPlanList
+
+reply = b"""<?xml version="1.0" encoding="UTF-8"?>
+<fl:FlightPlanListReply xmlns:fl="eurocontrol/cfmu/b2b/FlightServices">
+<status>OK</status>
+<data>
+<summaries><lastValidFlightPlan><id><id>AA00000002</id><keys>
+<aircraftId>AFR1234</aircraftId>
+<aerodromeOfDeparture>LFBO</aerodromeOfDeparture>
+<aerodromeOfDestination>LFPO</aerodromeOfDestination>
+<estimatedOffBlockTime>2024-06-01 11:00</estimatedOffBlockTime>
+</keys></id><status>FILED</status></lastValidFlightPlan></summaries>
+<summaries><lastValidFlightPlan><id><id>AA00000001</id><keys>
+<aircraftId>AFR6000</aircraftId>
+<aerodromeOfDeparture>LFPO</aerodromeOfDeparture>
+<aerodromeOfDestination>LFBO</aerodromeOfDestination>
+<estimatedOffBlockTime>2024-06-01 10:00</estimatedOffBlockTime>
+</keys></id><status>FILED</status></lastValidFlightPlan></summaries>
+</data>
+</fl:FlightPlanListReply>
+"""
+
+
+def test_cached_data() -> None:
+    json = parse_reply(reply)["fl:FlightPlanListReply"]
+    flights = FlightPlanList(json)
+    assert flights.data is flights.data
+    assert flights.index == {"AA00000001": 0, "AA00000002": 1}
+
+    previous = flights.data
+    flights.json = parse_reply(reply)["fl:FlightPlanListReply"]
+    assert flights.data is not previous
+    assert flights.data.equals(previous)
+
+
+def test_abstract() -> None:
+    class Incomplete(DataFrameMixin, JSONMixin[Any]):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete({"status": "OK"})
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_archive(format: str, tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    root = "FlightListByAirspaceReply"
+    json: Any = parse_reply(
+        synthetic.flight_list_reply(50, root=root), ("data", "flights")
+    )[f"fl:{root}"]
+    # a nested field, stored as JSON
+    json["data"]["flights"][0]["flight"]["atfcmMeasureLocations"] = {
+        "item": [{"referenceLocation": {"id": "LFBBBDX"}}]
+    }
+    flights = FlightListByAirspace(json, default_fields)
+    filename = tmp_path / f"flights.{format}"
+    getattr(flights, f"to_{format}")(filename)
+    reloaded = getattr(FlightListByAirspace, f"from_{format}")(filename)
+
+    assert reloaded.data.equals(flights.data)
+    assert reloaded.json["status"] == "OK"
+    assert reloaded.json["data"]["flights"] == []
+
+    columns = ["flightId", "EOBT"]
+    partial = getattr(FlightListByAirspace, f"from_{format}")(
+        filename, columns=columns
+    )
+    assert partial.data.equals(flights.data[columns])
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_archive_fields(format: str, tmp_path: Path) -> None:
+    # the requested fields are restored with the flight list
+    pytest.importorskip("pyarrow")
+    root = "FlightListByAirspaceReply"
+    json: Any = parse_reply(
+        synthetic.flight_list_reply(5, root=root), ("data", "flights")
+    )[f"fl:{root}"]
+    fields: Any = ["aircraftType", "actualTakeOffTime"]
+    flights = FlightListByAirspace(json, fields)
+    filename = tmp_path / f"flights.{format}"
+    getattr(flights, f"to_{format}")(filename)
+    reloaded = getattr(FlightListByAirspace, f"from_{format}")(filename)
+
+    assert reloaded.fields == fields != default_fields
+    assert reloaded.data.equals(flights.data)
+
+
+@pytest.mark.parametrize("suffix", [".json", ".json.gz", ".json.zst"])
+@pytest.mark.parametrize("serializer", ["json", None])
+def test_to_file(suffix: str, serializer: None | str, tmp_path: Path) -> None:
+    if suffix == ".json.zst" and sys.version_info < (3, 14):
+        pytest.importorskip("zstandard")
+    json = parse_reply(reply, ("data", "summaries"))["fl:FlightPlanListReply"]
+    flights = FlightPlanList(json)
+    path = flights.to_file(tmp_path / f"flights{suffix}", serializer)
+    assert path.name == f"flights{suffix}"
+    reloaded = FlightPlanList.from_file(path)
+    assert reloaded.json == json
+    assert reloaded.data.equals(flights.data)
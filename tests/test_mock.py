@@ -0,0 +1,194 @@
+import asyncio
+import gc
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from pyb2b.concurrency import SingleFlight
+from pyb2b.exceptions import ReplyError
+from pyb2b.main import B2B
+from pyb2b.mock import MockGateway, self_signed_pkcs12, synthetic
+from pyb2b.retry import RetryPolicy
+from pyb2b.services.flow.measures import RegulationList
+
+
+@pytest.fixture(scope="module")
+def pkcs12_filename(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("mock") / "mock.p12"
+    path.write_bytes(self_signed_pkcs12(b"mock"))
+    return path
+
+
+def test_flight_lists(pkcs12_filename: Path) -> None:
+    with MockGateway(flights_per_hour=60, max_results=200) as gateway:
+        with B2B(gateway.mode, "27.0.0", pkcs12_filename, "mock") as b2b:
+            plans = b2b.flightplanlist("2024-06-01 10:00", "2024-06-01 11:00")
+            assert plans.data.shape[0] == 60
+            flight = plans[plans.data.flightId.iloc[0]]
+            assert flight is not None
+            assert flight.callsign == plans.data.callsign.iloc[0]
+
+            flights = b2b.flightlistbyairspace(
+                "LFBBBDX", "2024-06-01 00:00", "2024-06-02 00:00"
+            )
+            assert flights.data.shape[0] == 24 * 60
+            assert flights.data.flightId.is_unique
+            assert gateway.requests["FlightListByAirspaceRequest"] > 1
+
+
+def test_errors(pkcs12_filename: Path) -> None:
+    with MockGateway(errors={"RESOURCE_OVERLOAD": 1}) as gateway:
+        retry = RetryPolicy(
+            max_attempts=3, backoff=0, statuses={"RESOURCE_OVERLOAD": 0}
+        )
+        with B2B(
+            gateway.mode, "27.0.0", pkcs12_filename, "mock", retry=retry
+        ) as b2b:
+            with pytest.raises(ReplyError) as error:
+                b2b.regulationlist()
+            assert error.value.status == "RESOURCE_OVERLOAD"
+            assert gateway.requests["RegulationListRequest"] == 3
+
+
+def test_async_client(pkcs12_filename: Path) -> None:
+    # the pooled client is bound to an event loop, and closed with it
+    async def main(b2b: B2B) -> httpx.AsyncClient:
+        await b2b.async_regulationlist(None)
+        return b2b.async_client
+
+    with MockGateway() as gateway:
+        b2b = B2B(gateway.mode, "27.0.0", pkcs12_filename, "mock")
+        with b2b:
+            first = asyncio.run(main(b2b))
+            assert first.is_closed
+            assert asyncio.run(main(b2b)) is not first
+
+            loop = asyncio.new_event_loop()
+            client = loop.run_until_complete(main(b2b))
+            assert not client.is_closed
+        assert client.is_closed
+        loop.close()
+
+
+def test_single_flight(pkcs12_filename: Path) -> None:
+    async def main(b2b: B2B) -> list[RegulationList]:
+        async with b2b:
+            return await asyncio.gather(
+                *(b2b.async_regulationlist(None) for _ in range(5))
+            )
+
+    with MockGateway(latency=0.05) as gateway:
+        b2b = B2B(gateway.mode, "27.0.0", pkcs12_filename, "mock")
+        regulations = asyncio.run(main(b2b))
+        # replies are decoded in place: each caller has its own copy
+        assert len({id(r.json) for r in regulations}) == 5
+        assert all(r.data.equals(regulations[0].data) for r in regulations)
+        assert gateway.requests["RegulationListRequest"] == 1
+        assert b2b.single_flight is not None
+        assert b2b.single_flight.collapsed == 4
+
+
+def test_single_flight_cancelled() -> None:
+    errors: list[dict[str, object]] = []
+
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise ReplyError("overload", "RESOURCE_OVERLOAD")
+
+    async def main() -> None:
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _, context: errors.append(context))
+        caller = asyncio.ensure_future(SingleFlight().run("key", fail))
+        await asyncio.sleep(0)
+        caller.cancel()  # the shared call runs on, with no caller left
+        await asyncio.sleep(0.05)
+        gc.collect()
+
+    asyncio.run(main())
+    assert errors == []  # no "Task exception was never retrieved"
+
+
+def test_aixm_dataset(pkcs12_filename: Path, tmp_path: Path) -> None:
+    async def main(b2b: B2B, verify: bool = False) -> None:
+        async with b2b:
+            await b2b.async_aixm_request(
+                None, "2401", tmp_path, 1024, verify=verify
+            )
+
+    with MockGateway(aixm_features=100) as gateway:
+        b2b = B2B(gateway.mode, "27.0.0", pkcs12_filename, "mock")
+        asyncio.run(main(b2b))
+        assert len(gateway.files) > 0
+        paths = {
+            file_id: tmp_path / file_id.split("/")[-1]
+            for file_id in gateway.files
+        }
+        for file_id, content in gateway.files.items():
+            assert paths[file_id].read_bytes() == content
+        (manifest,) = tmp_path.glob("manifest_2401_*.json")
+        assert json.loads(manifest.read_text())["files"].keys() == paths.keys()
+        # no temporary file left behind
+        assert len(list(tmp_path.iterdir())) == len(gateway.files) + 1
+
+        # resume an interrupted download
+        file_id, content = next(iter(gateway.files.items()))
+        paths[file_id].unlink()
+        part = paths[file_id].with_name(paths[file_id].name + ".part")
+        part.write_bytes(content[: len(content) // 2])
+        asyncio.run(main(b2b))
+        assert gateway.requests["FileRange"] == 1
+        assert paths[file_id].read_bytes() == content
+        assert not part.exists()
+
+        # corrupted files are downloaded again
+        requests = gateway.requests["File"]
+        paths[file_id].write_bytes(bytes(len(content)))
+        asyncio.run(main(b2b))
+        assert gateway.requests["File"] == requests
+        asyncio.run(main(b2b, verify=True))
+        assert gateway.requests["File"] == requests + 1
+        assert paths[file_id].read_bytes() == content
+
+
+def test_aixm_timeout(pkcs12_filename: Path, tmp_path: Path) -> None:
+    async def main(b2b: B2B) -> None:
+        async with b2b:
+            await b2b.async_aixm_request(
+                None, "2401", tmp_path, timeout=httpx.Timeout(1, read=0.01)
+            )
+
+    with MockGateway(aixm_features=100, latency=0.05) as gateway:
+        retry = RetryPolicy(max_attempts=2, backoff=0)
+        b2b = B2B(gateway.mode, "27.0.0", pkcs12_filename, "mock", retry=retry)
+        with pytest.raises(httpx.ReadTimeout):
+            asyncio.run(main(b2b))
+        # each file is attempted twice, at most
+        assert gateway.requests["File"] <= 2 * len(gateway.files)
+        assert not any(tmp_path.glob("*.zip"))
+
+
+def test_aixm_update(pkcs12_filename: Path, tmp_path: Path) -> None:
+    async def main(b2b: B2B) -> list[Path]:
+        async with b2b:
+            return await b2b.async_aixm_request(None, 2401, tmp_path)
+
+    with MockGateway(aixm_features=100) as gateway:
+        b2b = B2B(gateway.mode, "27.0.0", pkcs12_filename, "mock")
+        assert len(asyncio.run(main(b2b))) == len(gateway.files)
+        assert asyncio.run(main(b2b)) == []
+
+        # a new update of the dataset, with one file changed
+        file_id = next(iter(gateway.files))
+        content = synthetic.aixm_file("AirportHeliport", "2401", 200)
+        gateway.publish(file_id, content)
+        requests = gateway.requests["File"]
+        (path,) = asyncio.run(main(b2b))
+        assert gateway.requests["File"] == requests + 1
+        assert path.read_bytes() == content
+
+        manifests = sorted(tmp_path.glob("manifest_2401_*.json"))
+        assert len(manifests) == 2
+        files = json.loads(manifests[-1].read_text())["files"]
+        assert files.keys() == gateway.files.keys()
@@ -0,0 +1,34 @@
+import xmltodict
+
+from pyb2b.parser import ReplyParser, parse_reply
+
+reply = b"""<?xml version="1.0" encoding="UTF-8"?>
+<fl:FlightListByAerodromeReply xmlns:fl="eurocontrol/cfmu/b2b/FlightServices">
+<requestId>B2B_CUR:1</requestId>
+<status>OK</status>
+<data>
+<effectiveTrafficWindow><wef>2024-06-01 10:00</wef></effectiveTrafficWindow>
+<flights><flight><flightId><id>AA00000001</id></flightId></flight></flights>
+<flights><flight><flightId><id>AA00000002</id></flightId></flight></flights>
+</data>
+</fl:FlightListByAerodromeReply>
+"""
+
+
+def test_parse_reply() -> None:
+    assert parse_reply(reply) == xmltodict.parse(reply)
+    chunks = [reply[i : i + 7] for i in range(0, len(reply), 7)]
+    assert parse_reply(chunks, ("data", "flights")) == xmltodict.parse(reply)
+
+
+def test_records() -> None:
+    parser = ReplyParser(("data", "flights"))
+    records = list(parser.feed(reply)) + list(parser.close())
+    assert parser.status == "OK"
+    assert [r["flight"]["flightId"]["id"] for r in records] == [
+        "AA00000001",
+        "AA00000002",
+    ]
+    assert parser.reply is not None
+    data = parser.reply["fl:FlightListByAerodromeReply"]["data"]
+    assert "flights" not in data
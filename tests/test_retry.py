@@ -0,0 +1,32 @@
+import httpx
+import pytest
+
+from pyb2b.exceptions import ReplyError
+from pyb2b.retry import RetryPolicy, TokenBucket
+
+
+def test_retry_policy() -> None:
+    policy = RetryPolicy(max_attempts=3, jitter=0)
+    overload = ReplyError("overload", "RESOURCE_OVERLOAD")
+    assert policy.delay(overload, 0) == 1
+    assert policy.delay(overload, 1) == 2
+    assert policy.delay(overload, 2) is None
+    assert policy.delay(ReplyError("", "OBJECT_NOT_FOUND"), 0) is None
+    assert policy.delay(ReplyError("", "REQUEST_COUNT_QUOTA_EXCEEDED"), 0) == 10
+
+    request = httpx.Request("POST", "https://localhost/")
+    response = httpx.Response(503, headers={"Retry-After": "7"})
+    error = httpx.HTTPStatusError("", request=request, response=response)
+    assert policy.delay(error, 0) == 7
+
+
+def test_token_bucket() -> None:
+    bucket = TokenBucket(rate=10, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 0.09 < bucket.reserve() <= 0.1
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=10, capacity=0)
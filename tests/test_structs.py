@@ -0,0 +1,64 @@
+from typing import Any
+
+import pytest
+
+from pyb2b.mock import synthetic
+from pyb2b.parser import parse_reply
+from pyb2b.services.flight.management import (
+    FlightListByAirspace,
+    FlightRetrieval,
+)
+from pyb2b.types.generated.flight import Flight, FlightListByAirspaceReply
+from pyb2b.types.structs import decode, struct_type
+
+
+def test_flight_retrieval() -> None:
+    flight = next(synthetic.flights(1))
+    json: Any = parse_reply(synthetic.flight_retrieval_reply(flight))
+    reply = FlightRetrieval(json["fl:FlightRetrievalReply"])
+    assert reply.flight is reply.flight
+    assert reply.flight.flightId.keys.aircraftId == reply.callsign
+    assert reply.flight.requestedFlightLevel.level == str(flight["level"])
+    assert reply.flight.cdm is None  # absent from the reply
+    assert reply.flight.to_dict() == reply.json["data"]["flight"]
+
+
+def test_flight_list() -> None:
+    root = "FlightListByAirspaceReply"
+    json: Any = parse_reply(
+        synthetic.flight_list_reply(10, root=root), ("data", "flights")
+    )[f"fl:{root}"]
+    flights = FlightListByAirspace(json, ["aircraftType"]).decode()
+    assert [f.aircraftType for f in flights] == json_types(json)
+    # only the requested fields are decoded
+    assert type(flights[0]) is struct_type(Flight, ["flightId", "aircraftType"])
+    assert flights[0].estimatedTakeOffTime is None
+    # strings are shared between records
+    origins = [f.flightId.keys.aerodromeOfDeparture for f in flights]
+    assert len({id(o) for o in origins}) == len(set(origins))
+
+
+def json_types(json: Any) -> list[str]:
+    return [f["flight"]["aircraftType"] for f in json["data"]["flights"]]
+
+
+def test_one_or_many() -> None:
+    reply = decode(
+        {"data": {"flights": {"flight": {"aircraftType": "A320"}}}},
+        FlightListByAirspaceReply,
+    )
+    # a single element is normalized to a list
+    assert reply.data.flights[0].flight.aircraftType == "A320"
+    assert (
+        reply.data.flights
+        == decode(
+            {"data": {"flights": [{"flight": {"aircraftType": "A320"}}]}},
+            FlightListByAirspaceReply,
+        ).data.flights
+    )
+
+
+def test_unhashable() -> None:
+    flight = decode({"aircraftType": "A320"}, Flight)
+    with pytest.raises(TypeError):
+        hash(flight)